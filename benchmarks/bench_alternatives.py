@@ -0,0 +1,104 @@
+"""Matching an installed-software list against the alternatives catalog as it grows.
+
+Pads the shipped catalog with synthetic programs up to 20k and times building the index,
+loading it from the on-disk cache and matching a 300-name installed list: shipped names
+with versions and architectures appended (exact hits), misspelled ones (trigram matches)
+and drivers and runtimes the catalog doesn't know. Matching should stay in milliseconds.
+
+    python benchmarks/bench_alternatives.py
+"""
+import json
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import benchutil
+from backend.softwareAlternatives.alternatives_index import (
+    ALTERNATIVES_PATH, _index_cache, load_alternatives_index,
+)
+
+SIZES = (0, 2_000, 20_000)
+QUICK_SIZES = (0, 2_000)
+INSTALLED = 300
+
+def synthetic_programs(count, rng):
+    words = ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))).title() for _ in range(4_000)]
+    return [{
+        "windows": " ".join(rng.sample(words, rng.randint(2, 4))),
+        "aliases": [" ".join(rng.sample(words, 2))],
+        "category": "Synthetic",
+        "alternatives": ["Kate"],
+    } for _ in range(count)]
+
+def installed_list(catalog, rng):
+    names = [program["windows"] for program in catalog["programs"][:300]]
+    suffixes = [" 2.4.1 (x64)", " (64-bit)", " - en-us", " 23.01", " Version 7.60", ""]
+    hits = [rng.choice(names) + rng.choice(suffixes) for _ in range(INSTALLED // 2)]
+    typos = []
+    for name in rng.sample(names, INSTALLED // 4):
+        position = rng.randrange(len(name))
+        typos.append(name[:position] + name[position + 1:])
+    misses = [f"Vendor {rng.choice(['Driver', 'Runtime', 'Redistributable', 'SDK'])} {rng.randrange(1000, 9999)}"
+              for _ in range(INSTALLED - len(hits) - len(typos))]
+    installed = hits + typos + misses
+    rng.shuffle(installed)
+    return installed
+
+def measure_catalogs(sizes):
+    rng = random.Random(0)
+    with open(ALTERNATIVES_PATH, "r", encoding="utf-8") as file:
+        shipped = json.load(file)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            catalog = dict(shipped, programs=shipped["programs"] + synthetic_programs(size, rng))
+            catalog_path = os.path.join(directory, f"alternatives_{size}.json")
+            cache_path = os.path.join(directory, f"alternatives_{size}.npz")
+            with open(catalog_path, "w", encoding="utf-8") as file:
+                json.dump(catalog, file)
+            installed = installed_list(catalog, rng)
+
+            start = time.perf_counter()
+            load_alternatives_index(catalog_path, cache_path)
+            build = time.perf_counter() - start
+
+            def load():
+                _index_cache.clear()
+                return load_alternatives_index(catalog_path, cache_path)
+
+            index = load()
+            results.append({
+                "synthetic": size,
+                "programs": len(index),
+                "build_s": build,
+                "load_s": benchutil.measure(load, repeat=3),
+                "match_s": benchutil.measure(lambda: index.match(installed)),
+                "matched": len(index.match(installed)),
+            })
+    return results
+
+def run(quick=False):
+    """Suite entry point for benchmarks/run.py."""
+    results = {}
+    for row in measure_catalogs(QUICK_SIZES if quick else SIZES):
+        results[f"alternatives.build[+{row['synthetic']}]"] = benchutil.seconds(row["build_s"])
+        results[f"alternatives.load[+{row['synthetic']}]"] = benchutil.seconds(row["load_s"])
+        results[f"alternatives.match{INSTALLED}[+{row['synthetic']}]"] = benchutil.seconds(row["match_s"])
+        results[f"alternatives.unmatched[+{row['synthetic']}]"] = benchutil.count(INSTALLED - row["matched"])
+    return results
+
+def main():
+    results = measure_catalogs(SIZES)
+    print(f"{'programs':>10} {'build (ms)':>12} {'load (ms)':>11} {f'match {INSTALLED} (ms)':>16} {'matched':>9}")
+    for row in results:
+        print(f"{row['programs']:>10} {row['build_s'] * 1e3:>12.1f} {row['load_s'] * 1e3:>11.2f} "
+              f"{row['match_s'] * 1e3:>16.2f} {row['matched']:>9}")
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
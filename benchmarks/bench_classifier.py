@@ -0,0 +1,42 @@
+"""Cost of HardwareClassifier.classify_hardware on the recorded hardware dumps.
+
+Each fixture in src/hardware_analysis/fixtures is copied to hardware_info.json in a
+scratch working directory, so the timing includes reading the dump like the app does.
+
+    python benchmarks/bench_classifier.py
+"""
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import benchutil
+from hardware_analysis.HardwareClassifier import HardwareClassifier
+from hardware_analysis.HardwareVector import compute_hardware_vector
+
+FIXTURES_DIR = os.path.join(benchutil.SRC_DIR, "hardware_analysis", "fixtures")
+
+def run(quick=False):
+    results = {}
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        try:
+            for fixture in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+                name = os.path.splitext(os.path.basename(fixture))[0]
+                shutil.copy(fixture, "hardware_info.json")
+                classifier = HardwareClassifier()
+                results[f"classifier.classify_hardware[{name}]"] = benchutil.seconds(
+                    benchutil.measure(classifier.classify_hardware)
+                )
+                hardware_data = dict(classifier.hardware_data)
+                results[f"classifier.compute_hardware_vector[{name}]"] = benchutil.seconds(
+                    benchutil.measure(lambda: compute_hardware_vector(hardware_data))
+                )
+        finally:
+            os.chdir(previous_cwd)
+    return results
+
+if __name__ == "__main__":
+    for name, metric in run("--quick" in sys.argv).items():
+        print(f"{name:<50} {benchutil.format_value(metric):>12}")
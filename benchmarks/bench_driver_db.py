@@ -0,0 +1,101 @@
+"""Looking PCI devices up in the driver database as it grows to pci.ids size.
+
+Pads the shipped rules with synthetic vendors and devices up to 50k (pci.ids lists about
+40k devices) and times compiling the binary table, opening it and looking up the
+recorded fixtures' devices and a batch of 1,000 random IDs, half of them listed.
+Opening and looking up should stay flat as the table grows.
+
+    python benchmarks/bench_driver_db.py
+"""
+import glob
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import benchutil
+from hardware_analysis.DriverDatabase import DRIVER_RULES_PATH, STATUSES, DriverDatabase, DriverRules, compile_rules
+
+SIZES = (0, 10_000, 50_000)
+QUICK_SIZES = (0, 10_000)
+BATCH = 1_000
+FIXTURES_DIR = os.path.join(benchutil.SRC_DIR, "hardware_analysis", "fixtures")
+
+def fixture_devices():
+    devices = []
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+        with open(path) as file:
+            devices.extend(json.load(file).get("PCI Devices", []))
+    return devices
+
+def padded_rules(size, rng):
+    with open(DRIVER_RULES_PATH, "r", encoding="utf-8") as file:
+        rules = DriverRules.parse(file)
+    vendors = rng.sample(range(0x2000, 0xffff), max(1, size // 25))
+    for vendor in vendors:
+        rules.vendors.setdefault(vendor, (f"Vendor {vendor:04x}", 0, "", ""))
+    while len(rules.devices) < size:
+        key = (rng.choice(vendors), rng.randrange(0x10000))
+        rules.devices.setdefault(key, (f"Device {key[1]:04x}", rng.randrange(len(STATUSES)), "driver", ""))
+    return rules
+
+def random_batch(rules, rng):
+    listed = rng.sample(list(rules.devices), min(BATCH // 2, len(rules.devices)))
+    unlisted = [(rng.randrange(0x10000), rng.randrange(0x10000)) for _ in range(BATCH - len(listed))]
+    return [{"Vendor ID": f"{vendor:04x}", "Device ID": f"{device:04x}", "Class": rng.choice(["0200", "0300", "0c03"])}
+            for vendor, device in listed + unlisted]
+
+def measure_databases(sizes):
+    rng = random.Random(0)
+    fixtures = fixture_devices()
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            rules = padded_rules(size, rng)
+            batch = random_batch(rules, rng)
+            path = os.path.join(directory, f"driver_support_{size}.bin")
+
+            start = time.perf_counter()
+            data = compile_rules(rules)
+            build = time.perf_counter() - start
+            with open(path, "wb") as file:
+                file.write(data)
+
+            database = DriverDatabase.open(path)
+            results.append({
+                "devices": len(rules.devices),
+                "bytes": len(data),
+                "build_s": build,
+                "open_s": benchutil.measure(lambda: DriverDatabase.open(path), repeat=5),
+                "fixtures_s": benchutil.measure(lambda: database.lookup(fixtures)),
+                "batch_s": benchutil.measure(lambda: database.lookup(batch)),
+                "unknown": sum(row["status"] == "unknown" for row in database.lookup(fixtures)),
+            })
+            del database
+    return results
+
+def run(quick=False):
+    """Suite entry point for benchmarks/run.py."""
+    results = {}
+    for row in measure_databases(QUICK_SIZES if quick else SIZES):
+        results[f"driver_db.build[{row['devices']}]"] = benchutil.seconds(row["build_s"])
+        results[f"driver_db.open[{row['devices']}]"] = benchutil.seconds(row["open_s"])
+        results[f"driver_db.lookup_fixtures[{row['devices']}]"] = benchutil.seconds(row["fixtures_s"])
+        results[f"driver_db.lookup{BATCH}[{row['devices']}]"] = benchutil.seconds(row["batch_s"])
+        results[f"driver_db.fixtures_unknown[{row['devices']}]"] = benchutil.count(row["unknown"])
+    return results
+
+def main():
+    results = measure_databases(SIZES)
+    print(f"{'devices':>8} {'size (kB)':>10} {'build (ms)':>11} {'open (ms)':>10} "
+          f"{'fixtures (ms)':>14} {f'{BATCH} IDs (ms)':>14} {'unknown':>8}")
+    for row in results:
+        print(f"{row['devices']:>8} {row['bytes'] / 1024:>10.0f} {row['build_s'] * 1e3:>11.1f} {row['open_s'] * 1e3:>10.3f} "
+              f"{row['fixtures_s'] * 1e3:>14.3f} {row['batch_s'] * 1e3:>14.2f} {row['unknown']:>8}")
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Lookup cost of the GPU tier table as it grows.
+
+Builds synthetic tables from a few hundred to 100k model strings and times uncached
+lookups of names that hit the exact table and names that fall through to the pattern
+fallback. Both columns should stay flat as the table grows.
+
+    python benchmarks/bench_gpu_tiers.py
+"""
+import json
+import random
+import sys
+import time
+import benchutil
+from hardware_analysis.GpuTiers import GPU_TIERS_PATH, GpuTierTable
+
+SIZES = (0, 1_000, 10_000, 100_000)
+QUICK_SIZES = (0, 10_000)
+LOOKUPS = 20_000
+
+def synthetic_families(count, rng):
+    models = [f"X{rng.randrange(10**6):06d} {rng.choice(['', 'Ti', 'SUPER', 'XT'])}".strip() for _ in range(count)]
+    return [{"vendor": "Synthetic", "prefix": "GPU", "tier": rng.randint(1, 3), "models": models}]
+
+def time_lookups(table, names):
+    start = time.perf_counter()
+    for name in names:
+        table._classify(name)
+    return (time.perf_counter() - start) / len(names) * 1e6
+
+def measure_tables(sizes):
+    rng = random.Random(0)
+    with open(GPU_TIERS_PATH, "r") as file:
+        data = json.load(file)
+
+    real_names = [f"{f['vendor']} {f['prefix']} {m}" for f in data["families"] for m in f["models"]]
+    hits = [rng.choice(real_names) for _ in range(LOOKUPS)]
+    misses = [f"Vendor {rng.choice(['RTX', 'GTX', 'RX', 'HD'])} {rng.randrange(100, 9999)} Prototype" for _ in range(LOOKUPS)]
+
+    results = []
+    for size in sizes:
+        table = GpuTierTable(data["families"] + synthetic_families(size, rng), data["patterns"])
+        results.append({
+            "synthetic": size,
+            "entries": len(table.tiers),
+            "exact_hit_us": time_lookups(table, hits),
+            "fallback_us": time_lookups(table, misses),
+        })
+    return results
+
+def run(quick=False):
+    """Suite entry point for benchmarks/run.py."""
+    results = {}
+    for row in measure_tables(QUICK_SIZES if quick else SIZES):
+        results[f"gpu_tiers.exact_hit[+{row['synthetic']}]"] = benchutil.seconds(row["exact_hit_us"] / 1e6)
+        results[f"gpu_tiers.fallback[+{row['synthetic']}]"] = benchutil.seconds(row["fallback_us"] / 1e6)
+    return results
+
+def main():
+    results = measure_tables(SIZES)
+    print(f"{'entries':>10} {'exact hit (us)':>16} {'fallback (us)':>15}")
+    for row in results:
+        print(f"{row['entries']:>10} {row['exact_hit_us']:>16.2f} {row['fallback_us']:>15.2f}")
+
+    if "--json" in sys.argv:
+        print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    main()
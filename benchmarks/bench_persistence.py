@@ -0,0 +1,66 @@
+"""Cost of answering questions in QuestionnaireModel, including the debounced save.
+
+Runs in a scratch working directory holding a copy of questionnaire.json, clicks through
+every option of every question as fast as possible and reports the per-click latency,
+how many times responses.json was written during the burst and after it settled, and
+how long flushing a single change takes.
+
+    python benchmarks/bench_persistence.py
+"""
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import benchutil
+from backend.questionnaire.questionnaire import QuestionnaireModel
+from backend.questionnaire.response_store import ResponseStore
+
+QUESTIONNAIRE_PATH = os.path.join(benchutil.SRC_DIR, "backend", "questionnaire", "questionnaire.json")
+DEBOUNCE = 0.05
+FLUSH_REPEAT = 9
+
+def run(quick=False):
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        os.makedirs(os.path.join(directory, "backend", "questionnaire"))
+        shutil.copy(QUESTIONNAIRE_PATH, os.path.join(directory, "backend", "questionnaire"))
+        os.chdir(directory)
+        try:
+            model = QuestionnaireModel(ResponseStore(), save_debounce=DEBOUNCE)
+            clicks = [
+                (index, option_id)
+                for index, question in enumerate(model.questions)
+                for option_id in question["options"]
+            ] * (20 if quick else 200)
+
+            start = time.perf_counter()
+            for index, option_id in clicks:
+                model.setResponse(index, option_id)
+            per_click = (time.perf_counter() - start) / len(clicks)
+            writes_during_burst = model._writer.write_count
+
+            time.sleep(DEBOUNCE * 4)
+            writes_after_settling = model._writer.write_count
+
+            flushes = []
+            for index, option_id in clicks[:FLUSH_REPEAT]:
+                model.setResponse(index, option_id)
+                start = time.perf_counter()
+                model.flush_responses()
+                flushes.append(time.perf_counter() - start)
+            model._writer.close()
+        finally:
+            os.chdir(previous_cwd)
+
+    return {
+        "persistence.set_response": benchutil.seconds(per_click),
+        "persistence.writes_during_burst": benchutil.count(writes_during_burst),
+        "persistence.writes_after_burst": benchutil.count(writes_after_settling),
+        "persistence.flush": benchutil.seconds(statistics.median(flushes), gate=False),
+    }
+
+if __name__ == "__main__":
+    for name, metric in run("--quick" in sys.argv).items():
+        print(f"{name:<50} {benchutil.format_value(metric):>12}")
@@ -0,0 +1,509 @@
+"""Per-page latency of the QML UI on a headless display.
+
+Loads src/qml/main.qml on the offscreen platform with the software scene graph, with
+in-memory stand-ins for the backend context properties (the software alternatives
+and driver support services are the real ones, fed a fixed list of installed programs
+and the recorded scan's devices), and walks the wizard: welcome, questionnaire
+(answering every question), hardware (replaying a recorded scan), driver support,
+software alternatives (rescanned once) and results (re-ranked a few times). For every
+page it records
+
+    ready       push until the first frame after the page and its images are loaded
+    frames      frames rendered while the page is driven and their render times
+    objects     QObjects and visual items in the page once it is ready
+    created     items created while the page is driven, e.g. delegates rebuilt on a change
+    destroyed   items destroyed while the page is driven
+    warnings    QML warnings, binding loops counted separately
+
+so a binding storm (many frames or binding loops for one change) or delegate churn
+(items recreated for a data change) shows up before anyone sees it on slow hardware.
+
+    python benchmarks/bench_qml_pages.py [--quick] [--report pages.json]
+
+The pages run in a child process so that the Qt environment is set before Qt loads.
+Like bench_startup it needs the Kirigami QML module and is skipped without it.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import benchutil
+
+PAGES_DIR = os.path.join(benchutil.SRC_DIR, "qml", "pages")
+FIXTURE_PATH = os.path.join(benchutil.SRC_DIR, "hardware_analysis", "fixtures", "legacy_desktop.json")
+HARDWARE_VECTOR = [2, 1, 0, 1, 1]
+INSTALLED_PROGRAMS = [
+    "7-Zip 23.01 (x64)", "Adobe Acrobat Reader DC - English", "Adobe Photoshop 2024", "Audacity 3.4.2",
+    "Discord", "Google Chrome", "Microsoft 365 Apps for enterprise - en-us", "Microsoft Edge",
+    "Microsoft OneDrive", "Microsoft Teams classic", "Microsoft Visual C++ 2015-2022 Redistributable (x64)",
+    "Microsoft Visual Studio Code (User)", "Mozilla Firefox (x64 en-US)", "Notepad++ (64-bit x64)",
+    "NVIDIA Graphics Driver 537.13", "OBS Studio", "Spotify", "Steam", "VLC media player", "WinRAR 6.24 (64-bit)",
+    "Zoom Workplace (64-bit)",
+]
+# Seconds without a new frame after which a page counts as settled.
+QUIET_PERIOD = 0.2
+SETTLE_TIMEOUT = 10.0
+# How Qt reports a missing Kirigami; the only child failure that counts as a skip.
+KIRIGAMI_MISSING = 'module "org.kde.kirigami" is not installed'
+
+def environment():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", QT_QUICK_BACKEND="software", QSG_RENDER_LOOP="basic")
+    env.setdefault("QT_QUICK_CONTROLS_STYLE", "org.kde.desktop")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [benchutil.SRC_DIR, env.get("PYTHONPATH")]))
+    return env
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+def measure_pages():
+    """Runs the walk in this process; Qt must not have been initialised yet."""
+    from PySide6.QtCore import (
+        QEventLoop, QObject, Property, QTimer, QUrl, QtMsgType, Qt, Signal, Slot, qInstallMessageHandler,
+    )
+    from PySide6.QtQml import QQmlApplicationEngine, QQmlEngine, QQmlExpression
+    from PySide6.QtQuick import QQuickItem
+    from PySide6.QtWidgets import QApplication
+    from backend.imageProvider.image_provider import AssetImageProvider
+    from backend.profiling.trace_stats import TraceStats
+    from backend.questionnaire.question_list_model import QuestionListModel, options_of
+    from backend.recomendationModel.rankings_model import RankingsModel
+    from backend.recomendationModel.what_if_model import WhatIfModel
+    from backend.softwareAlternatives.software_alternatives import SoftwareAlternatives
+    from hardware_analysis.DriverSupport import DriverSupport
+    from hardware_analysis.ProbeBackend import SECTION_KEYS
+
+    class FakeQuestionnaire(QObject):
+        """QuestionnaireModel's QML surface over questionnaire.json, without saving answers."""
+        questionsChanged = Signal()
+        currentIndexChanged = Signal()
+        responsesChanged = Signal()
+        currentQuestionChanged = Signal()
+        currentOptionsChanged = Signal()
+        currentAnswerChanged = Signal()
+
+        def __init__(self, questions):
+            super().__init__()
+            self._questions = questions
+            self._responses = {}
+            self._index = 0
+            self._model = QuestionListModel(self)
+            self._model.set_questions(questions)
+
+        @Property(list, notify=questionsChanged)
+        def questions(self):
+            return self._questions
+
+        @Property(QObject, constant=True)
+        def questionModel(self):
+            return self._model
+
+        @Property(int, notify=questionsChanged)
+        def questionCount(self):
+            return len(self._questions)
+
+        @Property(int, notify=currentIndexChanged)
+        def currentIndex(self):
+            return self._index
+
+        @Property(dict, notify=currentQuestionChanged)
+        def currentQuestion(self):
+            return self._questions[self._index] if self._questions else {}
+
+        @Property(list, notify=currentOptionsChanged)
+        def currentOptions(self):
+            return options_of(self.currentQuestion)
+
+        @Property(str, notify=currentAnswerChanged)
+        def currentAnswer(self):
+            return self._responses.get(str(self.currentQuestion.get("id")), "")
+
+        @Property(dict, notify=responsesChanged)
+        def responses(self):
+            return dict(self._responses)
+
+        @Slot(int, str)
+        def setResponse(self, index, option_id):
+            question_id = str(self._questions[index]["id"])
+            self._responses[question_id] = option_id
+            self._model.set_answer(question_id, option_id)
+            self.responsesChanged.emit()
+            self.currentAnswerChanged.emit()
+
+        @Slot(int)
+        def setCurrentIndex(self, index):
+            if index == self._index or not 0 <= index < len(self._questions):
+                return
+            self._index = index
+            self._model.set_current_row(index)
+            self.currentIndexChanged.emit()
+            self.currentQuestionChanged.emit()
+            self.currentOptionsChanged.emit()
+            self.currentAnswerChanged.emit()
+
+        @Slot()
+        def flush_responses(self):
+            pass
+
+    class FakeRecommender(QObject):
+        """Recommender's QML surface; each call ranks the catalog in a different order and
+        every other option of every question puts the next distro first."""
+        rankingsChanged = Signal(list)
+        rankingChanged = Signal(int, str, float)
+        whatIfChanged = Signal()
+
+        def __init__(self, distributions, top_k=10):
+            super().__init__()
+            self._names = list(distributions)
+            self._top_k = top_k
+            self._calls = 0
+            self._rankings = []
+            self._model = RankingsModel(self)
+            self._model.set_metadata({name: info.get("metadata", {}) for name, info in distributions.items()})
+            self._what_if = WhatIfModel(self)
+
+        @Slot()
+        @Slot(list)
+        def calculate_rankings(self, hardware_vector=None):
+            shift = self._calls % max(1, len(self._names))
+            self._calls += 1
+            names = self._names[shift:] + self._names[:shift]
+            self._rankings = [{"distro": name, "score": float(len(names) - rank) * 10}
+                              for rank, name in enumerate(names[:self._top_k])]
+            self._model.set_rankings(self._rankings)
+            self.rankingsChanged.emit(self._rankings)
+            self._what_if.set_alternatives([
+                {"question_id": str(question), "option_id": str(option), "current_option_id": "1",
+                 "question_text": f"Question {question}", "option_text": f"Option {option}",
+                 "rankings": self._rankings[option - 1:option], "flips_top": True}
+                for question in range(2, 7) for option in (2, 3)
+            ])
+            self.whatIfChanged.emit()
+
+        @Property(QObject, constant=True)
+        def rankingsModel(self):
+            return self._model
+
+        @Property(QObject, constant=True)
+        def whatIfModel(self):
+            return self._what_if
+
+        @Property(int, notify=whatIfChanged)
+        def flipCount(self):
+            return self._what_if.rowCount()
+
+        @Slot(result="QVariantList")
+        def get_rankings(self):
+            return self._rankings
+
+    class FakeHardwareInfo(QObject):
+        """HardwareInfo's QML surface; a scan replays the recorded fixture section by section."""
+        dataUpdated = Signal(str)
+        sectionCollected = Signal(str, str)
+        sectionFailed = Signal(str, str)
+        collectionFinished = Signal(bool)
+        collectingChanged = Signal()
+
+        def __init__(self, recorded):
+            super().__init__()
+            self._recorded = recorded
+
+        @Property(bool, notify=collectingChanged)
+        def collecting(self):
+            return False
+
+        @Slot(result=None)
+        def collect_hardware_info(self):
+            for section, keys in SECTION_KEYS.items():
+                details = {key: self._recorded[key] for key in keys if key in self._recorded}
+                self.sectionCollected.emit(section, json.dumps(details, indent=4, sort_keys=True))
+            self.collectionFinished.emit(True)
+            self.dataUpdated.emit(self.get_json_data())
+
+        @Slot()
+        def refresh_hardware_info(self):
+            self.collect_hardware_info()
+
+        @Slot()
+        def cancel_collection(self):
+            pass
+
+        @Slot(result=str)
+        def get_json_data(self):
+            return json.dumps(self._recorded, indent=4)
+
+    class FakeHardwareClassifier(QObject):
+        hardwareClassified = Signal(list)
+
+        @Slot()
+        def classify_hardware(self):
+            self.hardwareClassified.emit(list(HARDWARE_VECTOR))
+
+    class PageProbe:
+        """Times frames of `window` and finds the items of the current page."""
+
+        def __init__(self, engine, window):
+            self.engine = engine
+            self.window = window
+            self.frames = []
+            self.last_frame_at = 0.0
+            self._frame_began = None
+            window.beforeSynchronizing.connect(self._on_begin, Qt.DirectConnection)
+            window.frameSwapped.connect(self._on_swapped, Qt.DirectConnection)
+
+        def _on_begin(self):
+            self._frame_began = time.perf_counter()
+
+        def _on_swapped(self):
+            now = time.perf_counter()
+            if self._frame_began is not None:
+                self.frames.append(now - self._frame_began)
+            self._frame_began = None
+            self.last_frame_at = now
+
+        def evaluate(self, script):
+            expression = QQmlExpression(self.engine.rootContext(), self.window, script)
+            value, failed = expression.evaluate()
+            if failed:
+                raise RuntimeError(f"{script}: {expression.error().toString()}")
+            return value
+
+        def wait(self, milliseconds):
+            loop = QEventLoop()
+            QTimer.singleShot(milliseconds, loop.quit)
+            loop.exec()
+
+        def items(self, root):
+            items, pending = [], [root]
+            while pending:
+                item = pending.pop()
+                items.append(item)
+                pending.extend(item.childItems())
+            return items
+
+        def loading(self, page):
+            # Image.status has no Python converter, so it's compared on the QML side.
+            for item in self.items(page):
+                if item.metaObject().className().startswith("QQuickImage"):
+                    context = QQmlEngine.contextForObject(item) or self.engine.rootContext()
+                    if QQmlExpression(context, item, "status === Image.Loading").evaluate()[0]:
+                        return True
+            return False
+
+        def settle(self, page=None):
+            """Processes events until no frame has been drawn for QUIET_PERIOD and nothing loads."""
+            deadline = time.perf_counter() + SETTLE_TIMEOUT
+            self.window.update()
+            while time.perf_counter() < deadline:
+                self.wait(5)
+                quiet = time.perf_counter() - self.last_frame_at > QUIET_PERIOD
+                if quiet and (page is None or not self.loading(page)):
+                    return
+
+    def walk():
+        with open(os.path.join(benchutil.SRC_DIR, "backend", "questionnaire", "questionnaire.json")) as file:
+            questions = json.load(file)["questions"]
+        with open(os.path.join(benchutil.SRC_DIR, "backend", "distro.json")) as file:
+            distributions = json.load(file)["distributions"]
+        with open(FIXTURE_PATH) as file:
+            recorded = json.load(file)
+
+        app = QApplication(sys.argv[:1])
+        messages = []
+        qInstallMessageHandler(lambda kind, context, text: messages.append(text)
+                               if kind in (QtMsgType.QtWarningMsg, QtMsgType.QtCriticalMsg) else None)
+
+        engine = QQmlApplicationEngine()
+        engine.addImportPath(os.path.join(benchutil.SRC_DIR, "qml"))
+        backends = {
+            "questionnaireModel": FakeQuestionnaire(questions),
+            "recommenderModel": FakeRecommender(distributions),
+            "hardwareInfo": FakeHardwareInfo(recorded),
+            "hardwareClassifier": FakeHardwareClassifier(),
+            "traceStats": TraceStats(),
+            "softwareAlternatives": SoftwareAlternatives(program_source=lambda: list(INSTALLED_PROGRAMS)),
+            "driverSupport": DriverSupport(hardware_source=lambda: recorded),
+        }
+        # The app loads the catalog and the driver database while idle after startup,
+        # long before these pages.
+        backends["softwareAlternatives"].warm_up()
+        backends["driverSupport"].warm_up()
+        for name, backend in backends.items():
+            engine.rootContext().setContextProperty(name, backend)
+        engine.addImageProvider("assets", AssetImageProvider())
+        engine.load(QUrl.fromLocalFile(os.path.join(benchutil.SRC_DIR, "qml", "main.qml")))
+        if not engine.rootObjects():
+            raise RuntimeError("main.qml didn't load:\n" + "\n".join(messages[-10:]))
+
+        probe = PageProbe(engine, engine.rootObjects()[0])
+        probe.settle()
+        questionnaire, recommender = backends["questionnaireModel"], backends["recommenderModel"]
+
+        def answer_everything():
+            for index, question in enumerate(questions):
+                options = options_of(question)
+                option_id = options[0]["optionId"] if options else ""
+                yield lambda index=index, option_id=option_id: questionnaire.setResponse(index, option_id)
+                yield lambda index=index: questionnaire.setCurrentIndex(index + 1)
+
+        def rerank():
+            for _ in range(3):
+                yield recommender.calculate_rankings
+
+        steps = [
+            ("welcome", "welcomePage.qml", {}, lambda: []),
+            ("questionnaire", "questionnaire.qml", {}, answer_everything),
+            ("hardware", "HardwareInfo.qml", {}, lambda: [backends["hardwareInfo"].collect_hardware_info]),
+            ("driver_support", "driverSupport.qml", {}, lambda: []),
+            ("software_alternatives", "SoftwareAlternatives.qml", {},
+             lambda: [backends["softwareAlternatives"].scan_installed_programs]),
+            ("results", "resultPage.qml", {"hardwareVector": HARDWARE_VECTOR}, rerank),
+        ]
+        report = []
+        for name, file_name, properties, actions in steps:
+            url = QUrl.fromLocalFile(os.path.join(PAGES_DIR, file_name)).toString()
+            del messages[:]
+            probe.settle()
+
+            pushed = time.perf_counter()
+            probe.evaluate(f"pageStack.clear(); pageStack.push({json.dumps(url)}, {json.dumps(properties)})")
+            page = probe.evaluate("pageStack.currentItem")
+            if not isinstance(page, QQuickItem):
+                raise RuntimeError(f"{file_name} didn't load:\n" + "\n".join(messages[-10:]))
+            probe.settle(page)
+            while probe.loading(page) and time.perf_counter() - pushed < SETTLE_TIMEOUT:
+                probe.wait(5)
+            ready = max(probe.last_frame_at, pushed) - pushed
+            items = probe.items(page)
+            objects = len(page.findChildren(QObject))
+
+            del probe.frames[:]
+            created = destroyed = 0
+            for action in actions():
+                before = probe.items(page)
+                for item in before:
+                    item.setProperty("_benchSeen", True)
+                action()
+                probe.settle(page)
+                after = probe.items(page)
+                new = sum(1 for item in after if not item.property("_benchSeen"))
+                created += new
+                destroyed += len(before) - (len(after) - new)
+
+            report.append({
+                "page": name,
+                "ready": ready,
+                "frames": len(probe.frames),
+                "frame_p50": percentile(probe.frames, 0.5),
+                "frame_p95": percentile(probe.frames, 0.95),
+                "frame_max": max(probe.frames, default=0.0),
+                "objects": objects,
+                "items": len(items),
+                "created": created,
+                "destroyed": destroyed,
+                "warnings": len(messages),
+                "binding_loops": sum("binding loop" in message.lower() for message in messages),
+                "messages": sorted(set(messages))[:20],
+            })
+        return report
+
+    return walk()
+
+def run_child(timeout=300):
+    """One walk in a fresh interpreter; its report, or None if Kirigami isn't installed.
+
+    Any other failure of the walk raises, so a broken page can't pass as a skip.
+    """
+    try:
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child"], cwd=benchutil.SRC_DIR, env=environment(),
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"bench_qml_pages: the page walk timed out after {timeout}s")
+    if completed.returncode != 0:
+        if KIRIGAMI_MISSING in completed.stderr:
+            print("bench_qml_pages: skipping, the Kirigami QML module isn't installed", file=sys.stderr)
+            return None
+        raise RuntimeError("bench_qml_pages: the page walk failed:\n" + completed.stderr.strip()[-2000:])
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def walk_reports(walks):
+    """Reports of up to `walks` walks, stopping at the first one that is skipped."""
+    reports = []
+    for _ in range(walks):
+        report = run_child()
+        if report is None:
+            break
+        reports.append(report)
+    return reports
+
+def median_report(reports):
+    """Per page, the median of every numeric field over `reports`."""
+    merged = []
+    for pages in zip(*reports):
+        row = dict(pages[0])
+        for key, value in pages[0].items():
+            if isinstance(value, (int, float)):
+                row[key] = sorted(page[key] for page in pages)[len(pages) // 2]
+        merged.append(row)
+    return merged
+
+def run(quick=False, report_path=None):
+    reports = walk_reports(1 if quick else 3)
+    if not reports:
+        return {}
+    pages = median_report(reports)
+    if report_path:
+        with open(report_path, "w") as file:
+            json.dump({"pages": pages}, file, indent=2)
+
+    results = {}
+    for page in pages:
+        prefix = f"qml.{page['page']}"
+        results[f"{prefix}.ready"] = benchutil.seconds(page["ready"])
+        results[f"{prefix}.frame_p95"] = benchutil.seconds(page["frame_p95"], gate=False)
+        results[f"{prefix}.frames"] = benchutil.count(page["frames"])
+        results[f"{prefix}.items"] = benchutil.count(page["items"])
+        results[f"{prefix}.churn"] = benchutil.count(page["created"] + page["destroyed"])
+        results[f"{prefix}.binding_loops"] = benchutil.count(page["binding_loops"])
+    return results
+
+def print_report(pages, file=sys.stdout):
+    print(f"{'page':<22} {'ready':>9} {'frames':>6} {'p50':>8} {'p95':>8} {'max':>8} "
+          f"{'objects':>7} {'items':>6} {'created':>7} {'destroyed':>9} {'warnings':>8}", file=file)
+    for page in pages:
+        print(f"{page['page']:<22} {page['ready'] * 1000:7.1f}ms {page['frames']:>6} "
+              f"{page['frame_p50'] * 1000:6.2f}ms {page['frame_p95'] * 1000:6.2f}ms {page['frame_max'] * 1000:6.2f}ms "
+              f"{page['objects']:>7} {page['items']:>6} {page['created']:>7} {page['destroyed']:>9} "
+              f"{page['warnings']:>8}", file=file)
+        for message in page["messages"]:
+            print(f"    {message}", file=file)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time every wizard page on a headless display.")
+    parser.add_argument("--quick", action="store_true", help="one walk instead of the median of three")
+    parser.add_argument("--report", help="write the per-page report as JSON to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure_pages()))
+        sys.stdout.flush()
+        # Skip interpreter teardown, which can crash with live Qt objects.
+        os._exit(0)
+
+    reports = walk_reports(1 if args.quick else 3)
+    if not reports:
+        return 1
+    pages = median_report(reports)
+    print_report(pages)
+    if args.report:
+        with open(args.report, "w") as file:
+            json.dump({"pages": pages}, file, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
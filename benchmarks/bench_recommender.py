@@ -0,0 +1,114 @@
+"""Scoring cost of the recommender against synthetic catalogs.
+
+Generates distro.json catalogs from 10 to 100k distros with the real marking.json and
+times compiling the scoring model, Recommender.recommend and calculate_rankings with and
+without a hardware vector and the results page's what-if answers, plus opening the same catalog in its compiled columnar form and
+the pruned single-user top-k over it. The precomputed ranking table is built and queried
+for the real catalog.
+
+    python benchmarks/bench_recommender.py
+"""
+import functools
+import json
+import os
+import random
+import sys
+import tempfile
+import benchutil
+import numpy as np
+from backend.recomendationModel.catalog import ColumnarCatalog, compile_catalog
+from backend.recomendationModel.ranking_table import build_ranking_table
+from backend.questionnaire.response_store import ResponseStore
+from backend.recomendationModel.recommender import Recommender
+from backend.recomendationModel.scoring_model import DISTRO_PATH, MARKING_PATH, ScoringModel, load_scoring_model
+
+SIZES = (10, 100, 1_000, 10_000, 100_000)
+QUICK_SIZES = (10, 1_000, 10_000)
+HARDWARE_VECTOR = [4, 2, 1, 3, 2]
+
+def synthetic_catalog(size, rng):
+    """A distro.json with `size` distros shaped like the real one."""
+    with open(DISTRO_PATH, "r") as file:
+        real = json.load(file)
+    template = next(iter(real["distributions"].values()))
+    distributions = {}
+    for index in range(size):
+        scores = {name: (rng.randint(0, 1) if name in ("updates", "UI_Look") else rng.randint(1, 5))
+                  for name in template["scores"]}
+        hardware_scores = {name: (rng.randint(0, 1) if name == "Recommended Storage Type" else rng.randint(1, 5))
+                           for name in template["hardware_scores"]}
+        distributions[f"Distro_{index:06d}"] = {
+            "scores": scores,
+            "hardware_scores": hardware_scores,
+            "metadata": {"description": "", "website": "", "screenshot": ""},
+        }
+    return {"metadata": real.get("metadata", {}), "distributions": distributions}
+
+def sample_responses(rng):
+    with open(MARKING_PATH, "r") as file:
+        questions = json.load(file)["user_vector"]["questions"]
+    return {str(q["question_id"]): rng.choice(list(q["option_id_to_score"])) for q in questions}
+
+def run(quick=False):
+    rng = random.Random(0)
+    responses = sample_responses(rng)
+    with open(MARKING_PATH, "r") as file:
+        marking = json.load(file)
+
+    results = {}
+    model = load_scoring_model(DISTRO_PATH)
+    results["ranking_table.build"] = benchutil.seconds(
+        benchutil.measure(lambda: build_ranking_table(model, None, None), repeat=3)
+    )
+    table = build_ranking_table(model, None, None)
+    results["ranking_table.lookup"] = benchutil.seconds(
+        benchutil.measure(lambda: table.lookup(responses, HARDWARE_VECTOR))
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in QUICK_SIZES if quick else SIZES:
+            catalog = synthetic_catalog(size, rng)
+            distro_path = os.path.join(directory, f"distro_{size}.json")
+            with open(distro_path, "w") as file:
+                json.dump(catalog, file)
+
+            loader = functools.partial(
+                load_scoring_model, distro_path, MARKING_PATH, os.path.join(directory, f"snapshot_{size}.pickle")
+            )
+            recommender = Recommender(ResponseStore(responses), model_loader=loader)
+            recommender.model
+
+            results[f"recommender.compile[{size}]"] = benchutil.seconds(
+                benchutil.measure(lambda: ScoringModel(catalog, marking), repeat=3)
+            )
+            results[f"recommender.recommend[{size}]"] = benchutil.seconds(
+                benchutil.measure(recommender.recommend)
+            )
+            results[f"recommender.recommend_hardware[{size}]"] = benchutil.seconds(
+                benchutil.measure(lambda: recommender.recommend(hardware_vector=HARDWARE_VECTOR))
+            )
+            results[f"recommender.calculate_rankings[{size}]"] = benchutil.seconds(
+                benchutil.measure(recommender.calculate_rankings)
+            )
+            results[f"recommender.calculate_rankings_hardware[{size}]"] = benchutil.seconds(
+                benchutil.measure(lambda: recommender.calculate_rankings(HARDWARE_VECTOR))
+            )
+            results[f"recommender.what_if[{size}]"] = benchutil.seconds(
+                benchutil.measure(recommender.publish_what_if)
+            )
+
+            catalog_dir = os.path.join(directory, f"catalog_{size}")
+            compile_catalog(catalog, catalog_dir)
+            results[f"catalog.open[{size}]"] = benchutil.seconds(
+                benchutil.measure(lambda: ColumnarCatalog(catalog_dir))
+            )
+            columnar = ScoringModel.from_catalog(ColumnarCatalog(catalog_dir), marking)
+            user = np.asarray(columnar.user_vector(responses), dtype=float)
+            results[f"catalog.best[{size}]"] = benchutil.seconds(
+                benchutil.measure(lambda: columnar.best(user, HARDWARE_VECTOR, k=recommender.top_k))
+            )
+    return results
+
+if __name__ == "__main__":
+    for name, metric in run("--quick" in sys.argv).items():
+        print(f"{name:<50} {benchutil.format_value(metric):>12}")
@@ -0,0 +1,93 @@
+"""Application startup cost on a headless display (QT_QPA_PLATFORM=offscreen).
+
+Times constructing every backend and registering it with a QML engine in a fresh
+interpreter, then launches src/main.py with --startup-profile --exit-after-startup and
+reads its time to first frame. The full launch needs the Kirigami QML module; without
+it only the construction numbers are reported.
+
+    python benchmarks/bench_startup.py
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+import benchutil
+
+CONSTRUCT_SCRIPT = r"""
+import json, sys, time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from PySide6.QtQml import QQmlApplicationEngine
+app = QApplication(sys.argv[:1])
+imported = time.perf_counter()
+from backend.questionnaire.questionnaire import QuestionnaireModel
+from backend.questionnaire.response_store import ResponseStore
+from backend.recomendationModel.recommender import Recommender
+from hardware_analysis.HardwareInfo import HardwareInfo
+from hardware_analysis.HardwareClassifier import HardwareClassifier
+backends_imported = time.perf_counter()
+engine = QQmlApplicationEngine()
+store = ResponseStore()
+objects = {
+    "questionnaireModel": QuestionnaireModel(store),
+    "recommenderModel": Recommender(store),
+    "hardwareInfo": HardwareInfo(),
+    "hardwareClassifier": HardwareClassifier(),
+}
+for name, obj in objects.items():
+    engine.rootContext().setContextProperty(name, obj)
+constructed = time.perf_counter()
+objects["recommenderModel"].model
+warmed = time.perf_counter()
+print(json.dumps({
+    "qt": imported - start,
+    "import_backends": backends_imported - imported,
+    "construct": constructed - backends_imported,
+    "load_model": warmed - constructed,
+}))
+"""
+
+def environment():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", QT_QUICK_BACKEND="software")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [benchutil.SRC_DIR, env.get("PYTHONPATH")]))
+    return env
+
+def construct_once():
+    output = subprocess.run(
+        [sys.executable, "-c", CONSTRUCT_SCRIPT], cwd=benchutil.SRC_DIR, env=environment(),
+        capture_output=True, text=True, check=True, timeout=120,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def launch_once():
+    """Milliseconds to the first frame of the real app, or None if it can't start here."""
+    try:
+        completed = subprocess.run(
+            [sys.executable, "main.py", "--startup-profile", "--exit-after-startup"], cwd=benchutil.SRC_DIR,
+            env=environment(), capture_output=True, text=True, timeout=60,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    match = re.search(r"^\s*([\d.]+)\s+[\d.]+\s+\S+\s+first frame$", completed.stderr, re.MULTILINE)
+    return float(match.group(1)) / 1000 if completed.returncode == 0 and match else None
+
+def run(quick=False):
+    repeat = 3 if quick else 7
+    runs = [construct_once() for _ in range(repeat)]
+    results = {
+        f"startup.{step}": benchutil.seconds(sorted(run[step] for run in runs)[repeat // 2])
+        for step in runs[0]
+    }
+
+    launches = [launch_once() for _ in range(repeat)]
+    if all(launch is not None for launch in launches):
+        results["startup.first_frame"] = benchutil.seconds(sorted(launches)[repeat // 2])
+    else:
+        print("bench_startup: skipping the first-frame timing, src/main.py couldn't start "
+              "(is the Kirigami QML module installed?)", file=sys.stderr)
+    return results
+
+if __name__ == "__main__":
+    for name, metric in run("--quick" in sys.argv).items():
+        print(f"{name:<50} {benchutil.format_value(metric):>12}")
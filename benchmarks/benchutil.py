@@ -0,0 +1,46 @@
+"""Helpers shared by the benchmark scripts."""
+import os
+import sys
+import timeit
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.normpath(os.path.join(BENCHMARKS_DIR, "..", "src"))
+
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+def measure(function, repeat=5, min_time=0.05):
+    """Best seconds per call of `function` over `repeat` runs of at least `min_time` each.
+
+    The minimum is the least noisy estimate on a busy machine; slower runs measure other load.
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed * 10 >= min_time else 10
+    runs = [elapsed / number] + [timer.timeit(number) / number for _ in range(repeat - 1)]
+    return min(runs)
+
+def seconds(value, gate=True):
+    """A timing; `gate=False` reports it without failing the baseline comparison, for
+    measurements dominated by the machine's state, such as fsync latency."""
+    metric = {"value": value, "unit": "s"}
+    if not gate:
+        metric["gate"] = False
+    return metric
+
+def count(value):
+    return {"value": value, "unit": "count"}
+
+def format_value(metric):
+    if metric["unit"] == "s":
+        value = metric["value"]
+        if value < 1e-3:
+            return f"{value * 1e6:.1f} us"
+        if value < 1:
+            return f"{value * 1e3:.2f} ms"
+        return f"{value:.2f} s"
+    return f"{metric['value']:g}"
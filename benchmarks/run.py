@@ -0,0 +1,107 @@
+"""Runs every benchmark suite and checks the results against a stored baseline.
+
+    python benchmarks/run.py                       # run, print, compare with baseline.json
+    python benchmarks/run.py --quick -o out.json   # smaller inputs, save the results
+    python benchmarks/run.py --save-baseline       # record a new baseline.json
+
+Results are JSON: {"meta": {...}, "results": {name: {"value": ..., "unit": "s" | "count"}}}.
+For every metric lower is better. A metric regresses when it exceeds its baseline value
+by more than --threshold (relative) and, for timings, by more than --min-delta seconds;
+the exit status is then 1. Baselines are machine-specific, so record one on the machine
+that runs the comparison.
+"""
+import argparse
+import importlib
+import json
+import os
+import platform
+import sys
+import time
+import benchutil
+
+SUITES = ("bench_recommender", "bench_classifier", "bench_persistence", "bench_startup", "bench_gpu_tiers",
+          "bench_alternatives", "bench_driver_db", "bench_qml_pages")
+BASELINE_PATH = os.path.join(benchutil.BENCHMARKS_DIR, "baseline.json")
+
+def run_suites(names, quick):
+    results = {}
+    for name in names:
+        start = time.perf_counter()
+        suite = importlib.import_module(name)
+        results.update(suite.run(quick))
+        print(f"{name}: done in {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return results
+
+def compare(results, baseline, threshold, min_delta=0.0):
+    """Rows of (name, baseline, current, relative change, regressed) for metrics in both."""
+    rows = []
+    for name, metric in results.items():
+        reference = baseline.get(name)
+        if reference is None or reference["unit"] != metric["unit"]:
+            continue
+        if reference["value"] == 0:
+            change = 0.0 if metric["value"] == 0 else float("inf")
+        else:
+            change = metric["value"] / reference["value"] - 1
+        significant = metric["unit"] != "s" or metric["value"] - reference["value"] > min_delta
+        significant = significant and metric.get("gate", True)
+        rows.append((name, reference, metric, change, change > threshold and significant))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suites and compare against a baseline.")
+    parser.add_argument("--suite", action="append", choices=SUITES, help="run only this suite (repeatable)")
+    parser.add_argument("--quick", action="store_true", help="smaller inputs and fewer repeats")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.5, help="allowed relative slowdown, 0.5 = 50%%")
+    parser.add_argument("--min-delta", type=float, default=1e-4,
+                        help="ignore timing slowdowns smaller than this many seconds")
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args(argv)
+
+    results = run_suites(args.suite or SUITES, args.quick)
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    for name, metric in results.items():
+        print(f"{name:<50} {benchutil.format_value(metric):>12}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+
+    try:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)["results"]
+    except (OSError, json.JSONDecodeError, KeyError):
+        print(f"No usable baseline at {args.baseline}, nothing to compare.", file=sys.stderr)
+        return 0
+
+    rows = compare(results, baseline, args.threshold, args.min_delta)
+    regressions = [row for row in rows if row[4]]
+    print(f"\nCompared {len(rows)} metrics against {args.baseline} (threshold {args.threshold:.0%}):")
+    for name, reference, metric, change, regressed in rows:
+        if regressed or abs(change) > args.threshold:
+            status = "REGRESSION" if regressed else "improved" if change < 0 else "noise"
+            print(f"  {status:<10} {name:<50} {benchutil.format_value(reference):>12} -> "
+                  f"{benchutil.format_value(metric):>12} ({change:+.0%})")
+    if not regressions:
+        print("  no regressions")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
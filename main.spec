@@ -100,8 +100,17 @@ json_files = [
     ('src/backend/questionnaire/responses.json', 'backend/questionnaire'),
     ('src/backend/distro.json', 'backend'),
     ('src/backend/recomendationModel/marking.json', 'backend/recomendationModel'),
+    ('src/hardware_analysis/gpu_tiers.json', 'hardware_analysis'),
+    ('src/hardware_analysis/driver_support.ids', 'hardware_analysis'),
+    ('src/hardware_analysis/driver_support.bin', 'hardware_analysis'),
+    ('src/backend/softwareAlternatives/alternatives.json', 'backend/softwareAlternatives'),
 ]
 
+# Built by `python -m backend.recomendationModel.ranking_table`; without it rankings are scored live.
+ranking_table = 'src/backend/recomendationModel/ranking_table.npz'
+if os.path.exists(ranking_table):
+    json_files.append((ranking_table, 'backend/recomendationModel'))
+
 assets_files = []
 assets_dir = 'assets'
 if os.path.exists(assets_dir):
@@ -0,0 +1,205 @@
+import hashlib
+import logging
+import os
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from PySide6.QtCore import QRunnable, QSize, QThreadPool
+from PySide6.QtGui import QImage, QImageReader
+from PySide6.QtQuick import QQuickAsyncImageProvider, QQuickImageResponse, QQuickTextureFactory
+from tracing import open_file
+
+DEFAULT_MEMORY_LIMIT = 32 * 1024 * 1024
+
+def assets_path():
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, "assets")
+    return str(Path(__file__).resolve().parents[3] / "assets")
+
+def fit_size(source, requested):
+    """Largest size within `requested` keeping the aspect ratio of `source`, never upscaling.
+
+    A zero width or height in `requested` leaves that dimension free, like Image.sourceSize.
+    """
+    if source.isEmpty() or not requested.isValid() or (requested.width() <= 0 and requested.height() <= 0):
+        return source
+    scales = []
+    if requested.width() > 0:
+        scales.append(requested.width() / source.width())
+    if requested.height() > 0:
+        scales.append(requested.height() / source.height())
+    scale = min(min(scales), 1.0)
+    return QSize(max(1, round(source.width() * scale)), max(1, round(source.height() * scale)))
+
+class ScaledImageCache:
+    """LRU of decoded images keyed by (asset, size), bounded by their total size in bytes."""
+
+    def __init__(self, memory_limit=DEFAULT_MEMORY_LIMIT):
+        self.memory_limit = memory_limit
+        self.memory_used = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key, image):
+        size = image.sizeInBytes()
+        if size > self.memory_limit:
+            return
+        with self._lock:
+            previous = self._images.pop(key, None)
+            if previous is not None:
+                self.memory_used -= previous.sizeInBytes()
+            self._images[key] = image
+            self.memory_used += size
+            while self.memory_used > self.memory_limit:
+                _, evicted = self._images.popitem(last=False)
+                self.memory_used -= evicted.sizeInBytes()
+
+class ThumbnailStore:
+    """On-disk PNGs of scaled assets, named after the source file's content hash.
+
+    A changed asset gets a new hash, so stale thumbnails are simply never read again.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._hashes = {}
+        self._lock = threading.Lock()
+
+    def _source_hash(self, source_path):
+        stat = os.stat(source_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(source_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        digest = hashlib.sha256()
+        with open_file(source_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 16), b""):
+                digest.update(block)
+        content_hash = digest.hexdigest()[:32]
+        with self._lock:
+            self._hashes[source_path] = (signature, content_hash)
+        return content_hash
+
+    def path(self, source_path, size):
+        return os.path.join(self.directory, f"{self._source_hash(source_path)}-{size.width()}x{size.height()}.png")
+
+    def load(self, source_path, size):
+        path = self.path(source_path, size)
+        if not os.path.exists(path):
+            return None
+        image = QImage(path)
+        return None if image.isNull() else image
+
+    def store(self, source_path, size, image):
+        path = self.path(source_path, size)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if image.save(tmp_path, "PNG"):
+                os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Couldn't write thumbnail '{path}': {e}")
+
+class _DecodeTask(QRunnable):
+    def __init__(self, response):
+        super().__init__()
+        self._response = response
+
+    def run(self):
+        self._response.load()
+
+class AssetImageResponse(QQuickImageResponse):
+    def __init__(self, provider, asset_id, requested_size):
+        super().__init__()
+        self._provider = provider
+        self._asset_id = asset_id
+        self._requested_size = QSize(requested_size)
+        self._image = QImage()
+        self._error = ""
+
+    def load(self):
+        try:
+            self._image = self._provider.load_image(self._asset_id, self._requested_size)
+        except Exception as e:
+            self._error = str(e)
+            logging.error(f"Couldn't load asset image '{self._asset_id}': {e}")
+        self.finished.emit()
+
+    def textureFactory(self):
+        return QQuickTextureFactory.textureFactoryForImage(self._image)
+
+    def errorString(self):
+        return self._error
+
+class AssetImageProvider(QQuickAsyncImageProvider):
+    """Serves files from assets/ as image://assets/<name>, decoded off the GUI thread.
+
+    Images are decoded straight to the size QML asks for through sourceSize, so a 3x3
+    grid-unit icon never holds a full-resolution bitmap. Scaled images are kept in a
+    memory-capped LRU and, if `thumbnail_dir` is set, as PNG thumbnails on disk.
+    """
+
+    def __init__(self, root=None, memory_limit=DEFAULT_MEMORY_LIMIT, thumbnail_dir=None, max_threads=2):
+        super().__init__()
+        self.root = os.path.realpath(root or assets_path())
+        self.cache = ScaledImageCache(memory_limit)
+        self.thumbnails = ThumbnailStore(thumbnail_dir) if thumbnail_dir else None
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(max_threads)
+        # Qt may drop a response once it has finished, keep them alive until then.
+        self._responses = set()
+        self._responses_lock = threading.Lock()
+
+    def requestImageResponse(self, id, requestedSize):
+        response = AssetImageResponse(self, id, requestedSize)
+        with self._responses_lock:
+            self._responses.add(response)
+        response.finished.connect(lambda: self._release(response))
+        self._pool.start(_DecodeTask(response))
+        return response
+
+    def _release(self, response):
+        with self._responses_lock:
+            self._responses.discard(response)
+
+    def source_path(self, asset_id):
+        path = os.path.realpath(os.path.join(self.root, asset_id.split("?", 1)[0]))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"'{asset_id}' is outside the assets directory")
+        return path
+
+    def load_image(self, asset_id, requested_size):
+        """The asset scaled to fit `requested_size`, from memory, disk or a fresh decode."""
+        source_path = self.source_path(asset_id)
+        reader = QImageReader(source_path)
+        target_size = fit_size(reader.size(), requested_size)
+        key = (source_path, target_size.width(), target_size.height())
+
+        image = self.cache.get(key)
+        if image is not None:
+            return image
+
+        scaled = target_size != reader.size()
+        if scaled and self.thumbnails is not None:
+            image = self.thumbnails.load(source_path, target_size)
+        if image is None:
+            if scaled:
+                reader.setScaledSize(target_size)
+            image = reader.read()
+            if image.isNull():
+                raise OSError(reader.errorString())
+            if scaled and self.thumbnails is not None:
+                self.thumbnails.store(source_path, target_size, image)
+
+        self.cache.put(key, image)
+        return image
@@ -0,0 +1,66 @@
+from PySide6.QtCore import QObject, Property, QTimer, Signal, Slot
+from tracing import BUCKET_EDGES_MS, tracer
+
+class TraceStats(QObject):
+    """The tracer's rolling per-slot histograms, for display in QML.
+
+    `entries` holds one map per traced name, slowest total first, with count, meanMs,
+    p50Ms, p95Ms, maxMs, cpuMs, bytes and the bucket counts of `bucketEdges`. It is
+    refreshed every `interval` ms while tracing is on and only notifies on new spans.
+    """
+    entriesChanged = Signal()
+
+    def __init__(self, interval=1000, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._version = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.refresh)
+        if tracer.enabled:
+            self._timer.start()
+
+    @Property(bool, constant=True)
+    def enabled(self):
+        return tracer.enabled
+
+    @Property(list, constant=True)
+    def bucketEdges(self):
+        return list(BUCKET_EDGES_MS)
+
+    @Property(list, notify=entriesChanged)
+    def entries(self):
+        return self._entries
+
+    @Slot()
+    def refresh(self):
+        if tracer.version == self._version:
+            return
+        self._version = tracer.version
+        self._entries = [
+            {
+                "name": row["name"],
+                "category": row["category"],
+                "count": row["count"],
+                "meanMs": row.get("mean_ms", 0.0),
+                "p50Ms": row.get("p50_ms", 0.0),
+                "p95Ms": row.get("p95_ms", 0.0),
+                "maxMs": row.get("max_ms", 0.0),
+                "cpuMs": row.get("cpu_ms", 0.0),
+                "bytes": row.get("bytes", 0),
+                "buckets": row.get("buckets", []),
+            }
+            for row in tracer.summaries()
+        ]
+        self.entriesChanged.emit()
+
+    @Slot(result=str)
+    @Slot(str, result=str)
+    def exportTrace(self, path=""):
+        """Writes the Chrome trace so far; returns its path, or "" when tracing is off."""
+        return tracer.export_chrome_trace(path or None) or ""
+
+    @Slot()
+    def reset(self):
+        tracer.reset()
+        self.refresh()
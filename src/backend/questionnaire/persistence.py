@@ -0,0 +1,112 @@
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from tracing import tracer
+
+class ResponseWriter:
+    """Write-behind persistence for questionnaire responses.
+
+    Every `schedule()` replaces the pending snapshot and pushes the deadline back by
+    `debounce` seconds, so a burst of answer changes ends up as a single write. Writes
+    happen on a worker thread and go through a temporary file plus rename, so the file
+    on disk is always either the previous or the new version.
+    """
+
+    def __init__(self, path, debounce=0.5):
+        self.path = path
+        self.debounce = debounce
+        self.write_count = 0
+        self._pending = None
+        self._deadline = 0.0
+        self._writing = False
+        self._closed = False
+        # mkstemp creates files 0600; new files get the mode open() would have given them.
+        umask = os.umask(0)
+        os.umask(umask)
+        self._new_file_mode = 0o666 & ~umask
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="ResponseWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def schedule(self, responses):
+        """Queues `responses` to be written once no further change arrives within the debounce window."""
+        with self._condition:
+            self._pending = dict(responses)
+            self._deadline = time.monotonic() + self.debounce
+            self._condition.notify_all()
+
+    def flush(self):
+        """Writes any pending snapshot immediately and waits for it to reach the disk."""
+        with self._condition:
+            if self._closed:
+                return
+            self._deadline = time.monotonic()
+            self._condition.notify_all()
+            while self._pending is not None or self._writing:
+                self._condition.wait()
+
+    def close(self):
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        with self._condition:
+            while True:
+                while not self._closed and (self._pending is None or time.monotonic() < self._deadline):
+                    timeout = None if self._pending is None else self._deadline - time.monotonic()
+                    self._condition.wait(timeout)
+                if self._pending is None:
+                    return
+
+                snapshot, self._pending = self._pending, None
+                self._writing = True
+                self._condition.release()
+                try:
+                    self._write(snapshot)
+                finally:
+                    self._condition.acquire()
+                    self._writing = False
+                    self._condition.notify_all()
+
+    @staticmethod
+    def _dump(responses, f):
+        json.dump(responses, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    def _file_mode(self):
+        try:
+            return os.stat(self.path).st_mode & 0o7777
+        except OSError:
+            return self._new_file_mode
+
+    def _write(self, responses):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".responses-", suffix=".tmp", dir=directory)
+            try:
+                os.chmod(tmp_path, self._file_mode())
+                with os.fdopen(fd, 'w') as f:
+                    if tracer.enabled:
+                        with tracer.span("write responses.json", "io"):
+                            self._dump(responses, f)
+                            tracer.add_bytes(written=f.tell())
+                    else:
+                        self._dump(responses, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self.write_count += 1
+        except Exception as e:
+            # Anything escaping here would end the worker thread and leave flush() and
+            # close() waiting for it forever.
+            logging.error(f"Couldn't save responses to '{self.path}': {e}")
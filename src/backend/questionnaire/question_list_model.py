@@ -0,0 +1,99 @@
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+class QuestionListModel(QAbstractListModel):
+    """The questionnaire as a list model, one row per question.
+
+    Delegates read their own question through roles instead of indexing the whole
+    questions list from JavaScript, and answering a question only refreshes its row.
+    `current` and `passed` mark the current question and the ones before it, so moving
+    on refreshes only the rows in between.
+    """
+    QuestionIdRole = Qt.UserRole + 1
+    QuestionRole = Qt.UserRole + 2
+    DescriptionRole = Qt.UserRole + 3
+    OptionsRole = Qt.UserRole + 4
+    AnswerRole = Qt.UserRole + 5
+    AnsweredRole = Qt.UserRole + 6
+    CurrentRole = Qt.UserRole + 7
+    PassedRole = Qt.UserRole + 8
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._questions = []
+        self._rows_by_id = {}
+        self._answers = {}
+        self._current_row = 0
+
+    def set_questions(self, questions):
+        self.beginResetModel()
+        self._questions = list(questions)
+        self._rows_by_id = {str(question["id"]): row for row, question in enumerate(self._questions)}
+        self.endResetModel()
+
+    def set_answers(self, answers):
+        """Replaces every answer, notifying only the rows whose answer changed."""
+        previous, self._answers = self._answers, dict(answers)
+        for question_id in set(previous) | set(self._answers):
+            if previous.get(question_id) != self._answers.get(question_id):
+                self._answer_changed(question_id)
+
+    def set_answer(self, question_id, option_id):
+        if self._answers.get(question_id) != option_id:
+            self._answers[question_id] = option_id
+            self._answer_changed(question_id)
+
+    def _answer_changed(self, question_id):
+        row = self._rows_by_id.get(question_id)
+        if row is not None:
+            self.dataChanged.emit(self.index(row), self.index(row), [self.AnswerRole, self.AnsweredRole])
+
+    def set_current_row(self, row):
+        previous, self._current_row = self._current_row, row
+        if previous != row:
+            first, last = min(previous, row), max(previous, row)
+            self.dataChanged.emit(self.index(first), self.index(last), [self.CurrentRole, self.PassedRole])
+
+    def question(self, row):
+        return self._questions[row] if 0 <= row < len(self._questions) else None
+
+    def roleNames(self):
+        return {
+            self.QuestionIdRole: QByteArray(b"questionId"),
+            self.QuestionRole: QByteArray(b"question"),
+            self.DescriptionRole: QByteArray(b"description"),
+            self.OptionsRole: QByteArray(b"options"),
+            self.AnswerRole: QByteArray(b"answer"),
+            self.AnsweredRole: QByteArray(b"answered"),
+            self.CurrentRole: QByteArray(b"current"),
+            self.PassedRole: QByteArray(b"passed"),
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._questions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        question = self.question(index.row()) if index.isValid() else None
+        if question is None:
+            return None
+        question_id = str(question["id"])
+        if role == self.QuestionIdRole:
+            return question_id
+        if role in (self.QuestionRole, Qt.DisplayRole):
+            return question.get("question", "")
+        if role == self.DescriptionRole:
+            return question.get("description", "")
+        if role == self.OptionsRole:
+            return options_of(question)
+        if role == self.AnswerRole:
+            return self._answers.get(question_id, "")
+        if role == self.AnsweredRole:
+            return question_id in self._answers
+        if role == self.CurrentRole:
+            return index.row() == self._current_row
+        if role == self.PassedRole:
+            return index.row() < self._current_row
+        return None
+
+def options_of(question):
+    """A question's options as [{"optionId", "text"}], in questionnaire order."""
+    return [{"optionId": str(option_id), "text": text} for option_id, text in question.get("options", {}).items()]
@@ -3,6 +3,10 @@ from pathlib import Path
 from PySide6.QtCore import QObject, Property, Signal, Slot
 import sys
 import os
+from backend.questionnaire.persistence import ResponseWriter
+from backend.questionnaire.question_list_model import QuestionListModel, options_of
+from backend.questionnaire.response_store import ResponseStore
+from tracing import open_file, traced
 
 def resource_path(relative_path):
     if hasattr(sys, '_MEIPASS'):
@@ -13,57 +17,126 @@ class QuestionnaireModel(QObject):
     questionsChanged = Signal()
     currentIndexChanged = Signal()
     responsesChanged = Signal()
+    currentQuestionChanged = Signal()
+    currentOptionsChanged = Signal()
+    currentAnswerChanged = Signal()
 
-    def __init__(self):
+    def __init__(self, store=None, save_debounce=0.5):
         super().__init__()
         self._questions = []
         self._currentIndex = 0
-        self._responses = {}
+        self._store = store if store is not None else ResponseStore()
+        self._question_model = QuestionListModel(self)
+        self._current_question = {}
+        self._current_options = []
+        self._current_answer = ""
         self.load_questions()
         self.load_responses()
+        self._question_model.set_answers(self._store.responses())
+        self._update_current_answer()
+        self._writer = ResponseWriter(resource_path("backend/questionnaire/responses.json"), save_debounce)
+        self._store.responsesChanged.connect(self._on_responses_changed)
 
     def load_questions(self):
         json_path = resource_path("backend/questionnaire/questionnaire.json")
-        with open(json_path, 'r') as f:
+        with open_file(json_path, 'r') as f:
             data = json.load(f)
             self._questions = data["questions"]
+        self._question_model.set_questions(self._questions)
+        self._update_current()
 
     def load_responses(self):
         response_path = resource_path("backend/questionnaire/responses.json")
         if os.path.exists(response_path):
-            with open(response_path, 'r') as f:
-                self._responses = json.load(f)
+            with open_file(response_path, 'r') as f:
+                self._store.replace(json.load(f))
 
     def save_responses(self):
-        response_path = resource_path("backend/questionnaire/responses.json")
-        with open(response_path, 'w') as f:
-            json.dump(self._responses, f, indent=4)
+        self._writer.schedule(self._store.responses())
+
+    def _on_responses_changed(self, question_id, option_id):
+        if question_id:
+            self._question_model.set_answer(question_id, option_id)
+        else:
+            self._question_model.set_answers(self._store.responses())
+        self._update_current_answer()
+        self.responsesChanged.emit()
+        self.save_responses()
+
+    @Slot()
+    def flush_responses(self):
+        self._writer.flush()
 
     @Property(list, notify=questionsChanged)
     def questions(self):
         return self._questions
 
+    @Property(QObject, constant=True)
+    def questionModel(self):
+        return self._question_model
+
+    @Property(int, notify=questionsChanged)
+    def questionCount(self):
+        return len(self._questions)
+
     @Property(int, notify=currentIndexChanged)
     def currentIndex(self):
         return self._currentIndex
 
     @currentIndex.setter
     def currentIndex(self, value):
-        if 0 <= value < len(self._questions):
+        if 0 <= value < len(self._questions) and value != self._currentIndex:
             self._currentIndex = value
             self.currentIndexChanged.emit()
+            self._update_current()
+
+    @Property(dict, notify=currentQuestionChanged)
+    def currentQuestion(self):
+        return self._current_question
+
+    @Property(list, notify=currentOptionsChanged)
+    def currentOptions(self):
+        return self._current_options
+
+    @Property(str, notify=currentAnswerChanged)
+    def currentAnswer(self):
+        return self._current_answer
+
+    def _update_current(self):
+        """Refreshes the cached current-question properties, notifying only those that changed."""
+        self._question_model.set_current_row(self._currentIndex)
+        question = self._question_model.question(self._currentIndex) or {}
+        current_question = {
+            "questionId": str(question.get("id", "")),
+            "question": question.get("question", ""),
+            "description": question.get("description", ""),
+        }
+        if current_question != self._current_question:
+            self._current_question = current_question
+            self.currentQuestionChanged.emit()
+
+        current_options = options_of(question)
+        if current_options != self._current_options:
+            self._current_options = current_options
+            self.currentOptionsChanged.emit()
+        self._update_current_answer()
+
+    def _update_current_answer(self):
+        answer = self._store.responses().get(self._current_question.get("questionId", ""), "")
+        if answer != self._current_answer:
+            self._current_answer = answer
+            self.currentAnswerChanged.emit()
 
     @Property(dict, notify=responsesChanged)
     def responses(self):
-        return self._responses
+        return self._store.responses()
 
     @Slot(int, str)
+    @traced("QuestionnaireModel.setResponse")
     def setResponse(self, index, option_id):
         if 0 <= index < len(self._questions):
             question_id = str(self._questions[index]["id"])
-            self._responses[question_id] = option_id 
-            self.responsesChanged.emit()
-            self.save_responses()
+            self._store.set_response(question_id, option_id)
 
     @Slot(int)
     def setCurrentIndex(self, index):
@@ -0,0 +1,29 @@
+from PySide6.QtCore import QObject, Signal
+
+class ResponseStore(QObject):
+    """In-process owner of the questionnaire answers.
+
+    The questionnaire writes into it and the recommender subscribes to
+    `responsesChanged`, so answers reach the scoring without going through disk.
+    The signal carries the changed question and option ids; an empty question id
+    means the whole set of answers was replaced.
+    """
+    responsesChanged = Signal(str, str)
+
+    def __init__(self, responses=None):
+        super().__init__()
+        self._responses = dict(responses or {})
+
+    def responses(self):
+        return self._responses
+
+    def set_response(self, question_id, option_id):
+        question_id, option_id = str(question_id), str(option_id)
+        if self._responses.get(question_id) == option_id:
+            return
+        self._responses[question_id] = option_id
+        self.responsesChanged.emit(question_id, option_id)
+
+    def replace(self, responses):
+        self._responses = {str(k): str(v) for k, v in responses.items()}
+        self.responsesChanged.emit("", "")
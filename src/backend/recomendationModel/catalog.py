@@ -0,0 +1,272 @@
+"""Columnar, memory-mappable form of the distro catalog.
+
+`compile_catalog` turns a distro.json-shaped dict into a directory of .npy columns:
+
+    manifest.json          parameter/hardware/binary column names, string fields, source hash
+    scores.npy             (num_distros, num_parameters) score matrix
+    hardware.npy           (num_distros, num_hardware) hardware requirement matrix
+    bits_<param>.npy       packed bitset of each binary parameter (updates, UI_Look)
+    group_*.npy            distros grouped by their binary-parameter values, see GroupIndex
+    strings.bin            UTF-8 names and metadata, addressed through string_offsets.npy
+
+`ColumnarCatalog` maps those files read-only, so loading costs the same for ten distros
+or a million and only the pages that scoring touches are ever read.
+
+    python -m backend.recomendationModel.catalog extended_distro.json -o distro_catalog
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Mapping, Sequence
+import numpy as np
+from tracing import open_file
+
+CATALOG_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+STRING_FIELDS = ("name", "description", "website", "screenshot")
+GROUP_ARRAYS = ("keys", "group_ids", "order", "offsets", "column_max", "column_min", "hardware_max", "hardware_min")
+
+class GroupIndex:
+    """Distros grouped by their values in the binary parameter columns.
+
+    Every distro in a group gets the same binary-mismatch penalty for a given user, so
+    penalties are computed once per group. The per-group column extremes bound the best
+    score a group can reach, which lets top-k searches skip whole groups.
+    """
+
+    def __init__(self, columns, keys, group_ids, order, offsets, column_max, column_min, hardware_max, hardware_min):
+        self.columns = list(columns)
+        self.keys = keys
+        self.group_ids = group_ids
+        self.order = order
+        self.offsets = offsets
+        self.column_max = column_max
+        self.column_min = column_min
+        self.hardware_max = hardware_max
+        self.hardware_min = hardware_min
+
+    @classmethod
+    def build(cls, score_matrix, hardware_matrix, columns):
+        num_distros = score_matrix.shape[0]
+        if columns and num_distros:
+            keys, group_ids = np.unique(score_matrix[:, columns], axis=0, return_inverse=True)
+        else:
+            keys, group_ids = np.zeros((1, len(columns))), np.zeros(num_distros, dtype=int)
+        group_ids = group_ids.reshape(-1).astype(np.int32)
+        order = np.argsort(group_ids, kind="stable").astype(np.int32)
+        offsets = np.searchsorted(group_ids[order], np.arange(len(keys) + 1)).astype(np.int64)
+
+        num_groups = len(keys)
+        column_max = np.zeros((num_groups, score_matrix.shape[1]))
+        column_min = np.zeros((num_groups, score_matrix.shape[1]))
+        hardware_max = np.zeros((num_groups, hardware_matrix.shape[1]))
+        hardware_min = np.zeros((num_groups, hardware_matrix.shape[1]))
+        for group in range(num_groups):
+            rows = order[offsets[group]:offsets[group + 1]]
+            if len(rows):
+                column_max[group] = score_matrix[rows].max(axis=0)
+                column_min[group] = score_matrix[rows].min(axis=0)
+                if hardware_matrix.shape[1]:
+                    hardware_max[group] = hardware_matrix[rows].max(axis=0)
+                    hardware_min[group] = hardware_matrix[rows].min(axis=0)
+        return cls(columns, np.asarray(keys, dtype=float), group_ids, order, offsets,
+                   column_max, column_min, hardware_max, hardware_min)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def rows(self, group):
+        return self.order[self.offsets[group]:self.offsets[group + 1]]
+
+    def mismatches(self, users, answered):
+        """(num_users, num_groups) count of answered binary parameters each group doesn't match."""
+        if not self.columns:
+            return np.zeros((users.shape[0], len(self)), dtype=int)
+        user_values = users[:, self.columns][:, None, :]
+        return (answered[:, self.columns][:, None, :] & (user_values != self.keys[None, :, :])).sum(axis=2)
+
+    def upper_bounds(self, user_weights, hardware_weights, factors):
+        """Highest score any distro of each group can reach for one user."""
+        bounds = np.maximum(user_weights * self.column_max, user_weights * self.column_min).sum(axis=1) * factors
+        if hardware_weights is not None:
+            bounds = bounds + np.maximum(hardware_weights * self.hardware_max, hardware_weights * self.hardware_min).sum(axis=1)
+        return bounds
+
+    def save(self, directory):
+        for name in GROUP_ARRAYS:
+            np.save(os.path.join(directory, f"group_{name}.npy"), getattr(self, name))
+
+    @classmethod
+    def load(cls, directory, columns, mmap_mode="r"):
+        arrays = {
+            name: np.load(os.path.join(directory, f"group_{name}.npy"), mmap_mode=mmap_mode)
+            for name in GROUP_ARRAYS
+        }
+        # The per-group tables are tiny and read on every query, keep them in memory.
+        for name in ("keys", "offsets", "column_max", "column_min", "hardware_max", "hardware_min"):
+            arrays[name] = np.array(arrays[name])
+        return cls(columns, **arrays)
+
+class StringColumn(Sequence):
+    """One field of the string table, decoded on access."""
+
+    def __init__(self, catalog, field):
+        self._catalog = catalog
+        self._field = STRING_FIELDS.index(field)
+
+    def __len__(self):
+        return self._catalog.num_distros
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[i] for i in range(*row.indices(len(self)))]
+        row = int(row)
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError(row)
+        return self._catalog.string(self._field * len(self) + row)
+
+class MetadataView(Mapping):
+    """distro name -> {"description", "website", "screenshot"}, read from the string table."""
+
+    def __init__(self, catalog):
+        self._catalog = catalog
+        self._rows = None
+
+    def _row_of(self, name):
+        if self._rows is None:
+            self._rows = {distro: row for row, distro in enumerate(self._catalog.names)}
+        return self._rows[name]
+
+    def __getitem__(self, name):
+        row = self._row_of(name)
+        return {
+            field: self._catalog.string(index * self._catalog.num_distros + row)
+            for index, field in enumerate(STRING_FIELDS) if field != "name"
+        }
+
+    def __iter__(self):
+        return iter(self._catalog.names)
+
+    def __len__(self):
+        return self._catalog.num_distros
+
+class ColumnarCatalog:
+    """A compiled catalog directory, memory-mapped read-only."""
+
+    def __init__(self, directory):
+        self.directory = str(directory)
+        with open_file(os.path.join(self.directory, MANIFEST_NAME), "r") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("version") != CATALOG_VERSION:
+            raise ValueError(f"'{self.directory}' is a version {self.manifest.get('version')} catalog, "
+                             f"expected version {CATALOG_VERSION}")
+
+        self.num_distros = self.manifest["num_distros"]
+        self.parameter_names = self.manifest["parameter_names"]
+        self.hardware_names = self.manifest["hardware_names"]
+        self.binary_params = self.manifest["binary_params"]
+        self.source_hash = self.manifest.get("source_hash")
+        self.scores = self._load("scores.npy")
+        self.hardware = self._load("hardware.npy")
+        self.bits = {param: self._load(f"bits_{param}.npy") for param in self.binary_params}
+        self.groups = GroupIndex.load(
+            self.directory, [self.parameter_names.index(param) for param in self.binary_params]
+        )
+        self._string_offsets = self._load("string_offsets.npy")
+        self._strings = np.memmap(os.path.join(self.directory, "strings.bin"), dtype=np.uint8, mode="r") \
+            if self._string_offsets[-1] else np.zeros(0, dtype=np.uint8)
+        self.names = StringColumn(self, "name")
+        self.metadata = MetadataView(self)
+
+    def _load(self, name):
+        return np.load(os.path.join(self.directory, name), mmap_mode="r")
+
+    def string(self, index):
+        start, end = self._string_offsets[index], self._string_offsets[index + 1]
+        return bytes(self._strings[start:end]).decode("utf-8")
+
+    def binary_values(self, param):
+        """A binary parameter's column unpacked from its bitset, one byte per distro."""
+        return np.unpackbits(self.bits[param], count=self.num_distros)
+
+def _compact(matrix):
+    """int8 when every value is a small integer, which the JSON catalog's 0-5 scores are."""
+    if matrix.size and np.all(matrix == np.round(matrix)) and matrix.min() >= -128 and matrix.max() <= 127:
+        return matrix.astype(np.int8)
+    return matrix.astype(np.float64)
+
+def compile_catalog(distro_data, output_dir, binary_params=("updates", "UI_Look"), source_hash=None):
+    """Writes the columnar form of `distro_data` (distro.json's structure) to `output_dir`."""
+    distributions = distro_data.get("distributions", {})
+    names = list(distributions)
+    first = next(iter(distributions.values()), {"scores": {}, "hardware_scores": {}})
+    parameter_names = list(first["scores"])
+    hardware_names = list(first["hardware_scores"])
+
+    scores = np.array(
+        [[info["scores"][name] for name in parameter_names] for info in distributions.values()], dtype=float
+    ).reshape(len(names), len(parameter_names))
+    hardware = np.array(
+        [[info["hardware_scores"][name] for name in hardware_names] for info in distributions.values()], dtype=float
+    ).reshape(len(names), len(hardware_names))
+
+    binary_params = [param for param in binary_params if param in parameter_names]
+    os.makedirs(output_dir, exist_ok=True)
+    for param in binary_params:
+        values = scores[:, parameter_names.index(param)]
+        if not np.isin(values, (0, 1)).all():
+            raise ValueError(f"Binary parameter '{param}' has values other than 0 and 1")
+        np.save(os.path.join(output_dir, f"bits_{param}.npy"), np.packbits(values.astype(bool)))
+
+    np.save(os.path.join(output_dir, "scores.npy"), _compact(scores))
+    np.save(os.path.join(output_dir, "hardware.npy"), _compact(hardware))
+    GroupIndex.build(scores, hardware, [parameter_names.index(param) for param in binary_params]).save(output_dir)
+
+    offsets = [0]
+    with open(os.path.join(output_dir, "strings.bin"), "wb") as f:
+        for field in STRING_FIELDS:
+            for name, info in distributions.items():
+                value = name if field == "name" else str(info.get("metadata", {}).get(field, ""))
+                encoded = value.encode("utf-8")
+                f.write(encoded)
+                offsets.append(offsets[-1] + len(encoded))
+    np.save(os.path.join(output_dir, "string_offsets.npy"), np.array(offsets, dtype=np.int64))
+
+    manifest = {
+        "version": CATALOG_VERSION,
+        "num_distros": len(names),
+        "parameter_names": parameter_names,
+        "hardware_names": hardware_names,
+        "binary_params": binary_params,
+        "string_fields": list(STRING_FIELDS),
+        "source_hash": source_hash,
+        "metadata": distro_data.get("metadata", {}),
+    }
+    # Written last, so a directory with a manifest is always complete.
+    tmp_path = os.path.join(output_dir, f"{MANIFEST_NAME}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(output_dir, MANIFEST_NAME))
+
+def is_catalog(path):
+    return os.path.isfile(os.path.join(str(path), MANIFEST_NAME))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile a distro.json catalog into the columnar format.")
+    parser.add_argument("source", help="distro.json-shaped catalog")
+    parser.add_argument("-o", "--output", required=True, help="output directory")
+    args = parser.parse_args(argv)
+
+    with open(args.source, "rb") as f:
+        raw = f.read()
+    compile_catalog(json.loads(raw), args.output, source_hash=hashlib.sha256(raw).hexdigest())
+    catalog = ColumnarCatalog(args.output)
+    print(f"Compiled {catalog.num_distros} distros into {len(catalog.groups)} groups -> {args.output}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""Headless, streaming distro recommendations for whole fleets of users.
+
+Reads JSONL records of the form
+
+    {"id": "ws-042", "responses": {"2": "1", "3": "2", ...}, "hardware_vector": [4, 2, 1, 3, 2]}
+
+and writes one line per record with its top-k distros. A record without an "id" is
+identified by its line number, and a malformed one gets {"id": ..., "error": ...} instead
+of rankings. Records are scored in chunks with a single matrix operation each (on large
+catalogs, with a per-record group search instead), optionally sharded across worker
+processes; only a bounded number of chunks is held in memory at any time.
+
+    python -m backend.recomendationModel.pipeline fleet.jsonl -o rankings.jsonl -k 3 --workers 4
+"""
+import argparse
+import json
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import numpy as np
+from backend.recomendationModel.scoring_model import load_scoring_model
+
+# From about this catalog size on, ScoringModel.best per record is faster than scoring
+# the whole chunk at once, whose (records x distros) score matrix also gets large.
+GROUP_SEARCH_MIN_DISTROS = 10_000
+
+def iter_chunks(lines, chunk_size):
+    """Yields lists of (line number, line), skipping blank lines."""
+    lines = ((line_number, line) for line_number, line in enumerate(lines, start=1) if line.strip())
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def parse_record(line, hardware_size=None):
+    """Parses one JSONL record, raising ValueError if it isn't one score_records can use.
+
+    Option ids may be strings or integers; `hardware_size`, when given, is the length a
+    hardware vector must have.
+    """
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError(f"expected an object, got {type(record).__name__}")
+    responses = record.get("responses")
+    if responses is not None and not (
+        isinstance(responses, dict) and all(
+            isinstance(option_id, (str, int)) and not isinstance(option_id, bool) for option_id in responses.values()
+        )
+    ):
+        raise ValueError('"responses" must be an object of string or integer option ids')
+    hardware_vector = record.get("hardware_vector")
+    if hardware_vector is not None:
+        if not (isinstance(hardware_vector, list) and all(
+            isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+            for value in hardware_vector
+        )):
+            raise ValueError('"hardware_vector" must be a list of finite numbers')
+        if hardware_size is not None and len(hardware_vector) != hardware_size:
+            raise ValueError(f'"hardware_vector" must have {hardware_size} values, got {len(hardware_vector)}')
+    return record
+
+def score_records(model, records, k=3, penalty_factor=0.5):
+    """Top-k rankings for a list of parsed records.
+
+    The records are scored in one batch, or on catalogs of GROUP_SEARCH_MIN_DISTROS or
+    more one by one with ScoringModel.best, which skips the distro groups that can't
+    make a record's top-k.
+    """
+    user_matrix = model.user_matrix([record.get("responses") or {} for record in records])
+    answered = ~np.isnan(user_matrix).all(axis=1)
+    if len(model.distro_names) >= GROUP_SEARCH_MIN_DISTROS:
+        ranked = [
+            model.best(user, record.get("hardware_vector"), k, penalty_factor) if answered[row] else None
+            for row, (user, record) in enumerate(zip(user_matrix, records))
+        ]
+    else:
+        hardware_matrix = np.zeros((len(records), model.hardware_matrix.shape[1]))
+        for row, record in enumerate(records):
+            hardware_vector = record.get("hardware_vector")
+            if hardware_vector:
+                hardware_matrix[row, :len(hardware_vector)] = hardware_vector
+        scores = model.score(user_matrix, hardware_matrix, penalty_factor)
+        top = model.top_k(scores, k)
+        ranked = [(top[row], scores[row, top[row]]) for row in range(len(records))]
+
+    results = []
+    for row, record in enumerate(records):
+        rankings = []
+        if answered[row]:
+            rankings = [
+                {"distro": model.distro_names[i], "score": float(score)}
+                for i, score in zip(*ranked[row])
+            ]
+        results.append({"id": record.get("id", row), "rankings": rankings})
+    return results
+
+def score_lines(lines, k=3, model=None):
+    """Parses and scores one chunk of (line number, line) pairs, returning the output lines."""
+    model = model or load_scoring_model()
+    records, errors = [], {}
+    for index, (line_number, line) in enumerate(lines):
+        try:
+            record = parse_record(line, model.hardware_matrix.shape[1])
+            record.setdefault("id", line_number)
+            records.append(record)
+        except ValueError as e:
+            errors[index] = {"id": line_number, "error": str(e)}
+            records.append({})
+
+    output = []
+    for index, result in enumerate(score_records(model, records, k)):
+        output.append(json.dumps(errors.get(index, result), separators=(",", ":")))
+    return output
+
+def recommend_stream(lines, k=3, chunk_size=4096, workers=1):
+    """Yields chunks of output lines in input order.
+
+    With more than one worker the chunks are scored in a process pool, keeping at most
+    2 * workers chunks in flight.
+    """
+    chunks = iter_chunks(lines, chunk_size)
+    if workers <= 1:
+        model = load_scoring_model()
+        for chunk in chunks:
+            yield score_lines(chunk, k, model)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(score_lines, chunk, k))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score JSONL records of questionnaire responses against the distro catalog.")
+    parser.add_argument("source", help="JSONL file of {id, responses, hardware_vector} records, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output JSONL file, or - for stdout")
+    parser.add_argument("-k", "--top-k", type=int, default=3, help="distros to keep per record")
+    parser.add_argument("--chunk-size", type=int, default=4096, help="records scored per batch")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (1 = inline)")
+    args = parser.parse_args(argv)
+    if args.top_k < 1 or args.chunk_size < 1:
+        parser.error("--top-k and --chunk-size must be positive")
+
+    source = sys.stdin if args.source == "-" else open(args.source, "r")
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    total = 0
+    start = last_report = time.perf_counter()
+    try:
+        for lines in recommend_stream(source, args.top_k, args.chunk_size, args.workers):
+            output.write("\n".join(lines) + "\n")
+            total += len(lines)
+            now = time.perf_counter()
+            if now - last_report >= 5:
+                print(f"{total} records, {total / (now - start):.0f} records/s", file=sys.stderr)
+                last_report = now
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Scored {total} records in {elapsed:.2f}s, {total / elapsed if elapsed else 0:.0f} records/s", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
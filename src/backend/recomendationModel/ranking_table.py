@@ -0,0 +1,242 @@
+"""Top-k rankings precomputed for every answer combination and hardware vector.
+
+marking.json asks a handful of questions with a few options each and a hardware vector is
+five small integers, so the whole input space is a few hundred thousand points. The build
+step scores all of them once and stores, per point, an index into the distinct top-k
+rankings, so a lookup is a couple of dict reads and an array index whatever the input:
+
+    python -m backend.recomendationModel.ranking_table [-o ranking_table.npz] [-k 10]
+
+The table records the SHA-256 of the distro catalog and marking.json it was built from;
+load_ranking_table refuses it once either changes and callers fall back to live scoring,
+as they do for answers, hardware values or k the table doesn't cover.
+"""
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+import numpy as np
+from backend.recomendationModel.catalog import MANIFEST_NAME, is_catalog
+from backend.recomendationModel.scoring_model import CATALOG_ENV, DISTRO_PATH, MARKING_PATH, load_scoring_model
+from file_signature import stat_signature
+from hardware_analysis.HardwareVector import hardware_levels
+from tracing import open_file
+
+RANKING_TABLE_PATH = Path(__file__).parent / "ranking_table.npz"
+RANKING_TABLE_VERSION = 1
+DEFAULT_K = 10
+
+class RankingTable:
+    """answer combination x hardware vector -> top-k distro indices and their scores.
+
+    Scores are split into an answer term and a hardware term, each stored once per
+    answer combination or hardware vector, and only the k looked-up distros are summed.
+    Row 0 of the hardware terms is "no hardware vector".
+    """
+
+    def __init__(self, meta, rankings, ranking_ids, user_scores, hardware_scores):
+        self.meta = meta
+        self.k = meta["k"]
+        self.penalty_factor = meta["penalty_factor"]
+        self.num_distros = meta["num_distros"]
+        self.distro_hash = meta["distro_hash"]
+        self.marking_hash = meta["marking_hash"]
+        self.rankings = rankings
+        self.ranking_ids = ranking_ids
+        self.user_scores = user_scores
+        self.hardware_scores = hardware_scores
+
+        # Mixed-radix digits: 0 is unanswered, option i is i + 1; the last question varies fastest.
+        self._questions = [
+            (question_id, {option_id: digit + 1 for digit, option_id in enumerate(options)})
+            for question_id, options in meta["questions"]
+        ]
+        self._question_strides = _strides([len(options) + 1 for _, options in meta["questions"]])
+        self._hardware_digits = [{value: digit for digit, value in enumerate(levels)}
+                                 for levels in meta["hardware_levels"]]
+        self._hardware_strides = _strides([len(levels) for levels in meta["hardware_levels"]])
+
+    def answer_index(self, responses):
+        """Row of `responses` ({question_id: option_id}), or None if an answer isn't in the table."""
+        responses = {str(question_id): str(option_id) for question_id, option_id in responses.items()}
+        index = 0
+        for (question_id, digits), stride in zip(self._questions, self._question_strides):
+            if question_id in responses:
+                digit = digits.get(responses[question_id])
+                if digit is None:
+                    return None
+                index += digit * stride
+        return index
+
+    def hardware_index(self, hardware_vector):
+        """Column of `hardware_vector`, 0 for none, or None if it isn't in the table."""
+        if not hardware_vector:
+            return 0
+        if len(hardware_vector) != len(self._hardware_digits):
+            return None
+        index = 1
+        for value, digits, stride in zip(hardware_vector, self._hardware_digits, self._hardware_strides):
+            digit = digits.get(value)
+            if digit is None:
+                return None
+            index += digit * stride
+        return index
+
+    def lookup(self, responses, hardware_vector=None, k=DEFAULT_K, penalty_factor=0.5):
+        """(indices, scores) of the k best distros, as ScoringModel.top_k over score() would
+        rank them, or None when the input is outside the table."""
+        if (k > self.k and self.k < self.num_distros) or penalty_factor != self.penalty_factor:
+            return None
+        answer, hardware = self.answer_index(responses), self.hardware_index(hardware_vector)
+        if answer is None or hardware is None:
+            return None
+        indices = self.rankings[self.ranking_ids[answer, hardware]][:max(k, 0)]
+        return indices, self.user_scores[answer, indices] + self.hardware_scores[hardware, indices]
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp.npz"
+        np.savez_compressed(
+            tmp_path,
+            meta=np.array(json.dumps(self.meta)),
+            rankings=self.rankings,
+            ranking_ids=self.ranking_ids,
+            user_scores=self.user_scores,
+            hardware_scores=self.hardware_scores,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != RANKING_TABLE_VERSION:
+                raise ValueError(f"'{path}' is a version {meta.get('version')} ranking table, "
+                                 f"expected version {RANKING_TABLE_VERSION}")
+            return cls(meta, data["rankings"], data["ranking_ids"], data["user_scores"], data["hardware_scores"])
+
+def _strides(sizes):
+    strides = [1] * len(sizes)
+    for i in range(len(sizes) - 2, -1, -1):
+        strides[i] = strides[i + 1] * sizes[i + 1]
+    return strides
+
+def build_ranking_table(model, distro_hash, marking_hash, k=DEFAULT_K, penalty_factor=0.5, levels=None):
+    """Scores every answer combination against every hardware vector in `levels`
+    (default: hardware_levels()) plus none, keeping the top k of each."""
+    questions = [
+        (question_id, list(options))
+        for question_id, (_, column, options) in model.questions.items()
+        if column < len(model.parameter_names)
+    ]
+    levels = [list(values) for values in (levels or hardware_levels())]
+    num_distros = len(model.distro_names)
+    k = min(k, num_distros)
+
+    answers = itertools.product(*[[None, *options] for _, options in questions])
+    user_matrix = np.array([
+        model.user_vector({question_id: option_id for (question_id, _), option_id in zip(questions, combination)
+                           if option_id is not None})
+        for combination in answers
+    ], dtype=float).reshape(-1, len(model.parameter_names))
+    # The same two terms ScoringModel.score adds, so looked-up scores match it exactly.
+    user_scores = model.score(user_matrix, penalty_factor=penalty_factor)
+    hardware = np.array(list(itertools.product(*levels)), dtype=float).reshape(-1, len(levels))
+    hardware_scores = np.vstack([
+        np.zeros((1, num_distros)),
+        (hardware * model.hardware_penalty(hardware)) @ np.asarray(model.hardware_matrix, dtype=float).T,
+    ])
+
+    top = np.stack([model.top_k(row + hardware_scores, k) for row in user_scores])
+    rankings, ranking_ids = np.unique(top.reshape(-1, k), axis=0, return_inverse=True)
+    index_type = np.uint16 if len(rankings) <= np.iinfo(np.uint16).max else np.uint32
+    meta = {
+        "version": RANKING_TABLE_VERSION,
+        "k": k,
+        "penalty_factor": penalty_factor,
+        "num_distros": num_distros,
+        "distro_hash": distro_hash,
+        "marking_hash": marking_hash,
+        "questions": questions,
+        "hardware_levels": levels,
+    }
+    return RankingTable(
+        meta,
+        rankings.astype(np.int32),
+        ranking_ids.reshape(len(user_scores), len(hardware_scores)).astype(index_type),
+        user_scores,
+        hardware_scores,
+    )
+
+def _file_hash(path):
+    try:
+        with open_file(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+def source_hashes(distro_path=None, marking_path=MARKING_PATH):
+    """(distro, marking) SHA-256, resolving `distro_path` like load_scoring_model. A compiled
+    catalog is identified by the hash of the JSON it was compiled from."""
+    distro_path = distro_path or os.environ.get(CATALOG_ENV) or DISTRO_PATH
+    if is_catalog(distro_path):
+        try:
+            with open_file(os.path.join(distro_path, MANIFEST_NAME), "r") as f:
+                distro_hash = json.load(f).get("source_hash")
+        except (OSError, json.JSONDecodeError):
+            distro_hash = None
+    else:
+        distro_hash = _file_hash(distro_path)
+    return distro_hash, _file_hash(marking_path)
+
+_table_cache = {}
+
+def load_ranking_table(path=RANKING_TABLE_PATH, distro_path=None, marking_path=MARKING_PATH):
+    """The precomputed table, or None if it's missing, unreadable or built from other sources.
+
+    Hashes are only recomputed when the table's or a source's mtime or size changes.
+    """
+    distro_path = distro_path or os.environ.get(CATALOG_ENV) or DISTRO_PATH
+    watched = os.path.join(distro_path, MANIFEST_NAME) if is_catalog(distro_path) else distro_path
+    sources = (str(path), str(watched), str(marking_path))
+    signature = stat_signature(sources)
+    cached = _table_cache.get(sources)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    table = None
+    if signature[0] is not None:
+        try:
+            table = RankingTable.load(path)
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Couldn't load ranking table '{path}': {e}")
+        if table is not None and (table.distro_hash, table.marking_hash) != source_hashes(distro_path, marking_path):
+            logging.info(f"Ranking table '{path}' was built from other sources, scoring live")
+            table = None
+
+    _table_cache[sources] = (signature, table)
+    return table
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute the top-k rankings for every possible input.")
+    parser.add_argument("-o", "--output", default=str(RANKING_TABLE_PATH), help="table to write")
+    parser.add_argument("-k", type=int, default=DEFAULT_K, help="rankings to keep per input")
+    parser.add_argument("--distro", help="distro.json or compiled catalog (default: the app's)")
+    parser.add_argument("--marking", default=str(MARKING_PATH), help="marking.json")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    model = load_scoring_model(args.distro, args.marking)
+    table = build_ranking_table(model, *source_hashes(args.distro, args.marking), k=args.k)
+    table.save(args.output)
+    print(f"{table.ranking_ids.size} inputs, {len(table.rankings)} distinct top-{table.k} rankings "
+          f"in {time.perf_counter() - start:.1f}s -> {args.output} ({os.path.getsize(args.output)} bytes)",
+          file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+from bisect import bisect_left
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+class RankingsModel(QAbstractListModel):
+    """The current top-k distros as a list model, best first.
+
+    `set_rankings` turns a new ranking into the smallest set of row removals, moves,
+    inserts and dataChanged notifications, so views only rebuild delegates for distros
+    that entered the ranking and only refresh the ones whose score changed.
+    """
+    DistroIdRole = Qt.UserRole + 1
+    DistroRole = Qt.UserRole + 2
+    ScoreRole = Qt.UserRole + 3
+    DescriptionRole = Qt.UserRole + 4
+    WebsiteRole = Qt.UserRole + 5
+    ScreenshotRole = Qt.UserRole + 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._metadata = {}
+
+    def set_metadata(self, metadata):
+        """distro name -> metadata dict from distro.json."""
+        self._metadata = metadata
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1),
+                                  [self.DescriptionRole, self.WebsiteRole, self.ScreenshotRole])
+
+    def roleNames(self):
+        return {
+            self.DistroIdRole: QByteArray(b"distroId"),
+            self.DistroRole: QByteArray(b"distro"),
+            self.ScoreRole: QByteArray(b"score"),
+            self.DescriptionRole: QByteArray(b"description"),
+            self.WebsiteRole: QByteArray(b"website"),
+            self.ScreenshotRole: QByteArray(b"screenshot"),
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        distro, score = self._rows[index.row()]
+        if role == self.DistroIdRole:
+            return distro
+        if role in (self.DistroRole, Qt.DisplayRole):
+            return distro.replace("_", " ")
+        if role == self.ScoreRole:
+            return score
+        metadata = self._metadata.get(distro, {})
+        if role == self.DescriptionRole:
+            return metadata.get("description", "")
+        if role == self.WebsiteRole:
+            return metadata.get("website", "")
+        if role == self.ScreenshotRole:
+            return metadata.get("screenshot", "")
+        return None
+
+    def rankings(self):
+        return [{"distro": distro, "score": score} for distro, score in self._rows]
+
+    def set_rankings(self, rankings):
+        """Moves the model to `rankings`, a best-first list of {"distro", "score"} dicts."""
+        target = [(entry["distro"], entry["score"]) for entry in rankings]
+        target_position = {distro: position for position, (distro, _) in enumerate(target)}
+
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row][0] not in target_position:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+
+        # Rows along the longest run already in target order stay put; every other row is
+        # moved to just after its predecessor in the target order.
+        staying = _longest_increasing_run([target_position[distro] for distro, _ in self._rows])
+        staying = {self._rows[row][0] for row in staying}
+        previous = None
+        for distro, _ in target:
+            current = self._row_of(distro)
+            if current is not None and distro not in staying:
+                destination = 0 if previous is None else self._row_of(previous) + 1
+                if destination not in (current, current + 1):
+                    self.beginMoveRows(QModelIndex(), current, current, QModelIndex(), destination)
+                    row = self._rows.pop(current)
+                    self._rows.insert(destination - 1 if destination > current else destination, row)
+                    self.endMoveRows()
+            if current is not None:
+                previous = distro
+
+        for row, (distro, score) in enumerate(target):
+            if row >= len(self._rows) or self._rows[row][0] != distro:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._rows.insert(row, (distro, score))
+                self.endInsertRows()
+            elif self._rows[row][1] != score:
+                self._rows[row] = (distro, score)
+                self.dataChanged.emit(self.index(row), self.index(row), [self.ScoreRole])
+
+    def _row_of(self, distro):
+        return next((row for row, (name, _) in enumerate(self._rows) if name == distro), None)
+
+def _longest_increasing_run(values):
+    """Indices of a longest strictly increasing subsequence of `values`."""
+    tails, tail_indices, parents = [], [], [None] * len(values)
+    for index, value in enumerate(values):
+        position = bisect_left(tails, value)
+        if position == len(tails):
+            tails.append(value)
+            tail_indices.append(index)
+        else:
+            tails[position] = value
+            tail_indices[position] = index
+        parents[index] = tail_indices[position - 1] if position else None
+
+    run = []
+    index = tail_indices[-1] if tail_indices else None
+    while index is not None:
+        run.append(index)
+        index = parents[index]
+    return run[::-1]
@@ -1,146 +1,253 @@
 import json
+import math
 from pathlib import Path
-import numpy as np
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QMetaMethod, QObject, Property, QTimer, Signal, Slot
+from backend.recomendationModel.rankings_model import RankingsModel
+from backend.recomendationModel.what_if_model import WhatIfModel
+from tracing import open_file, traced
 
 class Recommender(QObject):
     rankingsChanged = Signal(list)
+    rankingChanged = Signal(int, str, float)
+    whatIfChanged = Signal()
 
-    def __init__(self):
+    def __init__(self, store=None, top_k=10, model_loader=None, ranking_table_loader=None, questions=None):
         super().__init__()
-        self.responses = self.load_response()
-        self.distro_vectors = self.load_distro_vectors()
-        self.user_vector = self.load_user_vector()
-        self.user_binary_preferences = self.load_binary_preferences()
+        self._model = None
+        self._model_loader = model_loader
+        self._ranking_table_loader = ranking_table_loader
+        self.ranking_table = None
+        self.store = store
+        self.top_k = top_k
+        self._response_mtime = None
+        self.responses = {}
+        self.user_vector = None
+        self.user_binary_preferences = {}
+        self.hardware_vector = None
         self.rankings = []
+        self._rankings_model = RankingsModel(self)
+        self._what_if_model = WhatIfModel(self)
+        self._what_if_stale = False
+        self._what_if_scheduled = False
+        # questionnaire.json's questions, for the texts of the what-if answers.
+        self._question_texts = {
+            str(question["id"]): (question["question"], question.get("options", {}))
+            for question in questions or []
+        }
+        if self.store is not None:
+            self.store.responsesChanged.connect(self.update_response)
+
+    @property
+    def model(self):
+        """The scoring model; it (and NumPy) is loaded on first use instead of at startup."""
+        if self._model is None:
+            from backend.recomendationModel.scoring_model import load_scoring_model
+
+            self._model = (self._model_loader or load_scoring_model)()
+            self._rankings_model.set_metadata(self._model.metadata)
+            self.ranking_table = self.load_ranking_table()
+            self.responses = self.load_response()
+            self.user_vector = self.load_user_vector()
+            self.user_binary_preferences = self.load_binary_preferences()
+        return self._model
+
+    def load_ranking_table(self):
+        """The precomputed rankings for the current model, or None to always score live.
+
+        The shipped table only describes the default model, so a custom model loader
+        needs its own table loader.
+        """
+        if self._ranking_table_loader is None and self._model_loader is not None:
+            return None
+        from backend.recomendationModel.ranking_table import load_ranking_table
+
+        table = (self._ranking_table_loader or load_ranking_table)()
+        if table is not None and table.num_distros != len(self._model.distro_names):
+            return None
+        return table
 
     def load_response(self):
+        if self.store is not None:
+            return self.store.responses()
+
         response_path = Path(__file__).parent.parent / "questionnaire" / "responses.json"
-        if response_path.exists():
-            with open(response_path, "r") as f:
-                return json.load(f)
-        return {}
+        try:
+            mtime = response_path.stat().st_mtime_ns
+        except OSError:
+            self._response_mtime = None
+            return {}
+
+        if mtime == self._response_mtime:
+            return self.responses
+        with open_file(response_path, "r") as f:
+            responses = json.load(f)
+        self._response_mtime = mtime
+        return responses
 
     def load_user_vector(self):
-        marking_path = Path(__file__).parent / "marking.json"
-        if not marking_path.exists():
-            return []
-        
-        with open(marking_path, "r") as f:
-            marking_data = json.load(f)
-        
-        user_vector = []
-        for question in marking_data["user_vector"]["questions"]:
-            question_id = str(question["question_id"])
-            if question_id in self.responses:
-                option_id = self.responses[question_id]
-                score = question["option_id_to_score"].get(option_id, 0)
-                user_vector.append(score)
-        print(user_vector)
-        return user_vector
+        return self.model.user_vector(self.responses)
     
     def load_binary_preferences(self):
-        marking_path = Path(__file__).parent / "marking.json"
-        if not marking_path.exists():
-            return {}
-
-        with open(marking_path, "r") as f:
-            marking_data = json.load(f)
+        return self.model.binary_preferences(self.responses)
 
-        binary_preferences = {}
-        binary_params = {"updates", "UI_Look"}
+    def update_response(self, question_id, option_id):
+        """Applies a single answer from the response store and re-ranks."""
+        if self._model is None:
+            # Nothing to update yet; the model reads the store when it is first loaded.
+            return
 
-        for question in marking_data["user_vector"]["questions"]:
-            question_id = str(question["question_id"])
-            param_name = question.get("parameter_name")
+        from backend.recomendationModel.scoring_model import BINARY_PARAMS
 
-            if param_name in binary_params and question_id in self.responses:
-                option_id = self.responses[question_id]
-                score = question["option_id_to_score"].get(option_id, 0)
-                binary_preferences[param_name] = score
-
-        return binary_preferences
-
-    def load_distro_vectors(self):
-        distro_vector_path = Path(__file__).parent.parent / "distro.json"
-
-        if distro_vector_path.exists():
-            with open(distro_vector_path, "r") as f:
-                data = json.load(f)
-                
-                distro_vectors = {
-                    distro_name: {
-                        "scores": list(distro_info["scores"].values()),
-                        "raw_scores": distro_info["scores"],
-                        "hardware_scores": list(distro_info["hardware_scores"].values())
-                    }
-                    for distro_name, distro_info in data["distributions"].items()
-                }
-                return distro_vectors
-
-        return {}
+        self.responses = self.load_response()
+        if not question_id:
+            self.user_vector = self.load_user_vector()
+            self.user_binary_preferences = self.load_binary_preferences()
+        else:
+            column, score = self.model.user_score(question_id, option_id)
+            if column is None:
+                return
+            self.user_vector[column] = score
+            param_name = self.model.parameter_names[column]
+            if param_name in BINARY_PARAMS:
+                self.user_binary_preferences[param_name] = score
+
+        self.publish_rankings()
+        self.invalidate_what_if()
+
+    def publish_rankings(self):
+        """Recomputes the top-k, notifying only the rows that moved.
+
+        Answers and hardware the ranking table covers are looked up; anything else goes
+        through ScoringModel.best, which skips distro groups that can't make the top-k.
+        """
+        rankings = []
+        if not all(math.isnan(score) for score in self.user_vector):
+            ranked = None
+            if self.ranking_table is not None:
+                ranked = self.ranking_table.lookup(self.responses, self.hardware_vector, self.top_k)
+            if ranked is None:
+                ranked = self.model.best(self.user_vector, self.hardware_vector, self.top_k)
+            rankings = [
+                {"distro": self.model.distro_names[i], "score": float(score)}
+                for i, score in zip(*ranked)
+            ]
+        if rankings == self.rankings:
+            return
+
+        previous, self.rankings = self.rankings or [], rankings
+        self._rankings_model.set_rankings(rankings)
+        for rank, entry in enumerate(rankings):
+            if rank >= len(previous) or previous[rank] != entry:
+                self.rankingChanged.emit(rank, entry["distro"], entry["score"])
+        self.rankingsChanged.emit(self.rankings)
 
     @Slot()
+    @Slot(list)
+    @traced("Recommender.calculate_rankings")
     def calculate_rankings(self, hardware_vector=None):
-        self.responses = self.load_response()
-        self.user_vector = self.load_user_vector()
-        self.user_binary_preferences = self.load_binary_preferences()
+        from backend.recomendationModel.scoring_model import load_scoring_model
+
+        model = (self._model_loader or load_scoring_model)()
+        if self.store is None or model is not self.model:
+            self._model = model
+            self._rankings_model.set_metadata(model.metadata)
+            self.ranking_table = self.load_ranking_table()
+            self.responses = self.load_response()
+            self.user_vector = self.load_user_vector()
+            self.user_binary_preferences = self.load_binary_preferences()
+
+        self.hardware_vector = list(hardware_vector) if hardware_vector else None
+        self.rankings = None
+        self.publish_rankings()
+        self.invalidate_what_if()
+
+    @Property(QObject, constant=True)
+    def rankingsModel(self):
+        """The top-k as a list model, updated row by row as the ranking changes."""
+        return self._rankings_model
+
+    def invalidate_what_if(self):
+        """Marks the what-if answers out of date. They are only recomputed while something,
+        in practice the results page, is connected to whatIfChanged, so re-ranking elsewhere
+        doesn't pay for them."""
+        self._what_if_stale = True
+        if self.isSignalConnected(QMetaMethod.fromSignal(self.whatIfChanged)):
+            self._schedule_what_if()
+
+    def connectNotify(self, signal):
+        if getattr(self, "_what_if_stale", False) and signal == QMetaMethod.fromSignal(self.whatIfChanged):
+            self._schedule_what_if()
+        super().connectNotify(signal)
+
+    def _schedule_what_if(self):
+        # Queued, so a burst of answers is ranked once and never from inside a binding.
+        if not self._what_if_scheduled:
+            self._what_if_scheduled = True
+            QTimer.singleShot(0, self.refresh_what_if)
 
-        if hardware_vector:
-            self.user_vector.extend(hardware_vector)
-            self.distro_vectors = self.extend_distro_vectors_with_hardware_scores(hardware_vector)
-
-        raw_rankings = self.recommend(hardware_vector=hardware_vector)
-        self.rankings = [{"distro": str(name), "score": float(score)} for name, score in raw_rankings]
-        self.rankingsChanged.emit(self.rankings)
+    @Slot()
+    def refresh_what_if(self):
+        """Recomputes the what-if answers if they are out of date."""
+        self._what_if_scheduled = False
+        if self._what_if_stale:
+            self.publish_what_if()
+            self.whatIfChanged.emit()
+
+    def publish_what_if(self):
+        """Ranks every alternative answer to every question in one batch, so the results
+        page can show which answers would change the top pick."""
+        self._what_if_stale = False
+        alternatives = []
+        if self.rankings:
+            top_distro = self.rankings[0]["distro"]
+            # Only the top pick matters for flips_top.
+            for alternative in self.model.what_if(self.responses, self.hardware_vector, 1):
+                rankings = [
+                    {"distro": self.model.distro_names[i], "score": float(score)}
+                    for i, score in zip(alternative["indices"], alternative["scores"])
+                ]
+                question_id, option_id = alternative["question_id"], alternative["option_id"]
+                question_text, option_texts = self._question_texts.get(question_id, (question_id, {}))
+                alternatives.append({
+                    "question_id": question_id,
+                    "option_id": option_id,
+                    "current_option_id": str(self.responses.get(question_id, "")),
+                    "question_text": question_text,
+                    "option_text": option_texts.get(option_id, option_id),
+                    "rankings": rankings,
+                    "flips_top": bool(rankings) and rankings[0]["distro"] != top_distro,
+                })
+        self._what_if_model.set_alternatives(alternatives)
+
+    @Property(QObject, constant=True)
+    def whatIfModel(self):
+        """The top pick under each alternative answer, see publish_what_if."""
+        return self._what_if_model
+
+    @Property(int, notify=whatIfChanged)
+    def flipCount(self):
+        """How many alternative answers would change the top pick."""
+        return sum(row["flips_top"] for row in self._what_if_model.alternatives())
 
     @Slot(result="QVariantList")
     def get_rankings(self):
         return self.rankings
-    
-    def extend_distro_vectors_with_hardware_scores(self):
-        extended_distro_vectors = {}
-        for distro, data in self.distro_vectors.items():
-            extended_distro_vectors[distro] = {
-                "scores": data["scores"] + data["hardware_scores"],
-                "raw_scores": data["raw_scores"] + data["hardware_scores"],
-            }
-        return extended_distro_vectors
-    
-    def apply_hardware_penalty(self, hardware_vector, penalty_factor=0.5):
-        penalty = np.array([1.0] * len(hardware_vector))
-        for i, value in enumerate(hardware_vector):
-            if i in [0, 1, 3]:
-                if value < 2:
-                    penalty[i] = penalty_factor
-            elif i in [2, 4]:
-                if value != 1:
-                    penalty[i] = penalty_factor
-        return penalty
 
-    def recommend(self, penalty_factor=0.5, hardware_vector=None):
-        if not self.user_vector or not self.distro_vectors:
-            return []
-        scores = {}
-        user_vector_np = np.array(self.user_vector)
-        binary_params = {"updates", "UI_Look"}
-
-        if hardware_vector:
-            hardware_vector_np = np.array(hardware_vector)
-            hardware_penalty = self.apply_hardware_penalty(hardware_vector)
-
-        for distro, data in self.distro_vectors.items():
-            distro_vector_np = np.array(data["scores"])
-            final_score = np.dot(user_vector_np, distro_vector_np)
+    def apply_hardware_penalty(self, hardware_vector, penalty_factor=0.5):
+        return self.model.hardware_penalty(hardware_vector, penalty_factor)
 
-            for param in binary_params:
-                if param in self.user_binary_preferences and param in data["raw_scores"]:
-                    if self.user_binary_preferences[param] != data["raw_scores"][param]:
-                        final_score *= penalty_factor
+    def recommend_batch(self, user_matrix, hardware_matrix=None, penalty_factor=0.5):
+        """Scores N user profiles against every distro, returning an (N, num_distros) array."""
+        return self.model.score(user_matrix, hardware_matrix, penalty_factor)
 
-            if hardware_vector:
-                final_score += np.dot(hardware_vector_np * hardware_penalty, data["hardware_scores"])
+    def rank_batch(self, scores):
+        """Distro indices for each row of `scores`, best first, ties kept in catalog order."""
+        return self.model.rank(scores)
 
-            scores[distro] = final_score
+    def recommend(self, penalty_factor=0.5, hardware_vector=None):
+        if not self.model.distro_names or all(math.isnan(score) for score in self.user_vector):
+            return []
 
-        return sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        hardware_matrix = [hardware_vector] if hardware_vector else None
+        scores = self.recommend_batch([self.user_vector], hardware_matrix, penalty_factor)[0]
+        return [(self.model.distro_names[i], scores[i]) for i in self.rank_batch(scores)[0]]
@@ -0,0 +1,344 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+import numpy as np
+from backend.recomendationModel.catalog import ColumnarCatalog, GroupIndex, MANIFEST_NAME, is_catalog
+from file_signature import stat_signature
+from tracing import open_file
+
+DISTRO_PATH = Path(__file__).parent.parent / "distro.json"
+MARKING_PATH = Path(__file__).parent / "marking.json"
+SNAPSHOT_PATH = Path(__file__).parent / "scoring_model.pickle"
+SNAPSHOT_VERSION = 3
+# Points the default model at a compiled catalog directory instead of distro.json.
+CATALOG_ENV = "WIN2LINUX_DISTRO_CATALOG"
+
+BINARY_PARAMS = ("updates", "UI_Look")
+# Cores, RAM and storage size are penalised below 2; storage type and GPU whenever they are not 1.
+HARDWARE_THRESHOLD_COLUMNS = np.array([True, True, False, True, False])
+
+class ScoringModel:
+    """Everything needed to score users against the distro catalog, compiled from
+    distro.json and marking.json so that ranking never touches the JSON again."""
+
+    def __init__(self, distro_data, marking_data):
+        distributions = distro_data.get("distributions", {})
+        self.distro_names = list(distributions)
+        self.metadata = {name: dict(info.get("metadata", {})) for name, info in distributions.items()}
+        self.parameter_names = []
+        if distributions:
+            self.parameter_names = list(next(iter(distributions.values()))["scores"])
+
+        self.score_matrix = np.array(
+            [list(info["scores"].values()) for info in distributions.values()], dtype=float
+        ).reshape(len(self.distro_names), len(self.parameter_names))
+        self.hardware_matrix = np.array(
+            [list(info["hardware_scores"].values()) for info in distributions.values()], dtype=float
+        ).reshape(len(self.distro_names), -1)
+        self.binary_columns = {
+            self.parameter_names.index(param): self.score_matrix[:, self.parameter_names.index(param)]
+            for param in BINARY_PARAMS
+            if param in self.parameter_names
+        }
+        self.groups = GroupIndex.build(self.score_matrix, self.hardware_matrix, list(self.binary_columns))
+        self._init_questions(marking_data)
+
+    @classmethod
+    def from_catalog(cls, catalog, marking_data):
+        """A model over a ColumnarCatalog's memory-mapped columns, without copying them."""
+        model = cls.__new__(cls)
+        model.distro_names = catalog.names
+        model.metadata = catalog.metadata
+        model.parameter_names = list(catalog.parameter_names)
+        model.score_matrix = catalog.scores
+        model.hardware_matrix = catalog.hardware
+        model.binary_columns = {
+            catalog.parameter_names.index(param): catalog.binary_values(param)
+            for param in catalog.binary_params
+            if param in BINARY_PARAMS
+        }
+        model.groups = catalog.groups
+        model._init_questions(marking_data)
+        return model
+
+    def _init_questions(self, marking_data):
+        # question_id -> (parameter_name, column, {option_id: score}), in column order
+        questions = marking_data.get("user_vector", {}).get("questions", [])
+        self.questions = {}
+        for question in sorted(questions, key=lambda q: self._column_of(q.get("parameter_name"))):
+            param_name = question.get("parameter_name")
+            self.questions[str(question["question_id"])] = (
+                param_name,
+                self._column_of(param_name),
+                dict(question["option_id_to_score"]),
+            )
+
+    def _column_of(self, param_name):
+        if param_name in self.parameter_names:
+            return self.parameter_names.index(param_name)
+        return len(self.parameter_names)
+
+    def user_vector(self, responses):
+        """One score per parameter column; unanswered questions are NaN."""
+        user_vector = [float("nan")] * len(self.parameter_names)
+        for question_id, option_id in responses.items():
+            column, score = self.user_score(question_id, option_id)
+            if column is not None:
+                user_vector[column] = score
+        return user_vector
+
+    def user_score(self, question_id, option_id):
+        """The (column, score) a single answer contributes, or (None, None) if it isn't scored."""
+        entry = self.questions.get(str(question_id))
+        if entry is None or entry[1] >= len(self.parameter_names):
+            return None, None
+        _, column, option_scores = entry
+        return column, float(option_scores.get(str(option_id), 0))
+
+    def binary_preferences(self, responses):
+        binary_preferences = {}
+        for question_id, (param_name, _, option_scores) in self.questions.items():
+            if param_name in BINARY_PARAMS and question_id in responses:
+                binary_preferences[param_name] = option_scores.get(str(responses[question_id]), 0)
+        return binary_preferences
+
+    def hardware_penalty(self, hardware_vector, penalty_factor=0.5):
+        hardware = np.asarray(hardware_vector, dtype=float)
+        threshold_columns = HARDWARE_THRESHOLD_COLUMNS[:hardware.shape[-1]]
+        penalised = np.where(threshold_columns, hardware < 2, hardware != 1)
+        return np.where(penalised, penalty_factor, 1.0)
+
+    def score(self, user_matrix, hardware_matrix=None, penalty_factor=0.5):
+        """Scores N user profiles against every distro, returning an (N, num_distros) array."""
+        users = np.atleast_2d(np.asarray(user_matrix, dtype=float))
+        if users.shape[1] != len(self.parameter_names):
+            raise ValueError(
+                f"Expected {len(self.parameter_names)} user scores per profile, got {users.shape[1]}"
+            )
+
+        answered = ~np.isnan(users)
+        scores = np.where(answered, users, 0.0) @ self.score_matrix.T
+        # The binary penalty only depends on the distro's group, so it's computed per group.
+        group_factors = penalty_factor ** self.groups.mismatches(users, answered)
+        scores *= group_factors[:, self.groups.group_ids]
+
+        if hardware_matrix is not None:
+            hardware = np.atleast_2d(np.asarray(hardware_matrix, dtype=float))
+            scores += (hardware * self.hardware_penalty(hardware)) @ self.hardware_matrix.T
+
+        return scores
+
+    def rank(self, scores):
+        """Distro indices for each row of `scores`, best first, ties kept in catalog order."""
+        return np.argsort(-np.atleast_2d(scores), axis=1, kind="stable")
+
+    def top_k(self, scores, k):
+        """The k best distro indices per row of `scores`, best first, ties kept in catalog order.
+
+        Uses a partition instead of a full sort once the catalog is large.
+        """
+        scores = np.atleast_2d(scores)
+        num_distros = scores.shape[1]
+        if k <= 0:
+            return np.empty((scores.shape[0], 0), dtype=int)
+        if k >= num_distros or num_distros <= 256:
+            return self.rank(scores)[:, :k]
+
+        kth_best = -np.partition(-scores, k - 1, axis=1)[:, k - 1:k]
+        above = scores > kth_best
+        ties = scores == kth_best
+        ties &= np.cumsum(ties, axis=1) <= k - above.sum(axis=1, keepdims=True)
+        candidates = np.nonzero(above | ties)[1].reshape(len(scores), k)
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.lexsort((candidates, -candidate_scores), axis=-1)
+        return np.take_along_axis(candidates, order, axis=1)
+
+    def best(self, user_vector, hardware_vector=None, k=10, penalty_factor=0.5):
+        """(indices, scores) of the k best distros for one user, ties kept in catalog order.
+
+        Groups are scored in order of their best possible score, and groups that can't
+        beat the current k-th best are never scored, so a user whose preferences match a
+        small group only touches that part of a large catalog.
+        """
+        user = np.asarray(user_vector, dtype=float)
+        answered = ~np.isnan(user)
+        weights = np.where(answered, user, 0.0)
+        factors = penalty_factor ** self.groups.mismatches(user[None, :], answered[None, :])[0]
+        hardware_weights = None
+        if hardware_vector:
+            hardware = np.asarray(hardware_vector, dtype=float)
+            hardware_weights = hardware * self.hardware_penalty(hardware)
+        bounds = self.groups.upper_bounds(weights, hardware_weights, factors)
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0)
+        for group in np.argsort(-bounds, kind="stable"):
+            if k <= 0 or (len(best_rows) >= k and bounds[group] < best_scores[-1]):
+                break
+            rows = np.asarray(self.groups.rows(group), dtype=np.int64)
+            if not len(rows):
+                continue
+            scores = (self.score_matrix[rows] @ weights) * factors[group]
+            if hardware_weights is not None:
+                scores = scores + self.hardware_matrix[rows] @ hardware_weights
+            best_rows = np.concatenate([best_rows, rows])
+            best_scores = np.concatenate([best_scores, scores])
+            order = np.lexsort((best_rows, -best_scores))[:k]
+            best_rows, best_scores = best_rows[order], best_scores[order]
+        return best_rows, best_scores
+
+    def counterfactual_users(self, responses):
+        """The user vector of `responses` with each question's answer swapped for each of
+        its other options, one row per swap: (users, [(question_id, option_id), ...])."""
+        base = np.asarray(self.user_vector(responses), dtype=float)
+        answers = {str(question_id): str(option_id) for question_id, option_id in responses.items()}
+        swaps, columns, values = [], [], []
+        for question_id, (_, column, option_scores) in self.questions.items():
+            if column >= len(self.parameter_names):
+                continue
+            for option_id, score in option_scores.items():
+                if option_id != answers.get(question_id):
+                    swaps.append((question_id, option_id))
+                    columns.append(column)
+                    values.append(float(score))
+        users = np.repeat(base[None, :], len(swaps), axis=0)
+        users[np.arange(len(swaps)), columns] = values
+        return users, swaps
+
+    def what_if(self, responses, hardware_vector=None, k=3, penalty_factor=0.5):
+        """Top-k rankings for every alternative answer to every question, in one batch.
+
+        Returns one {"question_id", "option_id", "indices", "scores"} dict per alternative,
+        in question order; the rankings follow the same rules as `score` and `top_k`.
+        """
+        users, swaps = self.counterfactual_users(responses)
+        if not swaps or not len(self.distro_names):
+            return []
+        hardware_matrix = [hardware_vector] if hardware_vector else None
+        scores = self.score(users, hardware_matrix, penalty_factor)
+        top = self.top_k(scores, k)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        return [
+            {"question_id": question_id, "option_id": option_id,
+             "indices": top[row].tolist(), "scores": top_scores[row].tolist()}
+            for row, (question_id, option_id) in enumerate(swaps)
+        ]
+
+    def user_matrix(self, responses_list):
+        """Stacks the user vectors of many response dicts into an (N, num_parameters) array."""
+        users = np.full((len(responses_list), len(self.parameter_names)), np.nan)
+        for row, responses in enumerate(responses_list):
+            for question_id, option_id in responses.items():
+                column, score = self.user_score(question_id, option_id)
+                if column is not None:
+                    users[row, column] = score
+        return users
+
+_model_cache = {}
+
+def _content_hash(sources):
+    digest = hashlib.sha256()
+    for path in sources:
+        try:
+            with open_file(path, "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def _read_json(path):
+    try:
+        with open_file(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logging.warning(f"Couldn't load '{path}': {e}")
+        return {}
+
+def _load_snapshot(snapshot_path):
+    try:
+        with open_file(snapshot_path, "rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+def _write_snapshot(snapshot_path, snapshot):
+    # A temporary file of its own: the startup warm-up, the GUI thread and pipeline
+    # workers may all write the snapshot at once.
+    directory, name = os.path.split(os.path.abspath(snapshot_path))
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{name}-", suffix=".tmp", dir=directory)
+        os.close(fd)
+        try:
+            with open_file(tmp_path, "wb") as f:
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logging.info(f"Couldn't write scoring model snapshot '{snapshot_path}': {e}")
+
+def _load_catalog_model(catalog_dir, marking_path):
+    # The catalog is already compiled and memory-mapped, a snapshot would only copy it.
+    sources = (str(catalog_dir), str(marking_path))
+    signature = stat_signature((os.path.join(sources[0], MANIFEST_NAME), sources[1]))
+    cached = _model_cache.get(sources)
+    if cached is not None and cached["signature"] == signature:
+        return cached["model"]
+    model = ScoringModel.from_catalog(ColumnarCatalog(catalog_dir), _read_json(marking_path))
+    _model_cache[sources] = {"signature": signature, "model": model}
+    return model
+
+def load_scoring_model(distro_path=None, marking_path=MARKING_PATH, snapshot_path=SNAPSHOT_PATH):
+    """Returns the compiled scoring model, rebuilding it only when a source file changed.
+
+    The in-process copy is reused as long as the sources' mtime and size are unchanged;
+    on a mismatch the content hash decides whether a rebuild is really needed. A pickled
+    snapshot next to the JSON lets cold starts skip JSON parsing the same way.
+
+    `distro_path` may also be a catalog directory compiled by backend.recomendationModel.catalog,
+    which is memory-mapped instead; it defaults to $WIN2LINUX_DISTRO_CATALOG, then distro.json.
+    """
+    distro_path = distro_path or os.environ.get(CATALOG_ENV) or DISTRO_PATH
+    if is_catalog(distro_path):
+        return _load_catalog_model(distro_path, marking_path)
+
+    sources = (str(distro_path), str(marking_path))
+    signature = stat_signature(sources)
+
+    cached = _model_cache.get(sources)
+    if cached is not None and cached["signature"] == signature:
+        return cached["model"]
+
+    snapshot = _load_snapshot(snapshot_path)
+    if snapshot is not None and snapshot["sources"] != sources:
+        snapshot = None
+    if snapshot is not None and snapshot["signature"] == signature:
+        _model_cache[sources] = snapshot
+        return snapshot["model"]
+
+    content_hash = _content_hash(sources)
+    for entry in (cached, snapshot):
+        if entry is not None and entry["content_hash"] == content_hash:
+            entry = dict(entry, signature=signature)
+            break
+    else:
+        entry = {
+            "version": SNAPSHOT_VERSION,
+            "sources": sources,
+            "signature": signature,
+            "content_hash": content_hash,
+            "model": ScoringModel(_read_json(distro_path), _read_json(marking_path)),
+        }
+    _write_snapshot(snapshot_path, entry)
+
+    _model_cache[sources] = entry
+    return entry["model"]
@@ -0,0 +1,88 @@
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+class WhatIfModel(QAbstractListModel):
+    """The ranking each alternative answer would give, one row per question and option.
+
+    `questionText` and `optionText` are the questionnaire's wording of the answer;
+    `rankings` is the best-first list of {"distro", "score"} dicts for that answer (the
+    Recommender only keeps the top pick);
+    `flipsTop` is true when its top distro isn't the current top pick.
+    """
+    QuestionIdRole = Qt.UserRole + 1
+    OptionIdRole = Qt.UserRole + 2
+    CurrentOptionIdRole = Qt.UserRole + 3
+    TopDistroIdRole = Qt.UserRole + 4
+    TopDistroRole = Qt.UserRole + 5
+    TopScoreRole = Qt.UserRole + 6
+    FlipsTopRole = Qt.UserRole + 7
+    RankingsRole = Qt.UserRole + 8
+    QuestionTextRole = Qt.UserRole + 9
+    OptionTextRole = Qt.UserRole + 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def roleNames(self):
+        return {
+            self.QuestionIdRole: QByteArray(b"questionId"),
+            self.OptionIdRole: QByteArray(b"optionId"),
+            self.CurrentOptionIdRole: QByteArray(b"currentOptionId"),
+            self.TopDistroIdRole: QByteArray(b"topDistroId"),
+            self.TopDistroRole: QByteArray(b"topDistro"),
+            self.TopScoreRole: QByteArray(b"topScore"),
+            self.FlipsTopRole: QByteArray(b"flipsTop"),
+            self.RankingsRole: QByteArray(b"rankings"),
+            self.QuestionTextRole: QByteArray(b"questionText"),
+            self.OptionTextRole: QByteArray(b"optionText"),
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        top = row["rankings"][0] if row["rankings"] else {"distro": "", "score": 0.0}
+        if role == self.QuestionIdRole:
+            return row["question_id"]
+        if role == self.OptionIdRole:
+            return row["option_id"]
+        if role == self.CurrentOptionIdRole:
+            return row["current_option_id"]
+        if role == self.TopDistroIdRole:
+            return top["distro"]
+        if role in (self.TopDistroRole, Qt.DisplayRole):
+            return top["distro"].replace("_", " ")
+        if role == self.TopScoreRole:
+            return top["score"]
+        if role == self.FlipsTopRole:
+            return row["flips_top"]
+        if role == self.RankingsRole:
+            return row["rankings"]
+        if role == self.QuestionTextRole:
+            return row["question_text"]
+        if role == self.OptionTextRole:
+            return row["option_text"]
+        return None
+
+    def alternatives(self):
+        return list(self._rows)
+
+    def set_alternatives(self, rows):
+        """Replaces the rows with `rows`, a list of {"question_id", "option_id",
+        "current_option_id", "question_text", "option_text", "rankings", "flips_top"} dicts.
+        The same answers with other rankings, as a re-rank gives, only refresh the rows
+        instead of rebuilding them."""
+        rows = list(rows)
+        if rows == self._rows:
+            return
+        if [(row["question_id"], row["option_id"]) for row in rows] == \
+                [(row["question_id"], row["option_id"]) for row in self._rows]:
+            self._rows = rows
+            self.dataChanged.emit(self.index(0), self.index(len(rows) - 1))
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
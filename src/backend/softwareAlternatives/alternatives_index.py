@@ -0,0 +1,267 @@
+"""Matches installed Windows program names against the alternatives catalog.
+
+Installed names carry versions, architectures and locales ("7-Zip 23.01 (x64)", "Mozilla
+Firefox (x64 en-US)"), so both sides are normalized first and most names are found with a
+dict lookup. The rest go through an inverted index from character trigrams to catalog
+names: a whole installed-software list gathers its candidates' postings in one array
+and is scored with a single np.unique, so the cost follows the postings touched rather
+than installed names x catalog names.
+
+The compiled index is cached next to the catalog as alternatives_index.npz with the
+catalog's SHA-256 and is rebuilt whenever the catalog changes.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import unicodedata
+from pathlib import Path
+import numpy as np
+from file_signature import stat_signature
+from tracing import open_file
+
+ALTERNATIVES_PATH = Path(__file__).parent / "alternatives.json"
+INDEX_PATH = Path(__file__).parent / "alternatives_index.npz"
+INDEX_VERSION = 1
+# Dice coefficient of the trigram sets a fuzzy match needs.
+MIN_SCORE = 0.7
+
+# Words that installers add to a program's name without changing which program it is.
+NOISE_WORDS = frozenset({
+    "x64", "x86", "amd64", "arm64", "win64", "win32", "64bit", "32bit", "bit", "windows",
+    "edition", "version", "update", "setup", "installer", "free", "desktop", "client", "app",
+    "en", "us", "gb", "english", "inc", "corporation", "corp", "ltd", "llc", "gmbh", "the", "for",
+})
+_TRADEMARKS = re.compile(r"\((r|tm|c)\)|[®™©]", re.IGNORECASE)
+_BRACKETED = re.compile(r"\([^)]*\)|\[[^\]]*\]")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_NUMBER = re.compile(r"v?\d+[a-z]?")
+
+def normalize_program_name(name):
+    """Canonical lookup key: ASCII lower case without trademarks, bracketed notes, noise
+    words or version numbers after the first word ("7-Zip 23.01 (x64)" -> "7 zip")."""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    name = _BRACKETED.sub(" ", _TRADEMARKS.sub(" ", name)).replace("++", "pp")
+    words = [word for word in _NON_ALNUM.split(name) if word]
+    kept = [word for position, word in enumerate(words)
+            if word not in NOISE_WORDS and (position == 0 or not _NUMBER.fullmatch(word))]
+    return " ".join(kept or words)
+
+def trigrams(key):
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class AlternativesIndex:
+    """Normalized catalog names -> catalog programs, exactly or by trigram similarity.
+
+    Every Windows name and alias in the catalog is one key. Keys sharing a trigram are
+    listed in `postings[offsets[t]:offsets[t + 1]]` for trigram id t. Programs are kept as
+    one UTF-8 JSON blob each and only decoded when matched.
+    """
+
+    def __init__(self, meta, keys, key_programs, key_sizes, vocabulary, offsets, postings, entries, entry_offsets):
+        self.meta = meta
+        self.source_hash = meta.get("source_hash")
+        self.featured = meta.get("featured", [])
+        self.keys = keys
+        self.key_programs = key_programs
+        self.key_sizes = key_sizes
+        self.vocabulary = vocabulary
+        self.offsets = offsets
+        self.postings = postings
+        self.entries = entries
+        self.entry_offsets = entry_offsets
+        self._exact = {key: int(program) for key, program in zip(keys.tolist(), key_programs.tolist())}
+        self._trigram_ids = {gram: index for index, gram in enumerate(vocabulary.tolist())}
+        self._decoded = {}
+
+    def __len__(self):
+        return len(self.entry_offsets) - 1
+
+    @classmethod
+    def build(cls, catalog, source_hash=None, source_signature=None):
+        """Compiles an alternatives.json document."""
+        applications = catalog.get("applications", {})
+
+        def describe(name):
+            application = applications.get(name, {})
+            return {
+                "name": name,
+                "description": application.get("description", ""),
+                "website": application.get("website", ""),
+                "icon": application.get("icon", ""),
+            }
+
+        entries, program_of_key = [], {}
+        for program in catalog.get("programs", []):
+            entries.append(json.dumps({
+                "windows": program["windows"],
+                "category": program.get("category", ""),
+                "alternatives": [describe(name) for name in program.get("alternatives", [])],
+            }, ensure_ascii=False).encode("utf-8"))
+            for name in [program["windows"], *program.get("aliases", [])]:
+                # The first program to claim a name keeps it.
+                program_of_key.setdefault(normalize_program_name(name), len(entries) - 1)
+        program_of_key.pop("", None)
+
+        keys = sorted(program_of_key)
+        key_grams = [trigrams(key) for key in keys]
+        vocabulary = sorted(set().union(*key_grams))
+        gram_id = {gram: index for index, gram in enumerate(vocabulary)}
+        gram_keys = [[] for _ in vocabulary]
+        for key_id, grams in enumerate(key_grams):
+            for gram in grams:
+                gram_keys[gram_id[gram]].append(key_id)
+
+        meta = {
+            "version": INDEX_VERSION,
+            "source_hash": source_hash,
+            "source_signature": source_signature,
+            "featured": [describe(name) for name in catalog.get("featured", [])],
+        }
+        return cls(
+            meta,
+            np.array(keys, dtype=str),
+            np.array([program_of_key[key] for key in keys], dtype=np.int32),
+            np.array([len(grams) for grams in key_grams], dtype=np.int32),
+            np.array(vocabulary, dtype=str),
+            np.cumsum([0] + [len(ids) for ids in gram_keys], dtype=np.int64),
+            np.array([key_id for ids in gram_keys for key_id in ids], dtype=np.int32),
+            np.frombuffer(b"".join(entries), dtype=np.uint8),
+            np.cumsum([0] + [len(entry) for entry in entries], dtype=np.int64),
+        )
+
+    def entry(self, program):
+        """The catalog program `program` as {"windows", "category", "alternatives"}."""
+        decoded = self._decoded.get(program)
+        if decoded is None:
+            start, end = self.entry_offsets[program], self.entry_offsets[program + 1]
+            decoded = self._decoded[program] = json.loads(self.entries[start:end].tobytes().decode("utf-8"))
+        return decoded
+
+    def match(self, names, min_score=MIN_SCORE):
+        """Best catalog program per installed name: a list of {"name", "program", "score",
+        "exact"} in the order of `names`, leaving out names without a match."""
+        results = [None] * len(names)
+        fuzzy = []
+        for position, name in enumerate(names):
+            key = normalize_program_name(name)
+            program = self._exact.get(key)
+            if program is not None:
+                results[position] = {"name": name, "program": program, "score": 1.0, "exact": True}
+            elif key:
+                fuzzy.append((position, trigrams(key)))
+
+        for position, program, score in self._match_trigrams(fuzzy, min_score):
+            results[position] = {"name": names[position], "program": program, "score": score, "exact": False}
+        return [result for result in results if result is not None]
+
+    def _match_trigrams(self, queries, min_score):
+        owners, gram_ids, query_sizes = [], [], np.zeros(len(queries), dtype=np.int32)
+        for query, (_, grams) in enumerate(queries):
+            query_sizes[query] = len(grams)
+            for gram in grams:
+                gram_id = self._trigram_ids.get(gram)
+                if gram_id is not None:
+                    owners.append(query)
+                    gram_ids.append(gram_id)
+        if not gram_ids:
+            return []
+
+        # Every (query, key) pair sharing a trigram, one row per shared trigram.
+        gram_ids = np.array(gram_ids, dtype=np.int64)
+        starts = self.offsets[gram_ids]
+        lengths = self.offsets[gram_ids + 1] - starts
+        ends = np.cumsum(lengths)
+        positions = np.arange(ends[-1]) + np.repeat(starts - (ends - lengths), lengths)
+        num_keys = len(self.keys)
+        pairs = np.repeat(np.array(owners, dtype=np.int64), lengths) * num_keys + self.postings[positions]
+
+        pairs, shared = np.unique(pairs, return_counts=True)
+        query_ids, key_ids = pairs // num_keys, pairs % num_keys
+        scores = 2 * shared / (query_sizes[query_ids] + self.key_sizes[key_ids])
+        order = np.lexsort((-scores, query_ids))
+        best = order[np.r_[True, query_ids[order][1:] != query_ids[order][:-1]]]
+        best = best[scores[best] >= min_score]
+        return [(queries[query][0], int(self.key_programs[key]), float(score))
+                for query, key, score in zip(query_ids[best].tolist(), key_ids[best].tolist(), scores[best].tolist())]
+
+    def save(self, path):
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            meta=np.array(json.dumps(self.meta)),
+            keys=self.keys,
+            key_programs=self.key_programs,
+            key_sizes=self.key_sizes,
+            vocabulary=self.vocabulary,
+            offsets=self.offsets,
+            postings=self.postings,
+            entries=self.entries,
+            entry_offsets=self.entry_offsets,
+        )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != INDEX_VERSION:
+                raise ValueError(f"'{path}' is a version {meta.get('version')} alternatives index, "
+                                 f"expected version {INDEX_VERSION}")
+            return cls(meta, *(data[name] for name in (
+                "keys", "key_programs", "key_sizes", "vocabulary", "offsets", "postings", "entries", "entry_offsets",
+            )))
+
+_index_cache = {}
+_index_lock = threading.Lock()
+
+def load_alternatives_index(catalog_path=ALTERNATIVES_PATH, cache_path=INDEX_PATH):
+    """The compiled index of `catalog_path`, from memory, the on-disk cache or a rebuild.
+
+    The cache is trusted while the catalog's mtime and size match the ones it was built
+    from; otherwise the catalog's hash decides whether it has to be rebuilt.
+    """
+    key = (str(catalog_path), str(cache_path))
+    signature = stat_signature((catalog_path,))
+    # The cache's metadata is JSON, which reads the signature back as lists.
+    stored_signature = [list(entry) if entry is not None else None for entry in signature]
+    with _index_lock:
+        cached = _index_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index = None
+        try:
+            index = AlternativesIndex.load(cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Couldn't load alternatives index '{cache_path}': {e}")
+
+        if index is None or index.meta.get("source_signature") != stored_signature:
+            try:
+                with open_file(catalog_path, "rb") as f:
+                    source = f.read()
+            except OSError as e:
+                logging.error(f"Error loading software alternatives: {e}")
+                source = b"{}"
+            source_hash = hashlib.sha256(source).hexdigest()
+            if index is None or index.source_hash != source_hash:
+                try:
+                    catalog = json.loads(source)
+                except json.JSONDecodeError as e:
+                    logging.error(f"Error loading software alternatives: {e}")
+                    catalog = {}
+                index = AlternativesIndex.build(catalog, source_hash, stored_signature)
+            else:
+                index.meta["source_signature"] = stored_signature
+            try:
+                index.save(cache_path)
+            except OSError as e:
+                logging.info(f"Couldn't write alternatives index '{cache_path}': {e}")
+
+        _index_cache[key] = (signature, index)
+        return index
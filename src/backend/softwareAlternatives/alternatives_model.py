@@ -0,0 +1,63 @@
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+class AlternativesModel(QAbstractListModel):
+    """Installed Windows programs that have Linux alternatives, one row per catalog program.
+
+    `alternatives` is a list of {"name", "description", "website", "icon"} maps; `score` is
+    1 for a name found as is and the trigram similarity of a fuzzy match otherwise.
+    """
+    ProgramRole = Qt.UserRole + 1
+    WindowsNameRole = Qt.UserRole + 2
+    CategoryRole = Qt.UserRole + 3
+    AlternativesRole = Qt.UserRole + 4
+    ScoreRole = Qt.UserRole + 5
+    ExactRole = Qt.UserRole + 6
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def roleNames(self):
+        return {
+            self.ProgramRole: QByteArray(b"program"),
+            self.WindowsNameRole: QByteArray(b"windowsName"),
+            self.CategoryRole: QByteArray(b"category"),
+            self.AlternativesRole: QByteArray(b"alternatives"),
+            self.ScoreRole: QByteArray(b"score"),
+            self.ExactRole: QByteArray(b"exact"),
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role in (self.ProgramRole, Qt.DisplayRole):
+            return row["program"]
+        if role == self.WindowsNameRole:
+            return row["windows"]
+        if role == self.CategoryRole:
+            return row["category"]
+        if role == self.AlternativesRole:
+            return row["alternatives"]
+        if role == self.ScoreRole:
+            return row["score"]
+        if role == self.ExactRole:
+            return row["exact"]
+        return None
+
+    def matches(self):
+        return list(self._rows)
+
+    def set_matches(self, rows):
+        """Replaces the rows with `rows`, a list of {"program", "windows", "category",
+        "alternatives", "score", "exact"} dicts. An unchanged list, as a rescan usually
+        finds, leaves the views alone."""
+        rows = list(rows)
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
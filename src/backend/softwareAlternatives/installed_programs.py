@@ -0,0 +1,55 @@
+import logging
+import os
+import sys
+from tracing import open_file
+
+# A text file with one program name per line, read instead of the registry.
+INSTALLED_PROGRAMS_ENV = "WIN2LINUX_INSTALLED_PROGRAMS"
+UNINSTALL_KEYS = (
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_LOCAL_MACHINE", r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKEY_CURRENT_USER", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+)
+
+def installed_programs():
+    """Display names of the installed Windows programs, sorted and without duplicates.
+
+    Read from the registry's Uninstall keys, skipping system components and updates.
+    $WIN2LINUX_INSTALLED_PROGRAMS replaces them with a list from a file, which is also the
+    only source off Windows.
+    """
+    path = os.environ.get(INSTALLED_PROGRAMS_ENV)
+    if path:
+        try:
+            with open_file(path, "r", encoding="utf-8") as f:
+                return sorted({line.strip() for line in f if line.strip()})
+        except OSError as e:
+            logging.error(f"Error reading installed programs from '{path}': {e}")
+            return []
+    if sys.platform != "win32":
+        return []
+
+    import winreg
+    names = set()
+    for hive, path in UNINSTALL_KEYS:
+        try:
+            key = winreg.OpenKey(getattr(winreg, hive), path)
+        except OSError:
+            continue
+        with key:
+            for index in range(winreg.QueryInfoKey(key)[0]):
+                try:
+                    with winreg.OpenKey(key, winreg.EnumKey(key, index)) as entry:
+                        name = _value(winreg, entry, "DisplayName")
+                        if (name and not _value(winreg, entry, "SystemComponent")
+                                and not _value(winreg, entry, "ParentKeyName")):
+                            names.add(str(name).strip())
+                except OSError:
+                    continue
+    return sorted(names)
+
+def _value(winreg, key, name):
+    try:
+        return winreg.QueryValueEx(key, name)[0]
+    except OSError:
+        return None
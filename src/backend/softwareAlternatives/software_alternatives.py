@@ -0,0 +1,127 @@
+import logging
+import threading
+from PySide6.QtCore import QObject, Property, Signal, Slot
+from backend.softwareAlternatives.alternatives_model import AlternativesModel
+from tracing import traced
+
+class SoftwareAlternatives(QObject):
+    """Linux alternatives for the user's installed Windows programs.
+
+    `scan_installed_programs` reads the installed programs on a worker thread and matches
+    them; `match_programs` matches a given list. Matches land in `alternativesModel`, one
+    row per catalog program, in the order the names were given.
+    """
+    matchesChanged = Signal()
+    scanningChanged = Signal()
+    programsFound = Signal(list)
+    featuredChanged = Signal()
+    indexLoaded = Signal()
+
+    def __init__(self, index_loader=None, program_source=None):
+        super().__init__()
+        self._index = None
+        self._index_loader = index_loader
+        self._index_lock = threading.Lock()
+        self._program_source = program_source
+        self._featured = []
+        self._installed_count = 0
+        self._scanner = None
+        self._alternatives_model = AlternativesModel(self)
+        self.programsFound.connect(self._on_programs_found)
+        self.indexLoaded.connect(self._on_index_loaded)
+
+    @property
+    def index(self):
+        """The compiled catalog; it (and NumPy) is loaded on first use instead of at startup."""
+        with self._index_lock:
+            if self._index is not None:
+                return self._index
+            from backend.softwareAlternatives.alternatives_index import load_alternatives_index
+
+            self._index = index = (self._index_loader or load_alternatives_index)()
+        # Emitted from whichever thread loaded it; the GUI thread gets it queued.
+        self.indexLoaded.emit()
+        return index
+
+    def warm_up(self):
+        self.index
+
+    @Property(QObject, constant=True)
+    def alternativesModel(self):
+        return self._alternatives_model
+
+    @Property(list, notify=featuredChanged)
+    def featured(self):
+        """Highlighted alternatives, shown before anything has been matched; empty until
+        the catalog has been loaded."""
+        return self._featured
+
+    @Property(int, notify=matchesChanged)
+    def installedCount(self):
+        return self._installed_count
+
+    @Property(int, notify=matchesChanged)
+    def matchedCount(self):
+        return self._alternatives_model.rowCount()
+
+    @Property(bool, notify=scanningChanged)
+    def scanning(self):
+        return self._scanner is not None
+
+    @Slot(list)
+    @traced()
+    def match_programs(self, names):
+        """Matches installed program names, replacing the previous matches."""
+        names = [str(name) for name in names]
+        index = self.index
+        rows, seen = [], set()
+        for match in index.match(names):
+            if match["program"] in seen:
+                continue
+            seen.add(match["program"])
+            entry = index.entry(match["program"])
+            rows.append({
+                "program": match["name"],
+                "windows": entry["windows"],
+                "category": entry["category"],
+                "alternatives": entry["alternatives"],
+                "score": match["score"],
+                "exact": match["exact"],
+            })
+        self._installed_count = len(names)
+        self._alternatives_model.set_matches(rows)
+        self.matchesChanged.emit()
+
+    @Slot()
+    def scan_installed_programs(self):
+        """Lists the installed programs off the GUI thread, then matches them."""
+        if self._scanner is not None:
+            return
+        self._scanner = threading.Thread(target=self._scan, name="SoftwareAlternatives", daemon=True)
+        self.scanningChanged.emit()
+        self._scanner.start()
+
+    def _scan(self):
+        names = []
+        try:
+            if self._program_source is None:
+                from backend.softwareAlternatives.installed_programs import installed_programs
+
+                self._program_source = installed_programs
+            names = self._program_source()
+            self.index
+        except Exception as e:
+            logging.error(f"Error listing installed programs: {e}")
+        finally:
+            self.programsFound.emit(names)
+
+    @Slot()
+    def _on_index_loaded(self):
+        self._featured = list(self._index.featured)
+        self.featuredChanged.emit()
+
+    @Slot(list)
+    def _on_programs_found(self, names):
+        self._scanner = None
+        self.scanningChanged.emit()
+        self.match_programs(names)
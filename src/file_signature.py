@@ -0,0 +1,17 @@
+import os
+from typing import Iterable, Optional, Tuple, Union
+
+def stat_signature(paths: Iterable[Union[str, os.PathLike]]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    """(mtime_ns, size) of each of `paths`, None for a missing one.
+
+    The compiled caches compare it to decide whether their sources could have changed
+    before falling back to hashing them.
+    """
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
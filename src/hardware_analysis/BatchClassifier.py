@@ -0,0 +1,160 @@
+"""Headless fleet classification of hardware dumps.
+
+Streams a directory of hardware_info.json files (searched recursively) or a JSONL file
+with one dump per line, classifies them across a process pool and writes one hardware
+vector per dump, either as JSONL or as a uint8 .npy matrix with a sidecar .ids.txt:
+
+    python -m hardware_analysis.BatchClassifier dumps/ -o vectors.npy --workers 8
+
+Only a bounded number of chunks is ever in flight, so memory use doesn't depend on the
+fleet size.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+from hardware_analysis.HardwareVector import EMPTY_HARDWARE_VECTOR, compute_hardware_vector
+
+VECTOR_LENGTH = len(EMPTY_HARDWARE_VECTOR)
+
+def iter_records(source: str) -> Iterator[Tuple[str, str, bool]]:
+    """Yields (record id, payload, payload is a path) without reading the whole source."""
+    if os.path.isdir(source):
+        pending = [source]
+        while pending:
+            directory = pending.pop()
+            with os.scandir(directory) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".json"):
+                        yield os.path.relpath(entry.path, source), entry.path, True
+        return
+
+    with open(source, "r") as file:
+        for line_number, line in enumerate(file, start=1):
+            if line.strip():
+                yield str(line_number), line, False
+
+def iter_chunks(records: Iterator, chunk_size: int) -> Iterator[List]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def classify_chunk(chunk: List[Tuple[str, str, bool]]) -> List[Tuple[str, Optional[List[int]]]]:
+    """Worker entry point: parses and classifies one chunk, None marking unreadable dumps."""
+    results = []
+    for record_id, payload, is_path in chunk:
+        try:
+            if is_path:
+                with open(payload, "r") as file:
+                    hardware_data = json.load(file)
+            else:
+                hardware_data = json.loads(payload)
+                record_id = str(hardware_data.pop("id", record_id))
+            results.append((record_id, compute_hardware_vector(hardware_data)))
+        except Exception as e:
+            logging.debug(f"Couldn't classify '{record_id}': {e}")
+            results.append((record_id, None))
+    return results
+
+def classify_stream(source: str, workers: int, chunk_size: int) -> Iterator[List[Tuple[str, Optional[List[int]]]]]:
+    """Classified chunks in input order, keeping at most 2 * workers chunks in flight."""
+    chunks = iter_chunks(iter_records(source), chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield classify_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(classify_chunk, chunk))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+class JsonlWriter:
+    def __init__(self, path: str):
+        self._file = open(path, "w")
+
+    def write(self, results):
+        for record_id, vector in results:
+            self._file.write(json.dumps({"id": record_id, "hardware_vector": vector}, separators=(",", ":")) + "\n")
+
+    def close(self):
+        self._file.close()
+
+class NpyWriter:
+    """Streams rows to a raw scratch file and wraps them in a .npy header at the end."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._rows = 0
+        self._raw = open(f"{path}.rows.tmp", "wb")
+        self._ids = open(f"{os.path.splitext(path)[0]}.ids.txt", "w")
+
+    def write(self, results):
+        for record_id, vector in results:
+            self._raw.write(bytes(vector if vector is not None else EMPTY_HARDWARE_VECTOR))
+            self._ids.write(f"{record_id}\n")
+            self._rows += 1
+
+    def close(self):
+        import numpy as np
+
+        self._raw.close()
+        self._ids.close()
+        output = np.lib.format.open_memmap(self.path, mode="w+", dtype=np.uint8, shape=(self._rows, VECTOR_LENGTH))
+        rows = np.memmap(self._raw.name, dtype=np.uint8, mode="r", shape=(self._rows, VECTOR_LENGTH)) if self._rows else None
+        block = 1 << 16
+        for start in range(0, self._rows, block):
+            output[start:start + block] = rows[start:start + block]
+        output.flush()
+        del output, rows
+        os.remove(self._raw.name)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Classify a fleet of hardware_info.json dumps into hardware vectors.")
+    parser.add_argument("source", help="directory of hardware dumps or a JSONL file with one dump per line")
+    parser.add_argument("-o", "--output", default="hardware_vectors.jsonl", help="output file, .jsonl or .npy")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 = inline)")
+    parser.add_argument("--chunk-size", type=int, default=512, help="dumps per worker task")
+    args = parser.parse_args(argv)
+
+    writer = NpyWriter(args.output) if args.output.endswith(".npy") else JsonlWriter(args.output)
+    total = failed = 0
+    start = last_report = time.perf_counter()
+    try:
+        for results in classify_stream(args.source, args.workers, args.chunk_size):
+            writer.write(results)
+            total += len(results)
+            failed += sum(1 for _, vector in results if vector is None)
+            now = time.perf_counter()
+            if now - last_report >= 5:
+                print(f"{total} dumps, {total / (now - start):.0f} dumps/s", file=sys.stderr)
+                last_report = now
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"Classified {total} dumps ({failed} unreadable) in {elapsed:.2f}s, "
+        f"{total / elapsed if elapsed else 0:.0f} dumps/s -> {args.output}",
+        file=sys.stderr,
+    )
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+from PySide6.QtCore import QAbstractListModel, QByteArray, QModelIndex, Qt
+
+class DeviceSupportModel(QAbstractListModel):
+    """The machine's PCI devices and their Linux driver support, one row per device.
+
+    `status` is one of DriverDatabase.STATUSES and `match` says which rule decided it:
+    "device", "range", "vendor", "class" or "none".
+    """
+    VendorIdRole = Qt.UserRole + 1
+    DeviceIdRole = Qt.UserRole + 2
+    NameRole = Qt.UserRole + 3
+    VendorRole = Qt.UserRole + 4
+    ClassNameRole = Qt.UserRole + 5
+    StatusRole = Qt.UserRole + 6
+    DriverRole = Qt.UserRole + 7
+    NoteRole = Qt.UserRole + 8
+    MatchRole = Qt.UserRole + 9
+
+    _FIELDS = {
+        VendorIdRole: "vendor_id",
+        DeviceIdRole: "device_id",
+        NameRole: "name",
+        VendorRole: "vendor",
+        ClassNameRole: "class_name",
+        StatusRole: "status",
+        DriverRole: "driver",
+        NoteRole: "note",
+        MatchRole: "match",
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def roleNames(self):
+        return {
+            self.VendorIdRole: QByteArray(b"vendorId"),
+            self.DeviceIdRole: QByteArray(b"deviceId"),
+            self.NameRole: QByteArray(b"name"),
+            self.VendorRole: QByteArray(b"vendor"),
+            self.ClassNameRole: QByteArray(b"className"),
+            self.StatusRole: QByteArray(b"status"),
+            self.DriverRole: QByteArray(b"driver"),
+            self.NoteRole: QByteArray(b"note"),
+            self.MatchRole: QByteArray(b"match"),
+        }
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._rows):
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row["name"]
+        field = self._FIELDS.get(role)
+        return row[field] if field else None
+
+    def devices(self):
+        return list(self._rows)
+
+    def set_devices(self, rows):
+        """Replaces the rows with `rows`, DriverDatabase.lookup dicts. An unchanged list, as
+        a rescan of the same machine finds, leaves the views alone."""
+        rows = list(rows)
+        if rows == self._rows:
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
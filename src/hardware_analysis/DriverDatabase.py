@@ -0,0 +1,418 @@
+"""Linux driver support of PCI devices, compiled into a sorted binary table.
+
+driver_support.ids holds the rules in the style of pci.ids (see its header). They are
+compiled into driver_support.bin: a small JSON header followed by 8-byte aligned
+columns, one set per table, each sorted by its key:
+
+    device    vendor << 16 | device                         uint32
+    range     class << 32 | vendor << 16 | first, last      uint64
+    vendor    vendor                                        uint16
+    class     base class                                    uint8
+
+Every table has status (uint8) and name/driver/note (uint32 string ids) columns; the
+strings are one UTF-8 blob addressed through an offsets column. `DriverDatabase` maps
+the file read-only and answers a whole machine's devices with one binary search per
+table, decoding strings only for the rows it returns, so opening it costs the same for
+a hundred rules or a full pci.ids worth of them.
+
+    python -m hardware_analysis.DriverDatabase [--pci-ids pci.ids] [--modules-alias modules.alias]
+
+merges the device names of a pci.ids and the drivers a kernel's modules.alias binds to
+specific devices into the compiled table; the curated rules win where both say something.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import struct
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from file_signature import stat_signature
+from tracing import open_file
+
+DRIVER_RULES_PATH = Path(__file__).parent / "driver_support.ids"
+DRIVER_DATABASE_PATH = Path(__file__).parent / "driver_support.bin"
+DATABASE_VERSION = 1
+MAGIC = b"W2LPCIDB"
+
+# Index 0 means "not set here" in the compiled table; lookups report it as unknown.
+STATUSES = ("unknown", "supported", "firmware", "proprietary", "legacy", "unsupported")
+FIELDS = ("name", "status", "driver", "note")
+TABLE_KEYS = {"device": "<u4", "range": "<u8", "vendor": "<u2", "class": "u1"}
+MATCH_LEVELS = ("device", "range", "vendor", "class")
+
+# FIELDS: name, status index, driver, note
+Rule = Tuple[str, int, str, str]
+
+_VENDOR_LINE = re.compile(r"([0-9a-f]{4})\s+(.*)")
+_DEVICE_LINE = re.compile(r"\t([0-9a-f]{4})\s+(.*)")
+_RANGE_LINE = re.compile(r"\t([0-9a-f]{4})-([0-9a-f]{4}):([0-9a-f]{2})\s+(.*)")
+_CLASS_LINE = re.compile(r"C ([0-9a-f]{2})\s+(.*)")
+_MODULE_ALIAS = re.compile(r"alias pci:v0000([0-9A-F]{4})d0000([0-9A-F]{4})\S*\s+(\S+)")
+
+class DriverRules:
+    """The parsed form of a driver_support.ids or pci.ids file, keyed by integer IDs."""
+
+    def __init__(self):
+        self.vendors: Dict[int, Rule] = {}
+        self.devices: Dict[Tuple[int, int], Rule] = {}
+        self.ranges: List[Tuple[int, int, int, int, Rule]] = []
+        self.classes: Dict[int, Rule] = {}
+
+    @classmethod
+    def parse(cls, lines: Iterable[str], names_only: bool = False) -> "DriverRules":
+        """Parses driver_support.ids lines; with `names_only`, pci.ids lines, whose text
+        after the ID is all name. Subsystem and subclass lines are skipped."""
+        rules = cls()
+        vendor = None
+        for number, line in enumerate(lines, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#") or line.startswith("\t\t"):
+                continue
+            try:
+                if line.startswith("\t"):
+                    if vendor is None:
+                        continue
+                    match = None if names_only else _RANGE_LINE.fullmatch(line)
+                    if match:
+                        first, last, base_class = (int(group, 16) for group in match.group(1, 2, 3))
+                        if first > last:
+                            raise ValueError(f"range {match.group(1)}-{match.group(2)} is empty")
+                        rules.ranges.append((vendor, first, last, base_class, _rule(match.group(4), names_only)))
+                        continue
+                    match = _DEVICE_LINE.fullmatch(line)
+                    if not match:
+                        raise ValueError("expected a device or range line")
+                    rules.devices[(vendor, int(match.group(1), 16))] = _rule(match.group(2), names_only)
+                elif line.startswith("C "):
+                    match = _CLASS_LINE.fullmatch(line)
+                    if not match:
+                        raise ValueError("expected a class line")
+                    # Subclass lines follow a class line; they aren't devices of the last vendor.
+                    vendor = None
+                    rules.classes[int(match.group(1), 16)] = _rule(match.group(2), names_only)
+                else:
+                    match = _VENDOR_LINE.fullmatch(line)
+                    if not match:
+                        if names_only:
+                            vendor = None
+                            continue
+                        raise ValueError("expected a vendor line")
+                    vendor = int(match.group(1), 16)
+                    rules.vendors[vendor] = _rule(match.group(2), names_only)
+            except ValueError as e:
+                raise ValueError(f"line {number}: {e}: {line.strip()!r}") from None
+        return rules
+
+    def merge_names(self, other: "DriverRules") -> None:
+        """Adds the vendor and device names of `other` (a parsed pci.ids) for IDs these
+        rules don't name; statuses and drivers are left alone."""
+        for vendor, (name, *_) in other.vendors.items():
+            if vendor not in self.vendors:
+                self.vendors[vendor] = (name, 0, "", "")
+        for key, (name, *_) in other.devices.items():
+            current = self.devices.get(key)
+            if current is None:
+                self.devices[key] = (name, 0, "", "")
+            elif not current[0]:
+                self.devices[key] = (name, *current[1:])
+
+    def merge_module_aliases(self, lines: Iterable[str]) -> int:
+        """Records the kernel module modules.alias binds to each specific device, where
+        the rules don't name a driver. Returns how many devices got one."""
+        added = 0
+        for line in lines:
+            match = _MODULE_ALIAS.match(line)
+            if not match:
+                continue
+            key = (int(match.group(1), 16), int(match.group(2), 16))
+            name, status, driver, note = self.devices.get(key, ("", 0, "", ""))
+            if not driver:
+                self.devices[key] = (name, status, match.group(3), note)
+                added += 1
+        return added
+
+def _rule(text: str, names_only: bool) -> Rule:
+    if names_only:
+        return (text.strip(), 0, "", "")
+    parts = [part.strip() for part in text.split("|", 3)]
+    parts += [""] * (4 - len(parts))
+    name, status, driver, note = parts
+    if status and status not in STATUSES:
+        raise ValueError(f"unknown status '{status}'")
+    return (name, STATUSES.index(status) if status else 0, driver, note)
+
+def compile_rules(rules: DriverRules, source_hash: Optional[str] = None) -> bytes:
+    """The binary table of `rules`, as written to driver_support.bin."""
+    strings = {"": 0}
+
+    def string_id(value: str) -> int:
+        return strings.setdefault(value, len(strings))
+
+    tables = {
+        "device": sorted(((vendor << 16) | device, rule) for (vendor, device), rule in rules.devices.items()),
+        "range": sorted(
+            ((base_class << 32) | (vendor << 16) | first, (base_class << 32) | (vendor << 16) | last, rule)
+            for vendor, first, last, base_class, rule in rules.ranges
+        ),
+        "vendor": sorted(rules.vendors.items()),
+        "class": sorted(rules.classes.items()),
+    }
+    for previous, current in zip(tables["range"], tables["range"][1:]):
+        if current[0] <= previous[1]:
+            raise ValueError(f"ranges '{previous[2][0]}' and '{current[2][0]}' overlap")
+
+    columns: Dict[str, np.ndarray] = {}
+    for table, rows in tables.items():
+        entries = [row[-1] for row in rows]
+        columns[f"{table}_keys"] = np.array([row[0] for row in rows], dtype=TABLE_KEYS[table])
+        if table == "range":
+            columns["range_ends"] = np.array([row[1] for row in rows], dtype=TABLE_KEYS[table])
+        columns[f"{table}_status"] = np.array([entry[1] for entry in entries], dtype=np.uint8)
+        for field in ("name", "driver", "note"):
+            columns[f"{table}_{field}"] = np.array(
+                [string_id(entry[FIELDS.index(field)]) for entry in entries], dtype="<u4"
+            )
+
+    encoded = [value.encode("utf-8") for value in strings]
+    columns["string_offsets"] = np.concatenate(([0], np.cumsum([len(value) for value in encoded]))).astype("<u4")
+    columns["strings"] = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    sections, offset = {}, 0
+    for name, column in columns.items():
+        sections[name] = [offset, column.dtype.str, len(column)]
+        offset += _aligned(column.nbytes)
+    header = json.dumps({
+        "version": DATABASE_VERSION,
+        "source_hash": source_hash,
+        "counts": {table: len(rows) for table, rows in tables.items()},
+        "sections": sections,
+    }).encode("utf-8")
+    prefix = MAGIC + struct.pack("<I", len(header)) + header
+    prefix += b"\0" * (_aligned(len(prefix)) - len(prefix))
+
+    body = bytearray(offset)
+    for name, column in columns.items():
+        start = sections[name][0]
+        body[start:start + column.nbytes] = column.tobytes()
+    return prefix + bytes(body)
+
+def _aligned(size: int) -> int:
+    return (size + 7) & ~7
+
+class DriverDatabase:
+    """A compiled driver_support.bin, memory-mapped read-only or held as bytes."""
+
+    def __init__(self, buffer: np.ndarray):
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError("not a driver support database")
+        (header_length,) = struct.unpack("<I", bytes(buffer[len(MAGIC):len(MAGIC) + 4]))
+        header_end = len(MAGIC) + 4 + header_length
+        self.header = json.loads(bytes(buffer[len(MAGIC) + 4:header_end]).decode("utf-8"))
+        if self.header.get("version") != DATABASE_VERSION:
+            raise ValueError(f"version {self.header.get('version')} driver database, expected version {DATABASE_VERSION}")
+
+        self.source_hash = self.header.get("source_hash")
+        self.counts = self.header["counts"]
+        body = buffer[_aligned(header_end):]
+        self._columns = {}
+        for name, (offset, dtype, length) in self.header["sections"].items():
+            dtype = np.dtype(dtype)
+            self._columns[name] = body[offset:offset + length * dtype.itemsize].view(dtype)
+        self._strings = memoryview(self._columns["strings"])
+        self._string_offsets = self._columns["string_offsets"]
+
+    @classmethod
+    def open(cls, path: Path = DRIVER_DATABASE_PATH) -> "DriverDatabase":
+        return cls(np.memmap(path, dtype=np.uint8, mode="r"))
+
+    def __len__(self) -> int:
+        return sum(self.counts.values())
+
+    def string(self, index: int) -> str:
+        return self.strings([index])[0]
+
+    def strings(self, indices: Iterable[int]) -> List[str]:
+        """Decodes the strings at `indices`, reading only their bytes."""
+        indices = np.asarray(indices, dtype=np.int64)
+        starts = self._string_offsets[indices].tolist()
+        ends = self._string_offsets[indices + 1].tolist()
+        return [str(self._strings[start:end], "utf-8") for start, end in zip(starts, ends)]
+
+    def _find(self, table: str, keys: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """Row of each key in `table`, -1 where it has none."""
+        table_keys = self._columns[f"{table}_keys"]
+        if not len(table_keys):
+            return np.full(len(keys), -1)
+        if table == "range":
+            rows = np.searchsorted(table_keys, keys, side="right") - 1
+            found = (rows >= 0) & (self._columns["range_ends"][np.maximum(rows, 0)] >= keys)
+        else:
+            rows = np.minimum(np.searchsorted(table_keys, keys), len(table_keys) - 1)
+            found = table_keys[rows] == keys
+        return np.where(found & valid, rows, -1)
+
+    def resolve(self, vendor_ids: np.ndarray, device_ids: np.ndarray, classes: np.ndarray) -> Dict[str, np.ndarray]:
+        """The fields of many devices at once, as arrays: status indices, string ids of
+        name/driver/note and the match level (an index into MATCH_LEVELS, -1 for none)
+        that decided the status. A negative class means the class isn't known."""
+        vendor_ids = np.asarray(vendor_ids, dtype=np.uint64)
+        device_ids = np.asarray(device_ids, dtype=np.uint64)
+        classes = np.asarray(classes, dtype=np.int64)
+        known_class = classes >= 0
+        base_class = np.where(known_class, classes, 0).astype(np.uint64)
+        every = np.ones(len(vendor_ids), dtype=bool)
+
+        rows = {
+            "device": self._find("device", (vendor_ids << 16) | device_ids, every),
+            "range": self._find("range", (base_class << 32) | (vendor_ids << 16) | device_ids, known_class),
+            "vendor": self._find("vendor", vendor_ids, every),
+            "class": self._find("class", base_class, known_class),
+        }
+        resolved = {}
+        for field in FIELDS:
+            levels = MATCH_LEVELS[:2] if field == "name" else MATCH_LEVELS
+            value = np.zeros(len(vendor_ids), dtype=np.uint32)
+            level = np.full(len(vendor_ids), -1)
+            # Lowest precedence first, so the most specific level that sets the field wins.
+            for level_index, table in reversed(list(enumerate(levels))):
+                candidate = self._column_at(table, field, rows[table])
+                found = candidate != 0
+                value = np.where(found, candidate, value)
+                level = np.where(found, level_index, level)
+            resolved[field] = value
+            if field == "status":
+                resolved["match"] = level
+        resolved["vendor"] = self._column_at("vendor", "name", rows["vendor"])
+        resolved["class_name"] = self._column_at("class", "name", rows["class"])
+        return resolved
+
+    def _column_at(self, table: str, field: str, rows: np.ndarray) -> np.ndarray:
+        """`field` of each of `rows` of `table`, 0 where the row is -1."""
+        column = self._columns[f"{table}_{field}"]
+        if not len(column):
+            return np.zeros(len(rows), dtype=column.dtype)
+        return np.where(rows >= 0, column[np.maximum(rows, 0)], 0).astype(column.dtype)
+
+    def lookup(self, devices: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Support of probed PCI devices, given as {"Vendor ID", "Device ID", "Class"}
+        maps of hex strings: one {"vendor_id", "device_id", "class", "name", "vendor",
+        "class_name", "status", "driver", "note", "match"} dict each, in order. IDs that
+        aren't hex count as 0000, which no rule matches."""
+        devices = list(devices)
+        if not devices:
+            return []
+        vendor_ids = [_hex(device.get("Vendor ID")) or 0 for device in devices]
+        device_ids = [_hex(device.get("Device ID")) or 0 for device in devices]
+        classes = [_hex((device.get("Class") or "")[:2]) for device in devices]
+        resolved = self.resolve(vendor_ids, device_ids, [-1 if value is None else value for value in classes])
+
+        text_fields = ("name", "driver", "note", "vendor", "class_name")
+        string_ids = np.unique(np.concatenate([resolved[field] for field in text_fields]))
+        text = dict(zip(string_ids.tolist(), self.strings(string_ids)))
+        columns = {field: [text[index] for index in resolved[field].tolist()] for field in text_fields}
+        statuses = resolved["status"].tolist()
+        matches = resolved["match"].tolist()
+
+        results = []
+        for row, device in enumerate(devices):
+            results.append({
+                "vendor_id": f"{vendor_ids[row]:04x}",
+                "device_id": f"{device_ids[row]:04x}",
+                "class": str(device.get("Class") or ""),
+                "status": STATUSES[statuses[row]],
+                "match": MATCH_LEVELS[matches[row]] if matches[row] >= 0 else "none",
+                **{field: columns[field][row] for field in text_fields},
+            })
+        return results
+
+def _hex(value: Any) -> Optional[int]:
+    try:
+        return int(str(value), 16) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+_database_cache: Dict[Tuple[str, str], Tuple[tuple, DriverDatabase]] = {}
+_database_lock = threading.Lock()
+
+def load_driver_database(path: Path = DRIVER_DATABASE_PATH, rules_path: Path = DRIVER_RULES_PATH) -> DriverDatabase:
+    """The compiled database, recompiled from `rules_path` if it's missing or was
+    compiled from other rules. Without the rules, as in a bundle that only ships the
+    compiled table, the table is used as is."""
+    key = (str(path), str(rules_path))
+    signature = stat_signature((path, rules_path))
+    with _database_lock:
+        cached = _database_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        database = None
+        try:
+            database = DriverDatabase.open(path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            logging.warning(f"Couldn't load driver database '{path}': {e}")
+
+        source = None
+        try:
+            with open_file(rules_path, "rb") as f:
+                source = f.read()
+        except OSError as e:
+            if database is None:
+                logging.error(f"Error loading driver support rules: {e}")
+        source_hash = hashlib.sha256(source).hexdigest() if source is not None else None
+
+        if database is None or (source_hash is not None and database.source_hash != source_hash):
+            try:
+                rules = DriverRules.parse(source.decode("utf-8").splitlines()) if source is not None else DriverRules()
+            except ValueError as e:
+                logging.error(f"Error in driver support rules '{rules_path}': {e}")
+                rules = DriverRules()
+            data = compile_rules(rules, source_hash)
+            database = DriverDatabase(np.frombuffer(data, dtype=np.uint8))
+            try:
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                signature = stat_signature((path, rules_path))
+            except OSError as e:
+                logging.warning(f"Couldn't save driver database '{path}': {e}")
+
+        _database_cache[key] = (signature, database)
+        return database
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile driver_support.ids into the binary driver database.")
+    parser.add_argument("--rules", default=str(DRIVER_RULES_PATH), help="driver_support.ids")
+    parser.add_argument("--pci-ids", help="pci.ids to take the names of unlisted devices from")
+    parser.add_argument("--modules-alias", help="a kernel's modules.alias to take drivers from")
+    parser.add_argument("-o", "--output", default=str(DRIVER_DATABASE_PATH), help="database to write")
+    args = parser.parse_args(argv)
+
+    with open(args.rules, "rb") as f:
+        source = f.read()
+    rules = DriverRules.parse(source.decode("utf-8").splitlines())
+    if args.pci_ids:
+        with open(args.pci_ids, "r", encoding="utf-8", errors="replace") as f:
+            rules.merge_names(DriverRules.parse(f, names_only=True))
+    if args.modules_alias:
+        with open(args.modules_alias, "r", encoding="utf-8") as f:
+            rules.merge_module_aliases(f)
+
+    data = compile_rules(rules, hashlib.sha256(source).hexdigest())
+    with open(args.output, "wb") as f:
+        f.write(data)
+    database = DriverDatabase.open(args.output)
+    counts = ", ".join(f"{count} {table} rules" for table, count in database.counts.items())
+    print(f"Compiled {counts} -> {args.output} ({len(data)} bytes)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
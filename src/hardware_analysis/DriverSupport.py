@@ -0,0 +1,103 @@
+import json
+import logging
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, Property, Signal, Slot
+from hardware_analysis.DeviceSupportModel import DeviceSupportModel
+from tracing import open_file, traced
+
+# Most pressing first; devices with the same status keep the probe's order.
+STATUS_ORDER = ("unsupported", "legacy", "proprietary", "firmware", "unknown", "supported")
+ATTENTION_STATUSES = frozenset({"unsupported", "legacy", "proprietary", "firmware"})
+
+def resource_path(relative_path):
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, relative_path)
+    return os.path.join(os.path.abspath("."), relative_path)
+
+class DriverSupport(QObject):
+    """Linux driver support of the PCI devices HardwareInfo found.
+
+    Devices are looked up in the compiled driver database (see DriverDatabase) and land in
+    `devicesModel`, the ones that need attention first.
+    """
+    devicesChanged = Signal()
+
+    def __init__(self, database_loader: Optional[Callable[[], Any]] = None,
+                 hardware_source: Optional[Callable[[], Dict[str, Any]]] = None):
+        super().__init__()
+        self._database = None
+        self._database_loader = database_loader
+        self._hardware_source = hardware_source or _saved_hardware_info
+        self._database_lock = threading.Lock()
+        self._devices_model = DeviceSupportModel(self)
+
+    @property
+    def database(self):
+        """The driver database; it (and NumPy) is loaded on first use instead of at startup."""
+        with self._database_lock:
+            if self._database is None:
+                from hardware_analysis.DriverDatabase import load_driver_database
+
+                self._database = (self._database_loader or load_driver_database)()
+            return self._database
+
+    def warm_up(self) -> None:
+        self.database
+
+    @Property(QObject, constant=True)
+    def devicesModel(self) -> DeviceSupportModel:
+        return self._devices_model
+
+    @Property(int, notify=devicesChanged)
+    def deviceCount(self) -> int:
+        return self._devices_model.rowCount()
+
+    @Property(int, notify=devicesChanged)
+    def attentionCount(self) -> int:
+        return sum(device["status"] in ATTENTION_STATUSES for device in self._devices_model.devices())
+
+    @Slot()
+    @traced("DriverSupport.check_drivers")
+    def check_drivers(self) -> None:
+        """Looks up the devices of the last hardware scan, saved in hardware_info.json."""
+        hardware_data = self._hardware_source()
+        if hardware_data is not None:
+            self.set_hardware(hardware_data)
+
+    @Slot(str)
+    def update_hardware(self, json_data: str) -> None:
+        """Looks up the devices of a fresh scan, as HardwareInfo.dataUpdated sends it."""
+        try:
+            self.set_hardware(json.loads(json_data))
+        except json.JSONDecodeError as e:
+            logging.error(f"Error reading hardware info: {e}")
+
+    def set_hardware(self, hardware_data: Dict[str, Any]) -> None:
+        probed = [device for device in hardware_data.get("PCI Devices") or [] if isinstance(device, dict)]
+        self._devices_model.set_devices(self._support_of(probed))
+        self.devicesChanged.emit()
+
+    def _support_of(self, probed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        rows = []
+        for device, support in zip(probed, self.database.lookup(probed)):
+            # The database's name is the specific one; Windows often only knows "High
+            # Definition Audio Controller".
+            name = support["name"] or device.get("Name") or f"Device {support['vendor_id']}:{support['device_id']}"
+            rows.append({**support, "name": name, "vendor": support["vendor"] or support["vendor_id"]})
+        rows.sort(key=lambda row: STATUS_ORDER.index(row["status"]))
+        return rows
+
+def _saved_hardware_info() -> Optional[Dict[str, Any]]:
+    hardware_path = resource_path("hardware_info.json")
+    if not os.path.exists(hardware_path):
+        logging.warning("hardware_info.json not found. Waiting for data.")
+        return None
+    try:
+        with open_file(hardware_path, "r") as file:
+            return json.load(file)
+    except (json.JSONDecodeError, OSError) as e:
+        logging.error(f"Error loading hardware info: {e}")
+        return None
@@ -0,0 +1,88 @@
+import json
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from tracing import open_file
+
+GPU_TIERS_PATH = Path(__file__).parent / "gpu_tiers.json"
+
+# Words that vary between WMI, drivers and pci.ids without telling GPUs apart.
+NOISE_WORDS = frozenset({
+    "nvidia", "geforce", "amd", "ati", "radeon", "intel", "corporation", "corp", "inc",
+    "graphics", "series", "laptop", "notebook", "mobile", "gpu", "with", "design",
+})
+_TRADEMARKS = re.compile(r"\((r|tm|c)\)|[®™©]|max-q", re.IGNORECASE)
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def normalize_gpu_name(name: str) -> str:
+    """Canonical lookup key: lower case, no trademarks, punctuation or noise words."""
+    name = _TRADEMARKS.sub(" ", name.lower())
+    return " ".join(word for word in _NON_ALNUM.split(name) if word and word not in NOISE_WORDS)
+
+class GpuTierTable:
+    """GPU model -> performance tier, with an exact table and a regex fallback.
+
+    Names are looked up by their normalized form in a dict, so the cost doesn't grow with
+    the table. Names the table doesn't know go through every fallback pattern in one
+    compiled alternation; the highest tier among its matches wins.
+    """
+
+    def __init__(self, families: Iterable[Dict[str, Any]], patterns: Iterable[Dict[str, Any]]):
+        self.tiers: Dict[str, int] = {}
+        for family in families:
+            for model in family["models"]:
+                key = normalize_gpu_name(f"{family['vendor']} {family['prefix']} {model}")
+                self.tiers[key] = max(self.tiers.get(key, 0), int(family["tier"]))
+
+        self._pattern_tiers: List[int] = []
+        alternatives = []
+        for index, entry in enumerate(patterns):
+            alternatives.append(f"(?P<p{index}>{entry['pattern']})")
+            self._pattern_tiers.append(int(entry["tier"]))
+        self._fallback = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+        self.classify = lru_cache(maxsize=4096)(self._classify)
+
+    @property
+    def max_tier(self) -> int:
+        """Highest tier `classify` can return; unrecognised GPUs are tier 1."""
+        return max([1, *self.tiers.values(), *self._pattern_tiers])
+
+    @classmethod
+    def load(cls, path: Path = GPU_TIERS_PATH) -> "GpuTierTable":
+        try:
+            with open_file(path, "r") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError) as e:
+            logging.error(f"Error loading GPU tier table: {e}")
+            data = {}
+        return cls(data.get("families", []), data.get("patterns", []))
+
+    def _classify(self, gpu_name: str) -> int:
+        """Tier of a single GPU: 3 high, 2 mid, 1 unrecognised, 0 unknown."""
+        if not gpu_name or gpu_name == "Unknown":
+            return 0
+
+        tier = self.tiers.get(normalize_gpu_name(gpu_name))
+        if tier is not None:
+            return tier
+
+        tier = 1
+        if self._fallback is not None:
+            for match in self._fallback.finditer(gpu_name):
+                tier = max(tier, self._pattern_tiers[int(match.lastgroup[1:])])
+        return tier
+
+    def classify_all(self, gpu_names: Iterable[str]) -> int:
+        """Tier of a machine: the best of its GPUs, so hybrid iGPU + dGPU laptops count the dGPU."""
+        return max((self.classify(name) for name in gpu_names), default=0)
+
+_default_table: Optional[GpuTierTable] = None
+
+def get_gpu_tier_table() -> GpuTierTable:
+    """Shared table, loaded on first use."""
+    global _default_table
+    if _default_table is None:
+        _default_table = GpuTierTable.load()
+    return _default_table
@@ -1,12 +1,15 @@
-import psutil
-import wmi
 import sys
 import os
 import json
 import logging
-import platform
-from typing import Dict, List, Optional, Any, Union
-from PySide6.QtCore import QObject, Signal, Slot
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Any, Union
+from PySide6.QtCore import QObject, Property, Signal, Slot
+from hardware_analysis.ProbeBackend import SECTION_KEYS, ProbeBackend, create_backend
+from hardware_analysis.ProbeCache import ProbeCache
+from tracing import open_file, traced
 
 # Logging setup
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -16,92 +19,158 @@ def resource_path(relative_path):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+def covers_every_section(details: Dict[str, Any]) -> bool:
+    """Whether `details` has something for every probe section. Cache entries written
+    before a section was added (such as PCI) don't, and are probed afresh."""
+    return all(any(key in details for key in keys) for keys in SECTION_KEYS.values())
+
 class HardwareInfo(QObject):
     dataUpdated = Signal(str)
-    def __init__(self):
-        super().__init__()
-        if not self._is_windows():
-            raise SystemError("This script is designed for Windows only.")
+    sectionCollected = Signal(str, str)
+    sectionFailed = Signal(str, str)
+    collectionFinished = Signal(bool)
+    collectingChanged = Signal()
 
-        self._wmi_client = wmi.WMI()
+    def __init__(self, backend: Optional[ProbeBackend] = None, probe_timeout: float = 15.0,
+                 cache: Optional[ProbeCache] = None):
+        super().__init__()
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+        self._cache = cache if cache is not None else ProbeCache(resource_path("hardware_cache.json"))
+        self._probe_timeout = probe_timeout
+        self._use_cache = True
         self._hardware_details: Dict[str, Any] = {}
+        self._details_lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._collector: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> ProbeBackend:
+        """The probe backend, created on first use so startup doesn't pay for WMI."""
+        with self._backend_lock:
+            if self._backend is None:
+                self._backend = create_backend()
+            return self._backend
+
+    def warm_up(self) -> None:
+        """Creates the backend and does its slow setup ahead of the first scan."""
+        self.backend.warm_up()
+
+    def _probes(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """Independent probes, keyed by the section name reported to QML."""
+        return self.backend.sections()
+
+    @Property(bool, notify=collectingChanged)
+    def collecting(self) -> bool:
+        return self._collector is not None and self._collector.is_alive()
+
+    @Slot(result=None)
+    @traced("HardwareInfo.collect_hardware_info")
+    def collect_hardware_info(self) -> None:
+        """Starts all probes on a worker pool and returns immediately.
+
+        Each probe's result is merged and announced through `sectionCollected` as soon as
+        it finishes; `dataUpdated` and `collectionFinished` follow once every probe has
+        finished, failed or timed out. Fresh cached results are replayed instead.
+        """
+        self._start_collection(use_cache=True)
 
-    def _is_windows(self) -> bool:
-        """Checks if the current OS is Windows."""
-        return platform.system().lower() == "windows"
-
-    def _get_system_info(self) -> None:
-        """Collects system details."""
-        for item in self._wmi_client.Win32_ComputerSystem():
-            self._hardware_details["Manufacturer"] = item.Manufacturer
-            self._hardware_details["System Architecture"] = item.SystemType.lower()
-            self._hardware_details["Total RAM"] = self._convert_bytes_to_mb(psutil.virtual_memory().total)
-
-    def _get_storage_info(self) -> None:
-        """Collects Storage details."""
-        self._hardware_details["Storage"] = []
-        for disk in self._wmi_client.Win32_DiskDrive():
-            self._hardware_details["Storage"].append({
-                "Model": disk.Model,
-                "Size (GB)": round(int(disk.Size) / (1024**3), 2) if disk.Size else "Unknown",
-                "Interface": disk.InterfaceType,
-                "Type": "SSD" if "SSD" in disk.Model.upper() else "HDD"
-            })
-    
-    def _get_ram_info(self) -> None:
-        """Collects RAM details."""
-        self._hardware_details["RAM Details"] = []
-        for ram in self._wmi_client.Win32_PhysicalMemory():
-            self._hardware_details["RAM Details"].append({
-                "Capacity (GB)": round(int(ram.Capacity) / (1024**3), 2),
-                "Speed (MHz)": ram.Speed,
-                "Type": ram.MemoryType
-            })
-
-
-
-    def _get_cpu_info(self) -> None:
-        """Collects CPU details."""
-        cpu_info = psutil.cpu_freq()
-        for cpu in self._wmi_client.Win32_Processor():
-            self._hardware_details["CPU Name"] = cpu.Name
-            self._hardware_details["Number of Cores"] = psutil.cpu_count(logical=False)
-            self._hardware_details["Number of Logical Processors"] = psutil.cpu_count(logical=True)
-            self._hardware_details["Clock Speed"] = f"{cpu_info.max:.2f} MHz" if cpu_info and cpu_info.max else f"{cpu.MaxClockSpeed} MHz"
-            self._hardware_details["CPU Architecture"] = platform.architecture()[0]
-
-    def _get_gpu_info(self) -> None:
-        """Collects GPU details."""
-        gpus = self._wmi_client.Win32_VideoController()
-        if not gpus:
-            self._hardware_details["GPU"] = "Not Available"
+    @Slot()
+    def refresh_hardware_info(self) -> None:
+        """Like collect_hardware_info, but always probes the hardware again."""
+        self._start_collection(use_cache=False)
+
+    def _start_collection(self, use_cache: bool) -> None:
+        if self.collecting:
             return
 
-        if len(gpus) == 1:
-            self._hardware_details["GPU"] = {
-                "GPU Name": gpus[0].Name,
-                "GPU Memory": self._convert_bytes_to_mb(gpus[0].AdapterRAM)
-            }
-        else:
-            self._hardware_details["GPUs"] = [
-                {"GPU Name": gpu.Name, "GPU Memory": self._convert_bytes_to_mb(gpu.AdapterRAM)}
-                for gpu in gpus
-            ]
-
-    @staticmethod
-    def _convert_bytes_to_mb(size_in_bytes: Optional[int]) -> float:
-        """Converts bytes to MB (2^20 bytes = 1 megabyte)."""
-        return 0.0 if not size_in_bytes else round(size_in_bytes / (1024 * 1024), 2)
+        self._use_cache = use_cache
+        self._cancel_event.clear()
+        with self._details_lock:
+            self._hardware_details = {}
+        self._collector = threading.Thread(target=self._run_probes, name="HardwareInfo", daemon=True)
+        self._collector.start()
+        self.collectingChanged.emit()
+
+    @Slot()
+    def cancel_collection(self) -> None:
+        """Stops waiting for outstanding probes; their late results are discarded."""
+        self._cancel_event.set()
+
+    def _run_probes(self) -> None:
+        try:
+            backend = self.backend
+        except Exception as e:
+            logging.error(f"Couldn't set up the hardware probe backend: {e}")
+            self._finish_collection(False)
+            return
 
-    @Slot(result=None)
-    def collect_hardware_info(self) -> None:
-        """Runs all data collection methods."""
-        self._get_system_info()
-        self._get_cpu_info()
-        self._get_gpu_info()
-        self._get_ram_info()
-        self._get_storage_info()
+        cached = self._cache.load(backend.identity) if self._use_cache else None
+        if cached is not None and covers_every_section(cached):
+            self._replay_cached(cached)
+            return
+
+        failed = False
+        probes = self._probes()
+        executor = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="HardwareProbe")
+        futures = {
+            executor.submit(traced(f"probe {section}", "probe")(probe)): section for section, probe in probes.items()
+        }
+        deadline = time.monotonic() + self._probe_timeout
+        pending = set(futures)
+
+        try:
+            while pending and not self._cancel_event.is_set():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                done, pending = wait(pending, timeout=min(remaining, 0.1), return_when=FIRST_COMPLETED)
+                for future in done:
+                    failed = not self._merge_section(futures[future], future) or failed
+
+            failed = failed or bool(pending)
+            for future in pending:
+                reason = "cancelled" if self._cancel_event.is_set() else "timed out"
+                logging.warning(f"Hardware probe '{futures[future]}' {reason}.")
+                self.sectionFailed.emit(futures[future], reason)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        completed = not self._cancel_event.is_set()
+        if completed:
+            self.to_json()
+            if not failed:
+                with self._details_lock:
+                    self._cache.store(backend.identity, dict(self._hardware_details))
+        self._finish_collection(completed)
+
+    def _replay_cached(self, cached: Dict[str, Any]) -> None:
+        logging.info("Using cached hardware probe results.")
+        with self._details_lock:
+            self._hardware_details = dict(cached)
+        for section, keys in SECTION_KEYS.items():
+            details = {key: cached[key] for key in keys if key in cached}
+            self.sectionCollected.emit(section, json.dumps(details, indent=4, sort_keys=True))
         self.to_json()
+        self._finish_collection(True)
+
+    def _finish_collection(self, completed: bool) -> None:
+        self._collector = None
+        self.collectingChanged.emit()
+        self.collectionFinished.emit(completed)
+
+    def _merge_section(self, section: str, future) -> bool:
+        try:
+            details = future.result()
+        except Exception as e:
+            logging.error(f"Hardware probe '{section}' failed: {e}")
+            self.sectionFailed.emit(section, str(e))
+            return False
+
+        with self._details_lock:
+            self._hardware_details.update(details)
+        self.sectionCollected.emit(section, json.dumps(details, indent=4, sort_keys=True))
+        return True
 
     def display_info(self) -> None:
         """Displays hardware details."""
@@ -129,17 +198,19 @@ class HardwareInfo(QObject):
         print("\n****************************\n")
 
     @Slot(result=str)
+    @traced("HardwareInfo.to_json")
     def to_json(self, save_to_file: bool = True, filename: str = "hardware_info.json") -> str:
         if not self._hardware_details:
             logging.error("No hardware data available, JSON conversion failed.")
             return None
 
-        json_data: str = json.dumps(self._hardware_details, indent=4, sort_keys=True)
+        with self._details_lock:
+            json_data: str = json.dumps(self._hardware_details, indent=4, sort_keys=True)
 
         if save_to_file:
             try:
                 output_path = resource_path(filename)
-                with open(output_path, 'w') as file:
+                with open_file(output_path, 'w') as file:
                     file.write(json_data)
                 logging.info(f"Hardware info saved as '{filename}'!")
 
@@ -149,4 +220,5 @@ class HardwareInfo(QObject):
 
     @Slot(result=str)
     def get_json_data(self) -> str:
-        return json.dumps(self._hardware_details, indent=4) if self._hardware_details else "{}"
+        with self._details_lock:
+            return json.dumps(self._hardware_details, indent=4) if self._hardware_details else "{}"
@@ -0,0 +1,82 @@
+from typing import Any, Dict, List
+from hardware_analysis.GpuTiers import get_gpu_tier_table
+
+# Returned when a hardware dump can't be classified.
+EMPTY_HARDWARE_VECTOR = [0, 0, 0, 0, 0]
+
+def classify_cpu(num_cores: int) -> int:
+    if num_cores >= 6:
+        return 5
+    elif num_cores >= 4:
+        return 4
+    elif num_cores >= 2:
+        return 2
+    elif num_cores == 1:
+        return 1
+    return 0
+
+def classify_ram(ram: int) -> int:
+    if ram >= 8000:
+        return 4
+    elif ram >= 4000:
+        return 2
+    elif ram > 0:
+        return 1
+    return 0
+
+def classify_storage(storage_devices: Any) -> List[int]:
+    if not storage_devices or not isinstance(storage_devices, list):
+        return [0, 0]
+
+    type_score, size_score = 0, 0
+    for storage in storage_devices:
+        size_gb = storage.get("Size (GB)", 0)
+        storage_type = storage.get("Type", "").upper()
+        interface = storage.get("Interface", "").upper()
+
+        if "SSD" in storage_type or "NVME" in interface:
+            type_score = max(type_score, 1)
+        else:
+            type_score = max(type_score, 0) 
+
+        # Size classification
+        if size_gb >= 1000:
+            size_score = max(size_score, 3)
+        elif size_gb >= 500:
+            size_score = max(size_score, 2)
+        elif size_gb > 0:
+            size_score = max(size_score, 1)
+
+    return [type_score, size_score]
+
+def extract_gpu_names(hardware_data: Dict[str, Any]) -> List[str]:
+    gpu_data = hardware_data.get("GPU") or hardware_data.get("GPUs", [])
+    if isinstance(gpu_data, dict):
+        return [gpu_data.get("GPU Name", "Unknown")]
+    elif isinstance(gpu_data, list):
+        return [gpu.get("GPU Name", "Unknown") for gpu in gpu_data if isinstance(gpu, dict)]
+    return ["Unknown"]
+
+def hardware_levels() -> List[List[int]]:
+    """Every value each hardware vector component can take, in vector order."""
+    return [
+        [0, 1, 2, 4, 5],
+        [0, 1, 2, 4],
+        [0, 1],
+        [0, 1, 2, 3],
+        list(range(get_gpu_tier_table().max_tier + 1)),
+    ]
+
+def compute_hardware_vector(hardware_data: Dict[str, Any]) -> List[int]:
+    """[cpu, ram, storage type, storage size, gpu] scores for one hardware dump.
+
+    Qt-free so it can run in worker processes; raises on malformed dumps.
+    """
+    storage_score = classify_storage(hardware_data.get("Storage", []))
+    return [
+        classify_cpu(hardware_data.get("Number of Cores", 0)),
+        classify_ram(hardware_data.get("Total RAM", 0)),
+        storage_score[0],
+        storage_score[1],
+        get_gpu_tier_table().classify_all(extract_gpu_names(hardware_data)),
+    ]
@@ -0,0 +1,189 @@
+import os
+import platform
+from typing import Any, Dict, List, Optional
+from hardware_analysis.ProbeBackend import ProbeBackend, convert_bytes_to_mb
+from tracing import open_file
+
+# Block devices that are not physical disks.
+VIRTUAL_BLOCK_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "sr", "fd", "nbd")
+PCI_IDS_PATHS = ("usr/share/hwdata/pci.ids", "usr/share/misc/pci.ids", "usr/share/pci.ids")
+PCI_VENDOR_NAMES = {"10de": "NVIDIA", "1002": "AMD", "8086": "Intel"}
+
+class LinuxBackend(ProbeBackend):
+    """Linux probes reading procfs and sysfs directly.
+
+    `root` makes every path relative to another directory, so a captured copy of
+    /proc and /sys can be probed exactly like a live system.
+    """
+    name = "linux"
+
+    def __init__(self, root: str = "/"):
+        self._root = root
+
+    def _path(self, *parts: str) -> str:
+        return os.path.join(self._root, *[part.lstrip("/") for part in parts])
+
+    def _read(self, *parts: str) -> Optional[str]:
+        try:
+            with open_file(self._path(*parts), "r") as file:
+                return file.read().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    def _listdir(self, *parts: str) -> List[str]:
+        try:
+            return sorted(os.listdir(self._path(*parts)))
+        except OSError:
+            return []
+
+    def _meminfo_kb(self, key: str) -> int:
+        for line in (self._read("proc/meminfo") or "").splitlines():
+            name, _, value = line.partition(":")
+            if name == key:
+                return int(value.split()[0])
+        return 0
+
+    def _cpuinfo(self) -> List[Dict[str, str]]:
+        processors, current = [], {}
+        for line in (self._read("proc/cpuinfo") or "").splitlines() + [""]:
+            if not line.strip():
+                if current:
+                    processors.append(current)
+                current = {}
+                continue
+            key, _, value = line.partition(":")
+            current[key.strip()] = value.strip()
+        return processors
+
+    def system_info(self) -> Dict[str, Any]:
+        """Collects system details."""
+        return {
+            "Manufacturer": self._read("sys/class/dmi/id/sys_vendor") or "Unknown",
+            "System Architecture": platform.machine().lower(),
+            "Total RAM": convert_bytes_to_mb(self._meminfo_kb("MemTotal") * 1024),
+        }
+
+    def cpu_info(self) -> Dict[str, Any]:
+        """Collects CPU details."""
+        processors = self._cpuinfo()
+        cores = {(cpu.get("physical id"), cpu.get("core id")) for cpu in processors if "core id" in cpu}
+        if not cores and processors:
+            cores = set(range(int(processors[0].get("cpu cores", len(processors)))))
+
+        max_khz = self._read("sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")
+        if max_khz:
+            clock_speed = f"{int(max_khz) / 1000:.2f} MHz"
+        else:
+            clock_speed = f"{float(processors[0].get('cpu MHz', 0)) if processors else 0:.2f} MHz"
+
+        return {
+            "CPU Name": processors[0].get("model name", "Unknown") if processors else "Unknown",
+            "Number of Cores": len(cores),
+            "Number of Logical Processors": len(processors),
+            "Clock Speed": clock_speed,
+            "CPU Architecture": platform.architecture()[0],
+        }
+
+    def ram_info(self) -> Dict[str, Any]:
+        """Collects RAM details; procfs only knows the total, not the individual modules."""
+        total_kb = self._meminfo_kb("MemTotal")
+        if not total_kb:
+            return {"RAM Details": []}
+        return {"RAM Details": [{
+            "Capacity (GB)": round(total_kb * 1024 / (1024**3), 2),
+            "Speed (MHz)": "Unknown",
+            "Type": "Unknown",
+        }]}
+
+    def storage_info(self) -> Dict[str, Any]:
+        """Collects Storage details."""
+        storage = []
+        for device in self._listdir("sys/block"):
+            if device.startswith(VIRTUAL_BLOCK_PREFIXES):
+                continue
+            sectors = self._read("sys/block", device, "size")
+            rotational = self._read("sys/block", device, "queue/rotational")
+            if device.startswith("nvme"):
+                interface = "NVMe"
+            elif device.startswith("mmcblk"):
+                interface = "SD"
+            elif "/usb" in os.path.realpath(self._path("sys/block", device)):
+                interface = "USB"
+            else:
+                interface = "SCSI"
+
+            storage.append({
+                "Model": self._read("sys/block", device, "device/model") or device,
+                "Size (GB)": round(int(sectors) * 512 / (1024**3), 2) if sectors else "Unknown",
+                "Interface": interface,
+                "Type": "SSD" if rotational == "0" else "HDD",
+            })
+        return {"Storage": storage}
+
+    def gpu_info(self) -> Dict[str, Any]:
+        """Collects GPU details from the DRM cards' PCI devices."""
+        gpus = []
+        seen_devices = set()
+        for card in self._listdir("sys/class/drm"):
+            if not card.startswith("card") or "-" in card:
+                continue
+            device_dir = os.path.join("sys/class/drm", card, "device")
+            vendor_id = _hex_id(self._read(device_dir, "vendor"))
+            device_id = _hex_id(self._read(device_dir, "device"))
+            real_device = os.path.realpath(self._path(device_dir))
+            if not vendor_id or real_device in seen_devices:
+                continue
+            seen_devices.add(real_device)
+
+            vram = self._read(device_dir, "mem_info_vram_total")
+            gpus.append({
+                "GPU Name": self._pci_device_name(vendor_id, device_id),
+                "GPU Memory": convert_bytes_to_mb(int(vram)) if vram and vram.isdigit() else 0.0,
+                "Vendor ID": vendor_id,
+                "Device ID": device_id,
+            })
+
+        if not gpus:
+            return {"GPU": "Not Available"}
+        if len(gpus) == 1:
+            return {"GPU": gpus[0]}
+        return {"GPUs": gpus}
+
+    def pci_info(self) -> Dict[str, Any]:
+        """Collects the IDs of every PCI device from sysfs."""
+        devices = []
+        for address in self._listdir("sys/bus/pci/devices"):
+            device_dir = os.path.join("sys/bus/pci/devices", address)
+            vendor_id = _hex_id(self._read(device_dir, "vendor"))
+            if not vendor_id:
+                continue
+            devices.append({
+                "Vendor ID": vendor_id,
+                "Device ID": _hex_id(self._read(device_dir, "device")),
+                # sysfs gives base class, subclass and programming interface: 0x030000.
+                "Class": _hex_id(self._read(device_dir, "class"))[:4],
+            })
+        return {"PCI Devices": devices}
+
+    def _pci_device_name(self, vendor_id: str, device_id: str) -> str:
+        """Looks the device up in the system's pci.ids, streaming the file rather than loading it."""
+        vendor_name = PCI_VENDOR_NAMES.get(vendor_id, vendor_id)
+        for pci_ids in PCI_IDS_PATHS:
+            try:
+                with open_file(self._path(pci_ids), "r", encoding="utf-8", errors="replace") as file:
+                    in_vendor = False
+                    for line in file:
+                        if line.startswith(vendor_id + "  "):
+                            in_vendor = True
+                            vendor_name = PCI_VENDOR_NAMES.get(vendor_id, line[6:].strip())
+                        elif in_vendor and line.startswith("\t" + device_id + "  "):
+                            return f"{vendor_name} {line[7:].strip()}"
+                        elif in_vendor and line[:1] not in ("\t", "#", "\n"):
+                            break
+            except OSError:
+                continue
+        return f"{vendor_name} Device {device_id}"
+
+def _hex_id(value: Optional[str]) -> str:
+    """"0x10DE" -> "10de"; "" when sysfs didn't have the attribute."""
+    return (value or "").lower().replace("0x", "")
@@ -0,0 +1,97 @@
+import os
+import platform
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional
+
+# Top-level keys of the `_hardware_details` schema each probe section is responsible for.
+SECTION_KEYS: Dict[str, tuple] = {
+    "System": ("Manufacturer", "System Architecture", "Total RAM"),
+    "CPU": ("CPU Name", "Number of Cores", "Number of Logical Processors", "Clock Speed", "CPU Architecture"),
+    "GPU": ("GPU", "GPUs"),
+    "RAM": ("RAM Details",),
+    "Storage": ("Storage",),
+    "PCI": ("PCI Devices",),
+}
+
+def is_windows() -> bool:
+    """Checks if the current OS is Windows."""
+    return platform.system().lower() == "windows"
+
+def convert_bytes_to_mb(size_in_bytes: Optional[int]) -> float:
+    """Converts bytes to MB (2^20 bytes = 1 megabyte)."""
+    return 0.0 if not size_in_bytes else round(int(size_in_bytes) / (1024 * 1024), 2)
+
+class ProbeBackend(ABC):
+    """Source of hardware details.
+
+    Every probe returns the part of the `_hardware_details` schema listed for its
+    section in SECTION_KEYS, so HardwareInfo and HardwareClassifier don't care which
+    backend produced the data. Probes may run concurrently on different threads.
+    """
+    name = "base"
+
+    @property
+    def identity(self) -> str:
+        """What the results depend on besides the machine, so ProbeCache can tell them apart."""
+        return self.name
+
+    @abstractmethod
+    def system_info(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def cpu_info(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def gpu_info(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def ram_info(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def storage_info(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def pci_info(self) -> Dict[str, Any]:
+        """PCI devices as {"Vendor ID", "Device ID", "Class"} maps of lower-case hex
+        strings ("10de", "1c82", "0300": base class and subclass), plus "Name" when the
+        platform knows one."""
+
+    def warm_up(self) -> None:
+        """Does slow one-off setup ahead of the first probe; nothing by default."""
+
+    def sections(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """Independent probes, keyed by the section name reported to QML."""
+        return {
+            "System": self.system_info,
+            "CPU": self.cpu_info,
+            "GPU": self.gpu_info,
+            "RAM": self.ram_info,
+            "Storage": self.storage_info,
+            "PCI": self.pci_info,
+        }
+
+def create_backend(name: Optional[str] = None) -> ProbeBackend:
+    """Builds the backend selected by `name` or the WIN2LINUX_HW_BACKEND environment variable.
+
+    Defaults to WMI on Windows and procfs/sysfs elsewhere. The replay backend reads the
+    fixture named by WIN2LINUX_HW_FIXTURE.
+    """
+    name = (name or os.environ.get("WIN2LINUX_HW_BACKEND") or ("wmi" if is_windows() else "linux")).lower()
+    if name == "wmi":
+        from hardware_analysis.WmiBackend import WmiBackend
+        return WmiBackend()
+    if name == "linux":
+        from hardware_analysis.LinuxBackend import LinuxBackend
+        return LinuxBackend()
+    if name == "replay":
+        from hardware_analysis.ReplayBackend import ReplayBackend
+        fixture = os.environ.get("WIN2LINUX_HW_FIXTURE")
+        if not fixture:
+            raise ValueError("The replay backend needs WIN2LINUX_HW_FIXTURE to point at a recorded hardware dump.")
+        return ReplayBackend(fixture)
+    raise ValueError(f"Unknown hardware probe backend '{name}'.")
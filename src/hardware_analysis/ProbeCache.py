@@ -0,0 +1,62 @@
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Optional
+from tracing import open_file
+
+DEFAULT_TTL = 24 * 60 * 60
+# Bump when the layout of the cached details changes, so older entries are re-probed.
+SCHEMA_VERSION = 1
+
+def ttl_from_environment() -> float:
+    value = os.environ.get("WIN2LINUX_HW_CACHE_TTL")
+    if value is None:
+        return DEFAULT_TTL
+    try:
+        return float(value)
+    except ValueError:
+        logging.warning(f"Ignoring invalid WIN2LINUX_HW_CACHE_TTL '{value}'; using {DEFAULT_TTL} seconds.")
+        return DEFAULT_TTL
+
+class ProbeCache:
+    """On-disk cache of probe results so repeated launches skip re-probing.
+
+    Entries expire after `ttl` seconds (WIN2LINUX_HW_CACHE_TTL overrides the default,
+    0 disables the cache) and are tied to the backend that produced them, by its
+    `identity`, and to SCHEMA_VERSION.
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        self.path = path
+        if ttl is None:
+            ttl = ttl_from_environment()
+        self.ttl = ttl
+
+    def load(self, backend_identity: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached hardware details if they are fresh and from `backend_identity`."""
+        if self.ttl <= 0:
+            return None
+        try:
+            with open_file(self.path, "r") as file:
+                entry = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("version") != SCHEMA_VERSION:
+            return None
+        if entry.get("backend") != backend_identity or time.time() - entry.get("timestamp", 0) > self.ttl:
+            return None
+        return entry.get("details")
+
+    def store(self, backend_identity: str, details: Dict[str, Any]) -> None:
+        if self.ttl <= 0:
+            return
+        entry = {"version": SCHEMA_VERSION, "backend": backend_identity, "timestamp": time.time(), "details": details}
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open_file(tmp_path, "w") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Couldn't write hardware probe cache '{self.path}': {e}")
@@ -0,0 +1,47 @@
+import hashlib
+import json
+import os
+from typing import Any, Dict
+from hardware_analysis.ProbeBackend import SECTION_KEYS, ProbeBackend
+from tracing import open_file
+
+class ReplayBackend(ProbeBackend):
+    """Replays a recorded hardware dump, such as a saved hardware_info.json.
+
+    Lets the hardware path run and be profiled on machines whose real hardware is
+    irrelevant, e.g. CI boxes or systems that already run Linux.
+    """
+    name = "replay"
+
+    def __init__(self, fixture_path: str):
+        self._fixture_path = os.path.abspath(fixture_path)
+        with open_file(fixture_path, "rb") as file:
+            content = file.read()
+        self._recorded: Dict[str, Any] = json.loads(content)
+        # Re-recording the fixture in place must not replay probes cached from the old one.
+        self._content_hash = hashlib.sha256(content).hexdigest()
+
+    @property
+    def identity(self) -> str:
+        return f"{self.name}:{self._fixture_path}:{self._content_hash}"
+
+    def _section(self, section: str) -> Dict[str, Any]:
+        return {key: self._recorded[key] for key in SECTION_KEYS[section] if key in self._recorded}
+
+    def system_info(self) -> Dict[str, Any]:
+        return self._section("System")
+
+    def cpu_info(self) -> Dict[str, Any]:
+        return self._section("CPU")
+
+    def gpu_info(self) -> Dict[str, Any]:
+        return self._section("GPU")
+
+    def ram_info(self) -> Dict[str, Any]:
+        return self._section("RAM")
+
+    def storage_info(self) -> Dict[str, Any]:
+        return self._section("Storage")
+
+    def pci_info(self) -> Dict[str, Any]:
+        return self._section("PCI")
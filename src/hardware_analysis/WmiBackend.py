@@ -0,0 +1,142 @@
+import functools
+import platform
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+import psutil
+from hardware_analysis.ProbeBackend import ProbeBackend, convert_bytes_to_mb, is_windows
+
+class WmiBackend(ProbeBackend):
+    """Windows probes backed by WMI and psutil."""
+    name = "wmi"
+
+    def __init__(self):
+        if not is_windows():
+            raise SystemError("This script is designed for Windows only.")
+        self._thread_state = threading.local()
+
+    def warm_up(self) -> None:
+        """Imports the COM and WMI modules; the connections themselves are per-thread."""
+        import pythoncom
+        import wmi
+
+    def sections(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        return {section: self._in_com_apartment(probe) for section, probe in super().sections().items()}
+
+    def _in_com_apartment(self, probe: Callable[[], Dict[str, Any]]) -> Callable[[], Dict[str, Any]]:
+        """Runs `probe` with COM initialised on the calling thread, releasing its WMI
+        connection and uninitialising COM again before the pool thread is reused or exits."""
+        @functools.wraps(probe)
+        def run() -> Dict[str, Any]:
+            import pythoncom
+            pythoncom.CoInitialize()
+            try:
+                return probe()
+            finally:
+                self._thread_state.wmi_client = None
+                pythoncom.CoUninitialize()
+        return run
+
+    @property
+    def _wmi_client(self):
+        """Per-thread WMI connection; COM objects can't be shared between threads."""
+        client = getattr(self._thread_state, "wmi_client", None)
+        if client is None:
+            import wmi
+            client = wmi.WMI()
+            self._thread_state.wmi_client = client
+        return client
+
+    def system_info(self) -> Dict[str, Any]:
+        """Collects system details."""
+        details: Dict[str, Any] = {}
+        for item in self._wmi_client.Win32_ComputerSystem():
+            details["Manufacturer"] = item.Manufacturer
+            details["System Architecture"] = item.SystemType.lower()
+            details["Total RAM"] = convert_bytes_to_mb(psutil.virtual_memory().total)
+        return details
+
+    def storage_info(self) -> Dict[str, Any]:
+        """Collects Storage details."""
+        storage = []
+        for disk in self._wmi_client.Win32_DiskDrive():
+            storage.append({
+                "Model": disk.Model,
+                "Size (GB)": round(int(disk.Size) / (1024**3), 2) if disk.Size else "Unknown",
+                "Interface": disk.InterfaceType,
+                "Type": "SSD" if "SSD" in disk.Model.upper() else "HDD"
+            })
+        return {"Storage": storage}
+
+    def ram_info(self) -> Dict[str, Any]:
+        """Collects RAM details."""
+        ram_details = []
+        for ram in self._wmi_client.Win32_PhysicalMemory():
+            ram_details.append({
+                "Capacity (GB)": round(int(ram.Capacity) / (1024**3), 2),
+                "Speed (MHz)": ram.Speed,
+                "Type": ram.MemoryType
+            })
+        return {"RAM Details": ram_details}
+
+    def cpu_info(self) -> Dict[str, Any]:
+        """Collects CPU details."""
+        details: Dict[str, Any] = {}
+        cpu_info = psutil.cpu_freq()
+        for cpu in self._wmi_client.Win32_Processor():
+            details["CPU Name"] = cpu.Name
+            details["Number of Cores"] = psutil.cpu_count(logical=False)
+            details["Number of Logical Processors"] = psutil.cpu_count(logical=True)
+            details["Clock Speed"] = f"{cpu_info.max:.2f} MHz" if cpu_info and cpu_info.max else f"{cpu.MaxClockSpeed} MHz"
+            details["CPU Architecture"] = platform.architecture()[0]
+        return details
+
+    def gpu_info(self) -> Dict[str, Any]:
+        """Collects GPU details."""
+        gpus = self._wmi_client.Win32_VideoController()
+        if not gpus:
+            return {"GPU": "Not Available"}
+
+        details = [
+            {
+                "GPU Name": gpu.Name,
+                "GPU Memory": convert_bytes_to_mb(gpu.AdapterRAM),
+                **{key: value for key, value in parse_pnp_device_id(gpu.PNPDeviceID).items() if key != "Class"},
+            }
+            for gpu in gpus
+        ]
+        if len(details) == 1:
+            return {"GPU": details[0]}
+        return {"GPUs": details}
+
+    def pci_info(self) -> Dict[str, Any]:
+        """Collects the IDs of every PCI device Plug and Play knows about."""
+        devices = []
+        entities = self._wmi_client.query(
+            "SELECT Name, PNPDeviceID, CompatibleID FROM Win32_PnPEntity WHERE PNPDeviceID LIKE 'PCI\\\\%'"
+        )
+        for entity in entities:
+            ids = parse_pnp_device_id(entity.PNPDeviceID, entity.CompatibleID)
+            if ids:
+                devices.append({**ids, "Name": entity.Name or ""})
+        return {"PCI Devices": devices}
+
+_PNP_IDS = re.compile(r"VEN_([0-9A-F]{4})&DEV_([0-9A-F]{4})", re.IGNORECASE)
+_PNP_CLASS = re.compile(r"CC_([0-9A-F]{4})", re.IGNORECASE)
+
+def parse_pnp_device_id(pnp_device_id: Optional[str], compatible_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """Vendor, device and class IDs of a PCI Plug and Play ID such as
+    PCI\\VEN_10DE&DEV_1C82&SUBSYS_...; the class comes from a compatible ID like
+    PCI\\CC_030000. Empty when `pnp_device_id` isn't a PCI device."""
+    match = _PNP_IDS.search(pnp_device_id or "")
+    if not match or not (pnp_device_id or "").upper().startswith("PCI\\"):
+        return {}
+    ids = {"Vendor ID": match.group(1).lower(), "Device ID": match.group(2).lower()}
+    for compatible_id in compatible_ids or ():
+        class_match = _PNP_CLASS.search(compatible_id or "")
+        if class_match:
+            ids["Class"] = class_match.group(1).lower()
+            break
+    else:
+        ids["Class"] = ""
+    return ids
@@ -1,21 +1,51 @@
+import time
+LAUNCHED_AT = time.perf_counter()
+
+import argparse
 import sys
 import signal
 import os
 from PySide6.QtWidgets import QApplication
 from PySide6.QtQml import QQmlApplicationEngine
 from PySide6.QtCore import QUrl
-from backend.questionnaire.questionnaire import QuestionnaireModel
-from backend.recomendationModel.recommender import Recommender
-from hardware_analysis.HardwareInfo import HardwareInfo
-from hardware_analysis.HardwareClassifier import HardwareClassifier
+from startup import StartupProfiler, StartupWarmup
+IMPORTED_AT = time.perf_counter()
 
 def resource_path(relative_path):
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+def parse_arguments(argv):
+    """Splits our own options from the ones meant for Qt."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print import, construction and first-frame timings to stderr")
+    parser.add_argument("--eager-startup", action="store_true",
+                        help="initialise every backend before loading the UI instead of after the first frame")
+    parser.add_argument("--exit-after-startup", action="store_true",
+                        help="quit as soon as startup has finished, for benchmarking")
+    return parser.parse_known_args(argv[1:])
+
+def load_scoring_model():
+    from backend.recomendationModel.scoring_model import load_scoring_model
+    return load_scoring_model()
+
+def load_ranking_table():
+    from backend.recomendationModel.ranking_table import load_ranking_table
+    return load_ranking_table()
+
+def load_gpu_tier_table():
+    from hardware_analysis.GpuTiers import get_gpu_tier_table
+    return get_gpu_tier_table()
+
 def main():
-    app = QApplication(sys.argv)
+    args, qt_args = parse_arguments(sys.argv)
+    profiler = StartupProfiler(args.startup_profile, start=LAUNCHED_AT)
+    profiler.record("import PySide6", LAUNCHED_AT, IMPORTED_AT)
+
+    with profiler.measure("create QApplication"):
+        app = QApplication(sys.argv[:1] + qt_args)
     
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     
@@ -49,26 +79,80 @@ def main():
     print("QML import paths:")
     for path in import_paths:
         print(f"  {path}")
-    
-    url = QUrl.fromLocalFile(resource_path("qml/main.qml"))
-    print(f"Loading QML from: {url.toLocalFile()}")
-    engine.load(url)
 
-    questionnaire_model = QuestionnaireModel()
-    recommender_model = Recommender()
-    hardware_info = HardwareInfo()
-    hardware_classifier = HardwareClassifier()
+    # The backend modules stay light to import and construct: NumPy, the scoring model
+    # and the hardware probe backend are loaded by `warmup` once the first frame is up,
+    # or on first use if the user gets there first.
+    with profiler.measure("import backends"):
+        from backend.questionnaire.questionnaire import QuestionnaireModel
+        from backend.questionnaire.response_store import ResponseStore
+        from backend.recomendationModel.recommender import Recommender
+        from hardware_analysis.HardwareInfo import HardwareInfo
+        from hardware_analysis.HardwareClassifier import HardwareClassifier
+        from hardware_analysis.DriverSupport import DriverSupport
+        from backend.profiling.trace_stats import TraceStats
+        from backend.softwareAlternatives.software_alternatives import SoftwareAlternatives
+        from tracing import tracer
 
+    with profiler.measure("construct backends"):
+        response_store = ResponseStore()
+        questionnaire_model = QuestionnaireModel(response_store)
+        recommender_model = Recommender(response_store, questions=questionnaire_model.questions)
+        hardware_info = HardwareInfo()
+        hardware_classifier = HardwareClassifier()
+        driver_support = DriverSupport()
+        trace_stats = TraceStats()
+        software_alternatives = SoftwareAlternatives()
+
+    # Registered before loading so the first frame already binds to the real objects.
     engine.rootContext().setContextProperty("questionnaireModel", questionnaire_model)
     engine.rootContext().setContextProperty("recommenderModel", recommender_model)
     engine.rootContext().setContextProperty("hardwareInfo", hardware_info)
     engine.rootContext().setContextProperty("hardwareClassifier", hardware_classifier)
+    engine.rootContext().setContextProperty("driverSupport", driver_support)
+    engine.rootContext().setContextProperty("traceStats", trace_stats)
+    engine.rootContext().setContextProperty("softwareAlternatives", software_alternatives)
+    hardware_info.dataUpdated.connect(driver_support.update_hardware)
+    app.aboutToQuit.connect(questionnaire_model.flush_responses)
+    if tracer.enabled:
+        app.aboutToQuit.connect(lambda: print(f"Trace written to {tracer.export_chrome_trace()}"))
+
+    with profiler.measure("register image provider"):
+        from backend.imageProvider.image_provider import AssetImageProvider
+        engine.addImageProvider("assets", AssetImageProvider(thumbnail_dir=resource_path("thumbnail_cache")))
+
+    warmup = StartupWarmup([
+        ("load scoring model", load_scoring_model),
+        ("load ranking table", load_ranking_table),
+        ("load GPU tier table", load_gpu_tier_table),
+        ("set up hardware backend", hardware_info.warm_up),
+        ("load driver database", driver_support.warm_up),
+        ("load software alternatives", software_alternatives.warm_up),
+    ], profiler)
+
+    def on_warmed_up():
+        with profiler.measure("build recommender state"):
+            recommender_model.model
+        profiler.report()
+        if args.exit_after_startup:
+            app.quit()
+
+    warmup.finished.connect(on_warmed_up)
+    if args.eager_startup:
+        warmup.run()
+
+    url = QUrl.fromLocalFile(resource_path("qml/main.qml"))
+    print(f"Loading QML from: {url.toLocalFile()}")
+    with profiler.measure("load QML"):
+        engine.load(url)
     
     if len(engine.rootObjects()) == 0:
         print("Failed to load QML application!")
         sys.exit(-1)
 
+    engine.rootObjects()[0].frameSwapped.connect(warmup.first_frame)
+
     return app.exec()
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -12,4 +12,10 @@ Kirigami.ApplicationWindow {
     height: minimumHeight * 1.5
 
     pageStack.initialPage: Qt.createComponent("pages/welcomePage.qml")
+
+    footer: Loader {
+        active: traceStats.enabled
+        visible: active
+        source: "pages/traceStats.qml"
+    }
 }
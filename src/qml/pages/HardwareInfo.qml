@@ -23,9 +23,11 @@ Kirigami.Page {
             spacing: Kirigami.Units.largeSpacing
 
             Image {
-                source: "../../../assets/logo-150x150.png"
+                source: "image://assets/logo-150x150.png"
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 3
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 3
+                sourceSize.width: Kirigami.Units.gridUnit * 3
+                sourceSize.height: Kirigami.Units.gridUnit * 3
             }
 
             ColumnLayout {
@@ -82,13 +84,21 @@ Kirigami.Page {
                     }
 
                     contentItem: Controls.Label {
-                        text: qsTr("Scan Hardware")
+                        text: hardwareInfo.collecting ? qsTr("Cancel Scan") : qsTr("Scan Hardware")
                         horizontalAlignment: Text.AlignHCenter
                         verticalAlignment: Text.AlignVCenter
                         color: "#000000"
                     }
 
-                    onClicked: hardwareInfo.collect_hardware_info()
+                    onClicked: {
+                        if (hardwareInfo.collecting) {
+                            hardwareInfo.cancel_collection()
+                        } else {
+                            outputArea.text = qsTr("Scanning hardware...")
+                            hardwarePage.hardwareInfoCollected = false
+                            hardwareInfo.collect_hardware_info()
+                        }
+                    }
                 }
 
                 // Results area in a scrollable container
@@ -220,6 +230,17 @@ Kirigami.Page {
         // Connections to update the text area
         Connections {
             target: hardwareInfo
+            function onSectionCollected(section, jsonData) {
+                outputArea.text += "\n\n" + section + ":\n" + jsonData
+            }
+            function onSectionFailed(section, reason) {
+                outputArea.text += "\n\n" + section + ": " + reason
+            }
+            function onCollectionFinished(completed) {
+                if (!completed) {
+                    outputArea.text += "\n\n" + qsTr("Scan cancelled.")
+                }
+            }
             function onDataUpdated(jsonData) {
                 outputArea.text = jsonData
                 hardwarePage.hardwareVector = hardwareClassifier.classify_hardware()
@@ -5,109 +5,140 @@ import org.kde.kirigami as Kirigami
 
 Kirigami.Page {
     id: appsPage
-    title: qsTr("Our Renowned Apps")
+    title: qsTr("Software Alternatives")
     padding: 0
 
+    readonly property bool hasMatches: softwareAlternatives.matchedCount > 0
+
+    Component.onCompleted: softwareAlternatives.scan_installed_programs()
+
     ColumnLayout {
         anchors.fill: parent
         anchors.margins: Kirigami.Units.gridUnit * 2
         spacing: Kirigami.Units.gridUnit * 2
 
         Controls.Label {
-            text: qsTr("Packed with our KDE desktop and available to all Linux users, we ship a large variety of free and powerful applications that cater to a wide range of use cases!")
+            text: appsPage.hasMatches
+                  ? qsTr("%1 of the %2 programs installed on this PC have Linux alternatives:")
+                        .arg(softwareAlternatives.matchedCount).arg(softwareAlternatives.installedCount)
+                  : qsTr("Packed with our KDE desktop and available to all Linux users, we ship a large variety of free and powerful applications that cater to a wide range of use cases!")
             wrapMode: Text.WordWrap
             Layout.fillWidth: true
             Layout.alignment: Qt.AlignHCenter
             horizontalAlignment: Text.AlignHCenter
         }
 
+        Controls.Label {
+            Layout.alignment: Qt.AlignHCenter
+            visible: softwareAlternatives.scanning
+            opacity: 0.7
+            text: qsTr("Looking for alternatives to your installed programs...")
+        }
+
         GridLayout {
             Layout.alignment: Qt.AlignHCenter
+            visible: !appsPage.hasMatches
             columns: 2
             rowSpacing: Kirigami.Units.gridUnit * 3
             columnSpacing: Kirigami.Units.gridUnit * 6
 
-            // Kdenlive
-            ColumnLayout {
-                spacing: Kirigami.Units.smallSpacing
-                Image {
-                    source: "../../../assets/kdenlive.png"
-                    Layout.preferredWidth: Kirigami.Units.gridUnit * 3
-                    Layout.preferredHeight: Kirigami.Units.gridUnit * 3
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Kdenlive"
-                    font.weight: Font.Bold
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Video editor"
-                    opacity: 0.7
-                    Layout.alignment: Qt.AlignHCenter
-                }
-            }
+            Repeater {
+                model: appsPage.hasMatches ? [] : softwareAlternatives.featured
 
-            // Krita
-            ColumnLayout {
-                spacing: Kirigami.Units.smallSpacing
-                Image {
-                    source: "../../../assets/krita.png"
-                    Layout.preferredWidth: Kirigami.Units.gridUnit * 3
-                    Layout.preferredHeight: Kirigami.Units.gridUnit * 3
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Krita"
-                    font.weight: Font.Bold
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Digital art"
-                    opacity: 0.7
-                    Layout.alignment: Qt.AlignHCenter
-                }
-            }
+                ColumnLayout {
+                    required property var modelData
+                    spacing: Kirigami.Units.smallSpacing
 
-            // Okular
-            ColumnLayout {
-                spacing: Kirigami.Units.smallSpacing
-                Image {
-                    source: "../../../assets/okular.png"
-                    Layout.preferredWidth: Kirigami.Units.gridUnit * 3
-                    Layout.preferredHeight: Kirigami.Units.gridUnit * 3
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Okular"
-                    font.weight: Font.Bold
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "PDF reader"
-                    opacity: 0.7
-                    Layout.alignment: Qt.AlignHCenter
+                    Image {
+                        source: modelData.icon ? "image://assets/" + modelData.icon : ""
+                        Layout.preferredWidth: Kirigami.Units.gridUnit * 3
+                        Layout.preferredHeight: Kirigami.Units.gridUnit * 3
+                        sourceSize.width: Kirigami.Units.gridUnit * 3
+                        sourceSize.height: Kirigami.Units.gridUnit * 3
+                        Layout.alignment: Qt.AlignHCenter
+                    }
+                    Controls.Label {
+                        text: modelData.name
+                        font.weight: Font.Bold
+                        Layout.alignment: Qt.AlignHCenter
+                    }
+                    Controls.Label {
+                        text: modelData.description
+                        opacity: 0.7
+                        Layout.alignment: Qt.AlignHCenter
+                    }
                 }
             }
+        }
 
-            // KDE Connect
-            ColumnLayout {
+        Kirigami.ScrollablePage {
+            Layout.fillWidth: true
+            Layout.fillHeight: true
+            visible: appsPage.hasMatches
+            contentWidth: availableWidth
+
+            ListView {
+                id: alternativesList
+                width: parent.width
+                clip: true
+                model: softwareAlternatives.alternativesModel
                 spacing: Kirigami.Units.smallSpacing
-                Image {
-                    source: "../../../assets/kdeConnect.png"
-                    Layout.preferredWidth: Kirigami.Units.gridUnit * 3
-                    Layout.preferredHeight: Kirigami.Units.gridUnit * 3
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "KDE Connect"
-                    font.weight: Font.Bold
-                    Layout.alignment: Qt.AlignHCenter
-                }
-                Controls.Label {
-                    text: "Device Sync"
-                    opacity: 0.7
-                    Layout.alignment: Qt.AlignHCenter
+                reuseItems: true
+
+                delegate: Kirigami.AbstractCard {
+                    id: alternativeCard
+                    required property string program
+                    required property string windowsName
+                    required property string category
+                    required property var alternatives
+                    width: ListView.view.width
+                    padding: Kirigami.Units.largeSpacing
+
+                    contentItem: RowLayout {
+                        spacing: Kirigami.Units.largeSpacing
+
+                        ColumnLayout {
+                            Layout.preferredWidth: Kirigami.Units.gridUnit * 14
+                            Layout.alignment: Qt.AlignTop
+                            spacing: 0
+
+                            Controls.Label {
+                                Layout.fillWidth: true
+                                text: alternativeCard.program
+                                font.bold: true
+                                elide: Text.ElideRight
+                            }
+
+                            Controls.Label {
+                                Layout.fillWidth: true
+                                text: alternativeCard.category
+                                opacity: 0.7
+                                elide: Text.ElideRight
+                            }
+                        }
+
+                        Flow {
+                            Layout.fillWidth: true
+                            spacing: Kirigami.Units.largeSpacing
+
+                            Repeater {
+                                model: alternativeCard.alternatives
+
+                                Controls.ToolButton {
+                                    required property var modelData
+                                    text: modelData.name
+                                    icon.source: modelData.icon ? "image://assets/" + modelData.icon : ""
+                                    display: Controls.AbstractButton.TextBesideIcon
+                                    enabled: modelData.website !== ""
+
+                                    Controls.ToolTip.visible: hovered && modelData.description !== ""
+                                    Controls.ToolTip.text: modelData.description
+
+                                    onClicked: Qt.openUrlExternally(modelData.website)
+                                }
+                            }
+                        }
+                    }
                 }
             }
         }
@@ -174,6 +205,7 @@ Kirigami.Page {
         // Spacer
         Item {
             Layout.fillHeight: true
+            visible: !appsPage.hasMatches
         }
     }
 }
\ No newline at end of file
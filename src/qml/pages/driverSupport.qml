@@ -8,6 +8,25 @@ Kirigami.Page {
     title: qsTr("Win2Linux")
     font.weight: 700
     padding: 0
+
+    readonly property var statusTexts: ({
+        "supported": qsTr("Supported out of the box"),
+        "firmware": qsTr("Supported, needs non-free firmware"),
+        "proprietary": qsTr("Works best with the vendor's driver"),
+        "legacy": qsTr("Only legacy drivers"),
+        "unsupported": qsTr("No Linux driver"),
+        "unknown": qsTr("Unknown")
+    })
+    readonly property var statusIcons: ({
+        "supported": "emblem-success",
+        "firmware": "emblem-information",
+        "proprietary": "emblem-warning",
+        "legacy": "emblem-warning",
+        "unsupported": "emblem-error",
+        "unknown": "emblem-question"
+    })
+
+    Component.onCompleted: driverSupport.check_drivers()
     
     ColumnLayout {
         anchors.fill: parent
@@ -19,9 +38,11 @@ Kirigami.Page {
             spacing: Kirigami.Units.largeSpacing
 
             Image {
-                source: "../../../assets/logo-150x150.png"
+                source: "image://assets/logo-150x150.png"
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 3
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 3
+                sourceSize.width: Kirigami.Units.gridUnit * 3
+                sourceSize.height: Kirigami.Units.gridUnit * 3
             }
 
             ColumnLayout {
@@ -47,7 +68,64 @@ Kirigami.Page {
                 width: parent.width
                 spacing: Kirigami.Units.gridUnit
                 anchors.margins: Kirigami.Units.gridUnit * 3
-                
+
+                Kirigami.Heading {
+                    text: qsTr("Your Devices on Linux")
+                    level: 1
+                    Layout.topMargin: Kirigami.Units.gridUnit
+                }
+
+                Controls.Label {
+                    text: driverSupport.deviceCount === 0
+                        ? qsTr("Scan your hardware on the hardware page to see how well Linux supports each of your devices.")
+                        : driverSupport.attentionCount === 0
+                            ? qsTr("All %1 devices have drivers built into Linux.").arg(driverSupport.deviceCount)
+                            : qsTr("%1 of your %2 devices need attention:").arg(driverSupport.attentionCount).arg(driverSupport.deviceCount)
+                    wrapMode: Text.WordWrap
+                    Layout.fillWidth: true
+                }
+
+                Repeater {
+                    model: driverSupport.devicesModel
+
+                    delegate: RowLayout {
+                        required property string name
+                        required property string vendor
+                        required property string status
+                        required property string driver
+                        required property string note
+
+                        spacing: Kirigami.Units.smallSpacing
+                        Layout.fillWidth: true
+
+                        Kirigami.Icon {
+                            source: nvidiaInfoPage.statusIcons[status]
+                            Layout.preferredWidth: Kirigami.Units.iconSizes.small
+                            Layout.preferredHeight: Kirigami.Units.iconSizes.small
+                            Layout.alignment: Qt.AlignTop
+                        }
+
+                        ColumnLayout {
+                            spacing: 0
+                            Layout.fillWidth: true
+
+                            Controls.Label {
+                                text: vendor + " " + name
+                                wrapMode: Text.WordWrap
+                                Layout.fillWidth: true
+                            }
+
+                            Controls.Label {
+                                text: nvidiaInfoPage.statusTexts[status] + (driver ? " (" + driver + ")" : "") + (note ? ". " + note : "")
+                                color: Kirigami.Theme.disabledTextColor
+                                font.weight: Font.Normal
+                                wrapMode: Text.WordWrap
+                                Layout.fillWidth: true
+                            }
+                        }
+                    }
+                }
+
                 Kirigami.Heading {
                     text: qsTr("Understanding Nvidia Drivers on Linux")
                     level: 1
@@ -52,17 +52,21 @@ Kirigami.Page {
 
                 Image {
                     id: konqiImage
-                    source: "../../../assets/konqi.png"  
+                    source: "image://assets/konqi.png"  
                     width: Kirigami.Units.gridUnit * 6
                     height: width
+                    sourceSize.width: Kirigami.Units.gridUnit * 6
+                    sourceSize.height: Kirigami.Units.gridUnit * 6
                     fillMode: Image.PreserveAspectFit
                 }
 
                 Image {
                     id: katieImage
-                    source: "../../../assets/katie.png"  
+                    source: "image://assets/katie.png"  
                     width: Kirigami.Units.gridUnit * 6
                     height: width
+                    sourceSize.width: Kirigami.Units.gridUnit * 6
+                    sourceSize.height: Kirigami.Units.gridUnit * 6
                     fillMode: Image.PreserveAspectFit
                 }
             }
@@ -5,10 +5,10 @@ import org.kde.kirigami as Kirigami
 
 Kirigami.Page {
     function allQuestionsAnswered() {
-    return questionnaireModel.currentIndex === questionnaireModel.questions.length - 1
+    return questionnaireModel.currentIndex === questionnaireModel.questionCount - 1
 }
     id: questionnairePage
-    title: qsTr("Question " + (questionnaireModel.currentIndex + 1) + "/" + questionnaireModel.questions.length)
+    title: qsTr("Question " + (questionnaireModel.currentIndex + 1) + "/" + questionnaireModel.questionCount)
     padding: 0
 
     ColumnLayout {
@@ -21,9 +21,11 @@ Kirigami.Page {
             spacing: Kirigami.Units.largeSpacing
 
             Image {
-                source: "../../../assets/logo-150x150.png"
+                source: "image://assets/logo-150x150.png"
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 3
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 3
+                sourceSize.width: Kirigami.Units.gridUnit * 3
+                sourceSize.height: Kirigami.Units.gridUnit * 3
             }
 
             ColumnLayout {
@@ -47,13 +49,13 @@ Kirigami.Page {
                 spacing: Kirigami.Units.gridUnit
 
                 Kirigami.Heading {
-                    text: qsTr("Question " + (questionnaireModel.currentIndex + 1) + "/" + questionnaireModel.questions.length)
+                    text: qsTr("Question " + (questionnaireModel.currentIndex + 1) + "/" + questionnaireModel.questionCount)
                     level: 2
                     Layout.alignment: Qt.AlignLeading
                 }
 
                 Controls.Label {
-                    text: questionnaireModel.questions[questionnaireModel.currentIndex].description
+                    text: questionnaireModel.currentQuestion.description
                     font.pixelSize: Kirigami.Theme.defaultFont.pixelSize * 1.1
                     Layout.fillWidth: true
                     wrapMode: Text.Wrap 
@@ -71,17 +73,18 @@ Kirigami.Page {
                         spacing: Kirigami.Units.smallSpacing
 
                         Repeater {
-                            model: Object.keys(questionnaireModel.questions[questionnaireModel.currentIndex].options)
+                            id: optionsRepeater
+                            model: questionnaireModel.currentOptions
                             delegate: Controls.RadioButton {
-                                text:  questionnaireModel.questions[questionnaireModel.currentIndex].options[modelData]
+                                text: modelData.text
                                 Controls.ButtonGroup.group: optionsGroup
                                 Layout.fillWidth: true
-                                KeyNavigation.tab: index === model.length - 1 ? prevButton : null
-                                checked: questionnaireModel.responses[String(questionnaireModel.questions[questionnaireModel.currentIndex].id)] === modelData
+                                KeyNavigation.tab: index === optionsRepeater.count - 1 ? prevButton : null
+                                checked: questionnaireModel.currentAnswer === modelData.optionId
                                 focus: index === 0
 
                                 onClicked: {
-                                    questionnaireModel.setResponse(questionnaireModel.currentIndex,modelData)
+                                    questionnaireModel.setResponse(questionnaireModel.currentIndex, modelData.optionId)
                                 }
                             }
                         }
@@ -133,18 +136,22 @@ Kirigami.Page {
             Grid {
                 id: indicatorGrid
                 Layout.alignment: Qt.AlignVCenter
-                columns: questionnaireModel.questions.length / 2 
+                columns: questionnaireModel.questionCount / 2 
                 spacing: Kirigami.Units.smallSpacing
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 5
                 KeyNavigation.tab: nextButton
 
                 Repeater {
-                    model: questionnaireModel.questions.length
+                    model: questionnaireModel.questionModel
                     delegate: Rectangle {
+                        required property int index
+                        required property bool current
+                        required property bool passed
+
                         width: Kirigami.Units.gridUnit * 2
                         height: Kirigami.Units.gridUnit * 2
-                        color: index === questionnaireModel.currentIndex ? "#96F948" : 
-                               index < questionnaireModel.currentIndex ? "#8CE743" : Kirigami.Theme.disabledTextColor
+                        color: current ? "#96F948" : 
+                               passed ? "#8CE743" : Kirigami.Theme.disabledTextColor
                         radius: width / 4
 
                         Controls.Label {
@@ -164,7 +171,7 @@ Kirigami.Page {
             // Next Button
             Controls.Button {
                 id: nextButton
-                enabled: questionnaireModel.currentIndex < questionnaireModel.questions.length - 1 || allQuestionsAnswered()
+                enabled: questionnaireModel.currentIndex < questionnaireModel.questionCount - 1 || allQuestionsAnswered()
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 7
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 3
                 Layout.alignment: Qt.AlignVCenter
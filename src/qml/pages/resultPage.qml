@@ -9,39 +9,37 @@ Kirigami.Page {
     property var hardwareVector: []
     padding: 0
 
-    ListModel {
-        id: rankingsModel
-    }
+    property bool skipMode: false
 
     // Define distro metadata for UI display
     property var distroInfo: {
         "kubuntu": {
-            logo: "../../../assets/kubuntu.png",
+            logo: "image://assets/kubuntu.png",
             features: ["Windows-like flow", "Seamless setup"],
             learnMore: "https://kubuntu.org/getkubuntu/"
         },
         "linux_mint_xfce": {
-            logo: "../../../assets/mint.png",
+            logo: "image://assets/mint.png",
             features: ["Old Hardware Support", "Excellent software support"],
             learnMore: "https://linuxmint.com/download.php"
         },
         "linux_mint_cinnamon": {
-            logo: "../../../assets/mint.png",
+            logo: "image://assets/mint.png",
             features: ["Big community", "Excellent software support"],
             learnMore: "https://linuxmint.com/download.php"
         },
         "fedora": {
-            logo: "../../../assets/fedora.png",
+            logo: "image://assets/fedora.png",
             features: ["Latest technologies", "Enterprise-backed"],
             learnMore: "https://getfedora.org/"
         },
         "pop_os": {
-            logo: "../../../assets/popos.png",
+            logo: "image://assets/popos.png",
             features: ["Great for developers", "Nvidia support"],
             learnMore: "https://pop.system76.com/"
         },
         "lubuntu": {
-            logo: "../../../assets/lubuntu.png",
+            logo: "image://assets/lubuntu.png",
             features: ["Great for developers", "Nvidia support"],
             learnMore: "https://pop.system76.com/"
         },
@@ -59,66 +57,21 @@ Kirigami.Page {
         }
     }
 
-    Connections {
-        target: recommenderModel
-        function onRankingsUpdated(rankings) {
-            rankingsModel.clear();
-            
-            for (var i = 0; i < rankings.length; i++) {
-                var distroId = rankings[i].distro.toLowerCase();
-                var metadata = distroInfo[distroId] || {
-                    logo: "../../../assets/distro.png",
-                    features: ["Linux distribution"],
-                    learnMore: ""
-                };
-                
-                rankingsModel.append({ 
-                    rank: i + 1,
-                    distro: rankings[i].distro.replace("_", " "),
-                    score: rankings[i].score,
-                    logo: metadata.logo,
-                    features: metadata.features,
-                    learnMore: metadata.learnMore
-                });
-            }
-        }
+    // Distro logos and highlights; everything else comes from recommenderModel.rankingsModel
+    function distroDetails(distroId) {
+        return distroInfo[distroId.toLowerCase()] || {
+            logo: "image://assets/distro.png",
+            features: ["Linux distribution"],
+            learnMore: ""
+        };
     }
 
     Component.onCompleted: {
-        // rankings without hardware info
-        if (skipMode) {
+        if (!skipMode && hardwareVector && hardwareVector.length > 0) {
+            recommenderModel.calculate_rankings(hardwareVector);
+        } else {
             recommenderModel.calculate_rankings();
         }
-        
-        // Hardcoded data if no rankings (will remove after complete testing)
-        if (rankingsModel.count === 0) {
-            // Sample data 
-            var sampleRankings = [
-                { distro: "kubuntu", score: 0.92 },
-                { distro: "lubuntu", score: 0.88 },
-                { distro: "linux_mint_xfce", score: 0.84 },
-                { distro: "pop_os", score: 0.80 },
-                { distro: "fedora", score: 0.75 }
-            ];
-            
-            for (var i = 0; i < sampleRankings.length; i++) {
-                var distroId = sampleRankings[i].distro.toLowerCase();
-                var metadata = distroInfo[distroId] || {
-                    logo: "../../../assets/distro.png",
-                    features: ["Linux distribution"],
-                    learnMore: ""
-                };
-                
-                rankingsModel.append({ 
-                    rank: i + 1,
-                    distro: sampleRankings[i].distro.replace("_", " "),
-                    score: sampleRankings[i].score,
-                    logo: metadata.logo,
-                    features: metadata.features,
-                    learnMore: metadata.learnMore
-                });
-            }
-        }
     }
 
     ColumnLayout {
@@ -131,9 +84,11 @@ Kirigami.Page {
             spacing: Kirigami.Units.largeSpacing
 
             Image {
-                source: "../../../assets/logo-150x150.png"
+                source: "image://assets/logo-150x150.png"
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 3
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 3
+                sourceSize.width: Kirigami.Units.gridUnit * 3
+                sourceSize.height: Kirigami.Units.gridUnit * 3
             }
 
             ColumnLayout {
@@ -169,10 +124,11 @@ Kirigami.Page {
                 id: verdictList
                 width: parent.width
                 clip: true
-                model: rankingsModel
+                model: recommenderModel.rankingsModel
                 spacing: Kirigami.Units.smallSpacing
                 
                 delegate: Kirigami.AbstractCard {
+                    readonly property var details: resultPage.distroDetails(model.distroId)
                     width: ListView.view.width
                     padding: Kirigami.Units.largeSpacing
                     
@@ -180,9 +136,11 @@ Kirigami.Page {
                         spacing: Kirigami.Units.largeSpacing
                         
                         Image {
-                            source: model.logo || "../../../assets/distro.png"
+                            source: details.logo
                             Layout.preferredWidth: Kirigami.Units.gridUnit * 4
                             Layout.preferredHeight: Kirigami.Units.gridUnit * 4
+                            sourceSize.width: Kirigami.Units.gridUnit * 4
+                            sourceSize.height: Kirigami.Units.gridUnit * 4
                             fillMode: Image.PreserveAspectFit
                         }
                         
@@ -194,7 +152,7 @@ Kirigami.Page {
                                 spacing: Kirigami.Units.smallSpacing
                                 
                                 Controls.Label {
-                                    text: "#" + model.rank
+                                    text: "#" + (index + 1)
                                     font.bold: true
                                     font.pixelSize: Kirigami.Theme.defaultFont.pixelSize * 1.2
                                 }
@@ -207,7 +165,7 @@ Kirigami.Page {
                             }
                             
                             Repeater {
-                                model: features
+                                model: details.features
                                 delegate: Controls.Label {
                                     text: "+ " + modelData
                                     visible: modelData !== undefined
@@ -215,14 +173,52 @@ Kirigami.Page {
                             }
                             
                             Controls.Label {
-                                text: "Learn more: " + model.learnMore
+                                text: "Learn more: " + (details.learnMore || model.website)
                                 font.italic: true
-                                visible: model.learnMore !== undefined && model.learnMore !== ""
+                                visible: (details.learnMore || model.website) !== ""
                                 Layout.topMargin: Kirigami.Units.smallSpacing
                             }
                         }
                     }
                 }
+
+                footer: ColumnLayout {
+                    width: verdictList.width
+                    spacing: Kirigami.Units.smallSpacing
+                    visible: verdictList.count > 0
+
+                    Kirigami.Heading {
+                        text: qsTr("What would change our top pick")
+                        level: 3
+                        Layout.topMargin: Kirigami.Units.gridUnit
+                    }
+
+                    Controls.Label {
+                        text: qsTr("None of your answers would change our top pick on its own.")
+                        visible: recommenderModel.flipCount === 0
+                        wrapMode: Text.Wrap
+                        Layout.fillWidth: true
+                    }
+
+                    Repeater {
+                        model: recommenderModel.whatIfModel
+
+                        delegate: Controls.Label {
+                            required property string questionText
+                            required property string optionText
+                            required property string topDistro
+                            required property bool flipsTop
+
+                            text: qsTr("Answering \"%1\" to \"%2\" would make %3 our top pick.")
+                                .arg(optionText)
+                                .arg(questionText)
+                                .arg(topDistro)
+                            visible: flipsTop
+                            wrapMode: Text.Wrap
+                            Layout.fillWidth: true
+                        }
+                    }
+                }
             }
         }
 
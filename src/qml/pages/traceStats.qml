@@ -0,0 +1,131 @@
+import QtQuick
+import QtQuick.Controls as Controls
+import QtQuick.Layouts
+import org.kde.kirigami as Kirigami
+
+// Rolling latency histograms of the traced slots, shown when WIN2LINUX_TRACE is set.
+ColumnLayout {
+    id: traceStatsPanel
+    spacing: 0
+
+    property bool expanded: false
+    readonly property real slowMs: 100
+
+    function formatMs(value) {
+        return value < 10 ? value.toFixed(2) : value.toFixed(0)
+    }
+
+    Kirigami.Separator {
+        Layout.fillWidth: true
+    }
+
+    RowLayout {
+        Layout.fillWidth: true
+        Layout.margins: Kirigami.Units.smallSpacing
+        spacing: Kirigami.Units.largeSpacing
+
+        Controls.ToolButton {
+            icon.name: traceStatsPanel.expanded ? "arrow-down" : "arrow-up"
+            text: qsTr("Trace")
+            display: Controls.AbstractButton.TextBesideIcon
+            onClicked: traceStatsPanel.expanded = !traceStatsPanel.expanded
+        }
+
+        Controls.Label {
+            Layout.fillWidth: true
+            elide: Text.ElideRight
+            text: traceStats.entries.length > 0
+                  ? qsTr("Slowest: %1, p95 %2 ms").arg(traceStats.entries[0].name).arg(traceStatsPanel.formatMs(traceStats.entries[0].p95Ms))
+                  : qsTr("No traced calls yet")
+        }
+
+        Controls.ToolButton {
+            icon.name: "document-save"
+            text: qsTr("Export")
+            onClicked: exportedLabel.text = traceStats.exportTrace()
+        }
+
+        Controls.ToolButton {
+            icon.name: "edit-clear-history"
+            text: qsTr("Reset")
+            onClicked: traceStats.reset()
+        }
+
+        Controls.Label {
+            id: exportedLabel
+            opacity: 0.7
+        }
+    }
+
+    ListView {
+        Layout.fillWidth: true
+        Layout.preferredHeight: traceStatsPanel.expanded ? Math.min(contentHeight, Kirigami.Units.gridUnit * 12) : 0
+        visible: traceStatsPanel.expanded
+        clip: true
+        model: traceStats.entries
+
+        delegate: RowLayout {
+            id: traceRow
+            required property var modelData
+            width: ListView.view.width
+            spacing: Kirigami.Units.largeSpacing
+
+            Controls.Label {
+                Layout.preferredWidth: Kirigami.Units.gridUnit * 14
+                Layout.leftMargin: Kirigami.Units.largeSpacing
+                elide: Text.ElideRight
+                text: modelData.name
+                color: modelData.p95Ms >= traceStatsPanel.slowMs ? Kirigami.Theme.negativeTextColor : Kirigami.Theme.textColor
+            }
+
+            Controls.Label {
+                Layout.preferredWidth: Kirigami.Units.gridUnit * 16
+                font.family: "monospace"
+                text: qsTr("%1x  p50 %2  p95 %3  max %4 ms")
+                      .arg(modelData.count)
+                      .arg(traceStatsPanel.formatMs(modelData.p50Ms))
+                      .arg(traceStatsPanel.formatMs(modelData.p95Ms))
+                      .arg(traceStatsPanel.formatMs(modelData.maxMs))
+            }
+
+            // One bar per bucket of traceStats.bucketEdges, scaled to the fullest bucket.
+            Row {
+                Layout.fillWidth: true
+                Layout.preferredHeight: Kirigami.Units.gridUnit
+                spacing: 1
+
+                Repeater {
+                    model: traceRow.modelData.buckets
+
+                    Rectangle {
+                        required property int modelData
+                        required property int index
+                        readonly property int fullest: Math.max.apply(null, traceRow.modelData.buckets)
+                        width: Kirigami.Units.smallSpacing * 2
+                        height: fullest > 0 ? Math.max(1, parent.height * modelData / fullest) : 0
+                        anchors.bottom: parent.bottom
+                        color: index < traceStats.bucketEdges.length && traceStats.bucketEdges[index] <= traceStatsPanel.slowMs
+                               ? Kirigami.Theme.highlightColor : Kirigami.Theme.negativeTextColor
+
+                        Controls.ToolTip.visible: bucketArea.containsMouse
+                        Controls.ToolTip.text: index < traceStats.bucketEdges.length
+                                               ? qsTr("%1 calls under %2 ms").arg(modelData).arg(traceStats.bucketEdges[index])
+                                               : qsTr("%1 calls over %2 ms").arg(modelData).arg(traceStats.bucketEdges[index - 1])
+
+                        MouseArea {
+                            id: bucketArea
+                            anchors.fill: parent
+                            hoverEnabled: true
+                        }
+                    }
+                }
+            }
+
+            Controls.Label {
+                Layout.rightMargin: Kirigami.Units.largeSpacing
+                opacity: 0.7
+                text: qsTr("cpu %1 ms, %2 B").arg(traceStatsPanel.formatMs(modelData.cpuMs)).arg(modelData.bytes)
+            }
+        }
+    }
+}
@@ -19,9 +19,11 @@ Kirigami.Page {
             spacing: Kirigami.Units.largeSpacing
 
             Image {
-                source: "../../../assets/logo-150x150.png"  
+                source: "image://assets/logo-150x150.png"  
                 Layout.preferredWidth: Kirigami.Units.gridUnit * 5
                 Layout.preferredHeight: Kirigami.Units.gridUnit * 5
+                sourceSize.width: Kirigami.Units.gridUnit * 5
+                sourceSize.height: Kirigami.Units.gridUnit * 5
             }
 
             ColumnLayout {  
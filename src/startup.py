@@ -0,0 +1,94 @@
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterable, List, Optional, Tuple
+from PySide6.QtCore import QObject, Signal, Slot
+
+class StartupProfiler:
+    """Collects named startup timings, in milliseconds since `start`.
+
+    When disabled, `measure` and `mark` do nothing beyond running the wrapped code.
+    """
+
+    def __init__(self, enabled: bool = False, start: Optional[float] = None):
+        self.enabled = enabled
+        self.start = start if start is not None else time.perf_counter()
+        self._entries: List[Tuple[str, float, float, str]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, label: str):
+        if not self.enabled:
+            yield
+            return
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(label, began, time.perf_counter())
+
+    def mark(self, label: str) -> None:
+        if self.enabled:
+            now = time.perf_counter()
+            self.record(label, now, now)
+
+    def record(self, label: str, began: float, ended: float) -> None:
+        """Adds a step that ran between two perf_counter() readings."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries.append((label, began - self.start, ended - began, threading.current_thread().name))
+
+    def report(self, file=None) -> None:
+        if not self.enabled:
+            return
+        file = file or sys.stderr
+        with self._lock:
+            entries = sorted(self._entries, key=lambda entry: entry[1])
+        print("Startup profile (ms since launch):", file=file)
+        print(f"  {'at':>8}  {'took':>8}  {'thread':<12}  step", file=file)
+        for label, began, took, thread in entries:
+            print(f"  {began * 1000:8.1f}  {took * 1000:8.1f}  {thread[:12]:<12}  {label}", file=file)
+
+class StartupWarmup(QObject):
+    """Runs slow backend initialisation on a background thread once the UI is up.
+
+    Connect `first_frame` to the window's frameSwapped. `finished` follows once the first
+    frame is up and every task has run; it is emitted from the worker thread, so receivers
+    on the GUI thread get it queued. Calling `run` before the UI loads does the work
+    eagerly instead.
+    """
+    finished = Signal()
+
+    def __init__(self, tasks: Iterable[Tuple[str, Callable[[], object]]], profiler: StartupProfiler):
+        super().__init__()
+        self._tasks = list(tasks)
+        self._profiler = profiler
+        self._ran = False
+        self._first_frame_seen = False
+
+    @Slot()
+    def first_frame(self) -> None:
+        if self._first_frame_seen:
+            return
+        self._first_frame_seen = True
+        self._profiler.mark("first frame")
+        if self._ran:
+            self.finished.emit()
+        else:
+            threading.Thread(target=self._run_and_notify, name="StartupWarmup", daemon=True).start()
+
+    def _run_and_notify(self) -> None:
+        self.run()
+        self.finished.emit()
+
+    def run(self) -> None:
+        self._ran = True
+        for label, task in self._tasks:
+            try:
+                with self._profiler.measure(label):
+                    task()
+            except Exception as e:
+                logging.warning(f"Startup warm-up '{label}' failed, it will be retried on first use: {e}")
@@ -0,0 +1,272 @@
+"""Opt-in latency tracing of the app's slots and file access.
+
+Set WIN2LINUX_TRACE before starting the app to record every traced call:
+
+    WIN2LINUX_TRACE=1 python main.py                  # writes win2linux_trace.json on exit
+    WIN2LINUX_TRACE=/tmp/wizard.json python main.py   # ...to this file instead
+
+Each span records wall time, the CPU time of its thread and the bytes it read or wrote,
+including those of nested spans. Spans are exported as Chrome trace events (open the file
+in ui.perfetto.dev or chrome://tracing) and summarised in a rolling histogram per span
+name, which backend.profiling.trace_stats.TraceStats exposes to QML.
+
+Whether tracing is on is decided once, at import: when it is off `traced` hands back the
+undecorated function and `open_file` is the builtin open, so instrumented code runs
+exactly as it would without them. Qt-free, so worker processes can import it.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+TRACE_ENV = "WIN2LINUX_TRACE"
+DEFAULT_TRACE_PATH = "win2linux_trace.json"
+HISTOGRAM_WINDOW = 256
+# Upper edges of the histogram buckets in milliseconds; the last bucket is open-ended.
+BUCKET_EDGES_MS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+MAX_EVENTS = 100_000
+
+class RollingHistogram:
+    """The last `window` durations of one span name."""
+
+    def __init__(self, window: int = HISTOGRAM_WINDOW):
+        self.count = 0
+        self._wall = deque(maxlen=window)
+        self._cpu = deque(maxlen=window)
+        self._bytes = deque(maxlen=window)
+
+    def add(self, wall: float, cpu: float, num_bytes: int) -> None:
+        self.count += 1
+        self._wall.append(wall)
+        self._cpu.append(cpu)
+        self._bytes.append(num_bytes)
+
+    def summary(self) -> Dict[str, Any]:
+        """Statistics over the window, times in milliseconds."""
+        wall = sorted(self._wall)
+        if not wall:
+            return {"count": self.count, "window": 0}
+        buckets = [0] * (len(BUCKET_EDGES_MS) + 1)
+        for seconds in wall:
+            milliseconds = seconds * 1000
+            buckets[next((i for i, edge in enumerate(BUCKET_EDGES_MS) if milliseconds < edge), -1)] += 1
+        return {
+            "count": self.count,
+            "window": len(wall),
+            "mean_ms": sum(wall) / len(wall) * 1000,
+            "p50_ms": wall[len(wall) // 2] * 1000,
+            "p95_ms": wall[min(len(wall) - 1, int(len(wall) * 0.95))] * 1000,
+            "max_ms": wall[-1] * 1000,
+            "cpu_ms": sum(self._cpu) / len(self._cpu) * 1000,
+            "bytes": sum(self._bytes) // len(self._bytes),
+            "buckets": buckets,
+        }
+
+class _Span:
+    __slots__ = ("name", "category", "wall_start", "cpu_start", "bytes_read", "bytes_written")
+
+    def __init__(self, name: str, category: str):
+        self.name = name
+        self.category = category
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+
+class Tracer:
+    """Collects spans from every thread into trace events and per-name histograms."""
+
+    def __init__(self, enabled: bool = False, output_path: Optional[str] = None):
+        self.enabled = enabled
+        self.output_path = output_path
+        self.version = 0
+        self._events: List[Dict[str, Any]] = []
+        self._histograms: Dict[str, RollingHistogram] = {}
+        self._categories: Dict[str, str] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextmanager
+    def span(self, name: str, category: str = "slot"):
+        if not self.enabled:
+            yield
+            return
+        stack = self._stack()
+        span = _Span(name, category)
+        stack.append(span)
+        try:
+            yield span
+        finally:
+            # Files may be closed out of order, so don't assume the span is innermost.
+            if stack and stack[-1] is span:
+                stack.pop()
+            elif span in stack:
+                stack.remove(span)
+            if stack:
+                stack[-1].bytes_read += span.bytes_read
+                stack[-1].bytes_written += span.bytes_written
+            self._record(span, time.perf_counter(), time.thread_time())
+
+    def add_bytes(self, read: int = 0, written: int = 0) -> None:
+        """Counts I/O towards the innermost open span of the calling thread."""
+        stack = self._stack() if self.enabled else None
+        if stack:
+            stack[-1].bytes_read += read
+            stack[-1].bytes_written += written
+
+    def _record(self, span: _Span, wall_end: float, cpu_end: float) -> None:
+        wall, cpu = wall_end - span.wall_start, cpu_end - span.cpu_start
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": span.wall_start * 1e6,
+            "dur": wall * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": {"cpu_ms": cpu * 1000, "bytes_read": span.bytes_read, "bytes_written": span.bytes_written},
+        }
+        with self._lock:
+            if len(self._events) < MAX_EVENTS:
+                self._events.append(event)
+            histogram = self._histograms.get(span.name)
+            if histogram is None:
+                histogram = self._histograms[span.name] = RollingHistogram()
+                self._categories[span.name] = span.category
+            histogram.add(wall, cpu, span.bytes_read + span.bytes_written)
+            self._thread_names.setdefault(event["tid"], threading.current_thread().name)
+            self.version += 1
+
+    def summaries(self) -> List[Dict[str, Any]]:
+        """One summary per span name, slowest total first."""
+        with self._lock:
+            rows = [dict(histogram.summary(), name=name, category=self._categories[name])
+                    for name, histogram in self._histograms.items()]
+        return sorted(rows, key=lambda row: row.get("mean_ms", 0) * row["window"], reverse=True)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                    for tid, name in thread_names.items()]
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: Optional[str] = None) -> Optional[str]:
+        """Writes the trace events recorded so far; returns the path, or None when disabled."""
+        path = path or self.output_path
+        if not self.enabled or not path:
+            return None
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._events.clear()
+            self._histograms.clear()
+            self._categories.clear()
+            self._thread_names.clear()
+            self.version += 1
+
+def _tracer_from_environment() -> Tracer:
+    setting = os.environ.get(TRACE_ENV, "")
+    if setting.lower() in ("", "0", "false", "no", "off"):
+        return Tracer(False)
+    return Tracer(True, DEFAULT_TRACE_PATH if setting.lower() in ("1", "true", "yes", "on") else setting)
+
+tracer = _tracer_from_environment()
+
+def traced(name: Optional[str] = None, category: str = "slot") -> Callable[[Callable], Callable]:
+    """Records each call of the decorated function as a span; a no-op unless tracing is on.
+
+    Put it below @Slot so the slot is registered on the traced function.
+    """
+    def decorate(function: Callable) -> Callable:
+        if not tracer.enabled:
+            return function
+        label = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with tracer.span(label, category):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class _TracedFile:
+    """A file object that times itself from open to close and counts what passes through it."""
+
+    def __init__(self, file, path, mode: str):
+        self._file = file
+        self._span_context = tracer.span(f"{'read' if 'r' in mode else 'write'} {os.path.basename(str(path))}", "io")
+        self._span = self._span_context.__enter__()
+        self._closed = False
+
+    def _count(self, data, read: bool):
+        size = len(data.encode("utf-8")) if isinstance(data, str) else len(data)
+        if read:
+            self._span.bytes_read += size
+        else:
+            self._span.bytes_written += size
+        return data
+
+    def read(self, *args):
+        return self._count(self._file.read(*args), True)
+
+    def readline(self, *args):
+        return self._count(self._file.readline(*args), True)
+
+    def readinto(self, buffer):
+        size = self._file.readinto(buffer)
+        self._span.bytes_read += size or 0
+        return size
+
+    def readlines(self, *args):
+        return [self._count(line, True) for line in self._file.readlines(*args)]
+
+    def __iter__(self):
+        for line in self._file:
+            yield self._count(line, True)
+
+    def write(self, data):
+        self._count(data, False)
+        return self._file.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def close(self) -> None:
+        try:
+            self._file.close()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._span_context.__exit__(None, None, None)
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _open_traced(path, mode: str = "r", *args, **kwargs):
+    return _TracedFile(open(path, mode, *args, **kwargs), path, mode)
+
+# Drop-in for open(); only wraps the file when tracing is on.
+open_file = _open_traced if tracer.enabled else open
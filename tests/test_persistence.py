@@ -0,0 +1,80 @@
+"""Debounced saving of questionnaire responses (backend/questionnaire/persistence.py)."""
+import json
+import os
+import shutil
+import pytest
+from PySide6.QtCore import QCoreApplication
+from backend.questionnaire.persistence import ResponseWriter
+from backend.questionnaire.questionnaire import QuestionnaireModel
+from conftest import SRC_DIR
+
+@pytest.fixture
+def questionnaire_dir(tmp_path, monkeypatch):
+    """A working directory holding a copy of questionnaire.json, as the app's resource_path expects."""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    directory = tmp_path / "backend" / "questionnaire"
+    directory.mkdir(parents=True)
+    shutil.copy(os.path.join(SRC_DIR, "backend", "questionnaire", "questionnaire.json"), directory)
+    monkeypatch.chdir(tmp_path)
+    yield directory
+    del app
+
+def count_writes(monkeypatch):
+    calls = []
+    write = ResponseWriter._write
+
+    def counting_write(self, responses):
+        calls.append(dict(responses))
+        write(self, responses)
+
+    monkeypatch.setattr(ResponseWriter, "_write", counting_write)
+    return calls
+
+def test_burst_of_answers_is_written_once(questionnaire_dir, monkeypatch):
+    writes = count_writes(monkeypatch)
+    model = QuestionnaireModel(save_debounce=0.2)
+    clicks = [(index, option_id) for index, question in enumerate(model.questions)
+              for option_id in question["options"]] * 10
+    assert len(clicks) > 1
+
+    for index, option_id in clicks:
+        model.setResponse(index, option_id)
+    model.flush_responses()
+    model._writer.close()
+
+    assert len(writes) == 1
+    with open(questionnaire_dir / "responses.json") as file:
+        assert json.load(file) == writes[0] == model.responses
+
+def test_failed_write_does_not_stop_the_writer(tmp_path):
+    writer = ResponseWriter(str(tmp_path / "responses.json"), debounce=0)
+    writer.schedule({"2": object()})
+    writer.flush()
+    assert writer.write_count == 0
+    assert list(tmp_path.iterdir()) == []
+
+    writer.schedule({"2": "1"})
+    writer.close()
+    assert writer.write_count == 1
+    with open(tmp_path / "responses.json") as file:
+        assert json.load(file) == {"2": "1"}
+
+def test_rewrite_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "responses.json"
+    path.write_text("{}")
+    os.chmod(path, 0o640)
+    writer = ResponseWriter(str(path), debounce=0)
+    writer.schedule({"2": "1"})
+    writer.close()
+    assert writer.write_count == 1
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+def test_new_file_gets_the_default_mode(tmp_path):
+    umask = os.umask(0o022)
+    try:
+        writer = ResponseWriter(str(tmp_path / "responses.json"), debounce=0)
+    finally:
+        os.umask(umask)
+    writer.schedule({"2": "1"})
+    writer.close()
+    assert os.stat(tmp_path / "responses.json").st_mode & 0o777 == 0o644
@@ -0,0 +1,44 @@
+"""Record validation in the headless recommendation pipeline (backend/recomendationModel/pipeline.py)."""
+import json
+import pytest
+from backend.recomendationModel.pipeline import score_lines
+from backend.recomendationModel.scoring_model import load_scoring_model
+
+RESPONSES = {"2": "1", "3": "2", "4": "1", "5": "3", "6": "1"}
+
+@pytest.fixture(scope="module")
+def model():
+    return load_scoring_model()
+
+def score(model, *records):
+    lines = [(line_number, record if isinstance(record, str) else json.dumps(record))
+             for line_number, record in enumerate(records, start=1)]
+    return [json.loads(line) for line in score_lines(lines, k=3, model=model)]
+
+def test_integer_option_ids_score_like_strings(model):
+    numeric = {question_id: int(option_id) for question_id, option_id in RESPONSES.items()}
+    as_strings, as_integers = score(model, {"responses": RESPONSES}, {"responses": numeric})
+    assert as_integers["rankings"] == as_strings["rankings"]
+    assert as_strings["rankings"][0]["score"] > 0
+
+@pytest.mark.parametrize("option_id", [1.0, True, ["1"]])
+def test_other_option_ids_are_rejected(model, option_id):
+    rejected, scored = score(model, {"responses": {**RESPONSES, "2": option_id}}, {"responses": RESPONSES})
+    assert rejected == {"id": 1, "error": '"responses" must be an object of string or integer option ids'}
+    assert scored["rankings"]
+
+def test_non_finite_hardware_is_rejected(model):
+    output = score_lines([(1, '{"responses": {"2": "1"}, "hardware_vector": [NaN, 1, 0, 1, 1]}')], model=model)
+    assert json.loads(output[0], parse_constant=pytest.fail)["error"] == '"hardware_vector" must be a list of finite numbers'
+
+def test_hardware_vector_length_is_checked(model):
+    size = model.hardware_matrix.shape[1]
+    short, long, exact = score(
+        model,
+        {"responses": RESPONSES, "hardware_vector": [1] * (size - 1)},
+        {"responses": RESPONSES, "hardware_vector": [1] * (size + 1)},
+        {"responses": RESPONSES, "hardware_vector": [1] * size},
+    )
+    assert short["error"] == f'"hardware_vector" must have {size} values, got {size - 1}'
+    assert long["error"] == f'"hardware_vector" must have {size} values, got {size + 1}'
+    assert exact["rankings"]